@@ -0,0 +1,99 @@
+"""
+Per-ID timings of the base62 codec against the original per-digit implementation.
+
+    python -m benchmarks.bench_base62
+"""
+
+import timeit
+import uuid
+
+from uuidbase62 import base62
+
+NUMBER = 200_000
+BATCH_SIZE = 100_000
+
+
+def legacy_encode(value: uuid.UUID) -> str:
+    from uuidbase62.types import UUIDBase62
+
+    if isinstance(value, UUIDBase62):
+        return value.base62_str
+    elif not isinstance(value, uuid.UUID):
+        raise ValueError("Base62 encoding requires a UUID value")
+
+    num = value.int
+    if num == 0:
+        return base62.BASE62[0]
+    arr = []
+    while num:
+        num, rem = divmod(num, base62.BASE62_LENGTH)
+        arr.append(base62.BASE62[rem])
+    arr.reverse()
+    return "".join(arr)
+
+
+def legacy_decode(value: str) -> uuid.UUID:
+    from uuidbase62.types import UUIDBase62
+
+    if isinstance(value, UUIDBase62):
+        return value.uuid
+    elif isinstance(value, uuid.UUID):
+        return value
+
+    strlen = len(value)
+    num = 0
+    for idx, char in enumerate(value):
+        power = strlen - (idx + 1)
+        num += base62.BASE62.index(char) * (base62.BASE62_LENGTH**power)
+    return uuid.UUID(int=num)
+
+
+def per_id_usec(func, value) -> float:
+    return min(timeit.repeat(lambda: func(value), number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def batch_per_id_usec(func, values) -> float:
+    return min(timeit.repeat(lambda: func(values), number=1, repeat=5)) / len(values) * 1e6
+
+
+def main() -> None:
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+    encoded = base62.encode(uuid_)
+
+    rows = [
+        ("encode", per_id_usec(legacy_encode, uuid_), per_id_usec(base62.encode, uuid_)),
+        ("decode", per_id_usec(legacy_decode, encoded), per_id_usec(base62.decode, encoded)),
+    ]
+    print(
+        f"codec: {'compiled' if base62.HAS_SPEEDUPS else 'python'} (set UUIDBASE62_NO_EXTENSIONS=1 to compare)"
+    )
+    print(f"{'operation':<10}{'legacy (us)':>14}{'current (us)':>14}{'speedup':>10}")
+    for name, legacy, current in rows:
+        print(f"{name:<10}{legacy:>14.3f}{current:>14.3f}{legacy / current:>9.2f}x")
+
+    uuids = [uuid.uuid4() for _ in range(BATCH_SIZE)]
+    strs = base62.encode_many(uuids)
+    if base62.HAS_SPEEDUPS:
+        backend = "compiled"
+    else:
+        backend = "numpy" if base62._get_numpy() is not None else "python"
+    batch_rows = [
+        (
+            "encode",
+            batch_per_id_usec(lambda values: [base62.encode(v) for v in values], uuids),
+            batch_per_id_usec(base62.encode_many, uuids),
+        ),
+        (
+            "decode",
+            batch_per_id_usec(lambda values: [base62.decode(v) for v in values], strs),
+            batch_per_id_usec(base62.decode_many, strs),
+        ),
+    ]
+    print(f"\nbatches of {BATCH_SIZE} ({backend} backend)")
+    print(f"{'operation':<10}{'per-call (us)':>14}{'batch (us)':>14}{'speedup':>10}")
+    for name, single, batch in batch_rows:
+        print(f"{name:<10}{single:>14.3f}{batch:>14.3f}{single / batch:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
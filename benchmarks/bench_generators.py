@@ -0,0 +1,53 @@
+"""
+Throughput of new ID generation: `to_uuidbase62(uuid.uuid4())` per ID, against `generate_uuidbase62` and
+`UUIDBase62Generator` (per call and in batches), single threaded and shared between threads.
+
+    python -m benchmarks.bench_generators
+"""
+
+import timeit
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from uuidbase62.generators import UUIDBase62Generator, generate_uuidbase62
+from uuidbase62.types import to_uuidbase62
+
+COUNT = 100_000
+BATCH = 1_000
+PREFIX = "book"
+THREADS = 4
+
+
+def main() -> None:
+    generate_v4 = UUIDBase62Generator(PREFIX, version=4)
+    generate_v7 = UUIDBase62Generator(PREFIX, version=7)
+    candidates = [
+        ("to_uuidbase62(uuid4())", lambda: [to_uuidbase62(uuid.uuid4(), PREFIX) for _ in range(COUNT)]),
+        ("generate_uuidbase62", lambda: [generate_uuidbase62(PREFIX) for _ in range(COUNT)]),
+        ("generator v4 call", lambda: [generate_v4() for _ in range(COUNT)]),
+        ("generator v7 call", lambda: [generate_v7() for _ in range(COUNT)]),
+        ("generator v4 batch", lambda: [generate_v4.generate_many(BATCH) for _ in range(COUNT // BATCH)]),
+        ("generator v7 batch", lambda: [generate_v7.generate_many(BATCH) for _ in range(COUNT // BATCH)]),
+    ]
+
+    print(f"{'generation':<26}{'IDs per second':>16}")
+    for name, func in candidates:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:<26}{COUNT / seconds:>16,.0f}")
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+
+        def threaded() -> None:
+            per_thread = COUNT // THREADS // BATCH
+            list(
+                executor.map(
+                    lambda _: [generate_v7.generate_many(BATCH) for _ in range(per_thread)], range(THREADS)
+                )
+            )
+
+        seconds = min(timeit.repeat(threaded, number=1, repeat=5))
+        print(f"{f'v7 batch, {THREADS} threads':<26}{COUNT / seconds:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Bytes per UUIDBase62 instance, against the original `__dict__` based representation.
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+import uuid
+
+from uuidbase62 import base62
+from uuidbase62.types import to_uuidbase62
+
+COUNT = 100_000
+PREFIX = "book"
+
+
+class LegacyUUIDBase62(str):
+    def __new__(cls, value="", prefix="", base62_str="", uuid_=None):
+        return super().__new__(cls, value)
+
+    def __init__(self, value="", prefix="", base62_str="", uuid_=None):
+        self.prefix = prefix
+        self.base62_str = base62_str
+        self.uuid = uuid_
+        self.value = value
+
+
+def legacy_to_uuidbase62(value: uuid.UUID, prefix: str) -> LegacyUUIDBase62:
+    base62_str = base62.encode(value)
+    return LegacyUUIDBase62(value=f"{prefix}_{base62_str}", prefix=prefix, base62_str=base62_str, uuid_=value)
+
+
+def bytes_per_instance(factory, uuids) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(uuid_, PREFIX) for uuid_ in uuids]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # exclude the list holding the instances
+    return (after - before - len(instances) * 8) / len(instances)
+
+
+def main() -> None:
+    # the source UUIDs are allocated up front, so only memory retained by each instance is measured; the legacy
+    # representation keeps a reference to its UUID, which would otherwise be garbage
+    uuids = [uuid.uuid4() for _ in range(COUNT)]
+    legacy = bytes_per_instance(legacy_to_uuidbase62, uuids)
+    current = bytes_per_instance(to_uuidbase62, uuids)
+
+    print(f"{'representation':<16}{'bytes/instance':>16}")
+    print(f"{'legacy':<16}{legacy:>16.1f}")
+    print(f"{'current':<16}{current:>16.1f}")
+    print(f"{'saving':<16}{legacy - current:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Per-request latency of rejected and accepted requests, validating a prefixed path ID with the
+`get_validated_uuidbase62` dependency alone, or with `UUIDBase62PathMiddleware` in front of it. Requests are sent to
+the ASGI application directly, without a client or server.
+
+    python -m benchmarks.bench_middleware
+"""
+
+import asyncio
+import time
+
+from fastapi import Depends, FastAPI
+
+from uuidbase62 import UUIDBase62, get_validated_uuidbase62
+from uuidbase62.middleware import UUIDBase62PathMiddleware
+
+NUMBER = 5_000
+VALID_PATH = "/books/book_7yNMTpVy8ddRxYKGJqtk7e"
+INVALID_PATH = "/books/author_7yNMTpVy8ddRxYKGJqtk7e"
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+
+    book_id_dependency = Depends(get_validated_uuidbase62("book_id", "book"))
+
+    @app.get("/books/{book_id}")
+    async def get_book(book_id: UUIDBase62 = book_id_dependency):
+        return {"id": book_id}
+
+    if with_middleware:
+        app.add_middleware(UUIDBase62PathMiddleware, routes={"/books/{book_id}": {"book_id": "book"}})
+    return app
+
+
+async def request(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def per_request_usec(app: FastAPI, path: str) -> float:
+    await request(app, path)
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        await request(app, path)
+    return (time.perf_counter() - start) / NUMBER * 1e6
+
+
+async def main() -> None:
+    plain = build_app(with_middleware=False)
+    guarded = build_app(with_middleware=True)
+    assert await request(plain, INVALID_PATH) == await request(guarded, INVALID_PATH) == 404
+
+    print(f"{'request':<12}{'dependency (us)':>18}{'middleware (us)':>18}")
+    for name, path in [("rejected", INVALID_PATH), ("accepted", VALID_PATH)]:
+        dependency = await per_request_usec(plain, path)
+        middleware = await per_request_usec(guarded, path)
+        print(f"{name:<12}{dependency:>18.1f}{middleware:>18.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
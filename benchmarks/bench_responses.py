@@ -0,0 +1,76 @@
+"""
+Latency of a large list endpoint with `con_uuidbase62` fields, per response rendering approach.
+
+    python -m benchmarks.bench_responses
+"""
+
+import time
+import typing
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from uuidbase62 import UUIDBase62JSONResponse, con_uuidbase62, responses
+
+ITEMS = 10_000
+REPEAT = 5
+
+
+BookId = con_uuidbase62(prefix="book")
+AuthorId = con_uuidbase62(prefix="author")
+
+
+class Book(BaseModel):
+    id: BookId  # type: ignore
+    author_id: AuthorId  # type: ignore
+    title: str
+
+
+ROWS = [{"id": uuid.uuid4(), "author_id": uuid.uuid4(), "title": "Red Mars"} for _ in range(ITEMS)]
+
+app = FastAPI()
+
+
+@app.get("/default", response_model=typing.List[Book])
+def default_list():
+    return ROWS
+
+
+@app.get("/response-class", response_model=typing.List[Book], response_class=UUIDBase62JSONResponse)
+def response_class_list():
+    return ROWS
+
+
+@app.get("/direct")
+def direct_list():
+    return UUIDBase62JSONResponse([Book(**row) for row in ROWS])
+
+
+def per_request_msec(client: TestClient, path: str) -> float:
+    client.get(path)
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        client.get(path)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    client = TestClient(app)
+    encoder = "orjson" if responses.orjson is not None else "json"
+
+    print(f"{ITEMS} items per response, UUIDBase62JSONResponse rendering with {encoder}")
+    print(f"{'endpoint':<28}{'per request (ms)':>18}")
+    for name, path in [
+        ("response_model (default)", "/default"),
+        ("response_class", "/response-class"),
+        ("UUIDBase62JSONResponse", "/direct"),
+    ]:
+        print(f"{name:<28}{per_request_msec(client, path):>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
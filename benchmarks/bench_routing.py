@@ -0,0 +1,45 @@
+"""
+Per-ID lookup timings of `PrefixRouter` with thousands of registered prefixes, against a chain of `str.startswith`
+checks.
+
+    python -m benchmarks.bench_routing
+"""
+
+import timeit
+import uuid
+
+from uuidbase62 import base62
+from uuidbase62.routing import PrefixRouter
+
+PREFIXES = 5_000
+IDS = 10_000
+
+
+def startswith_lookup(chain, value):
+    for head, target in chain:
+        if value.startswith(head):
+            return target
+    return None
+
+
+def main() -> None:
+    prefixes = [f"service{index}_object" for index in range(PREFIXES)]
+    router = PrefixRouter({prefix: index for index, prefix in enumerate(prefixes)})
+    chain = [(f"{prefix}_", index) for index, prefix in enumerate(prefixes)]
+    ids = [f"{prefixes[index * 7919 % PREFIXES]}_{base62.encode(uuid.uuid4())}" for index in range(IDS)]
+    assert [startswith_lookup(chain, value) for value in ids[:100]] == router.lookup_many(ids[:100])
+
+    def per_id_usec(func, number) -> float:
+        return min(timeit.repeat(func, number=number, repeat=3)) / number / len(ids) * 1e6
+
+    print(f"{PREFIXES} registered prefixes")
+    print(f"{'lookup':<26}{'per id (us)':>14}")
+    print(
+        f"{'startswith chain':<26}{per_id_usec(lambda: [startswith_lookup(chain, v) for v in ids], 1):>14.3f}"
+    )
+    print(f"{'PrefixRouter.lookup':<26}{per_id_usec(lambda: [router.lookup(v) for v in ids], 10):>14.3f}")
+    print(f"{'PrefixRouter.lookup_many':<26}{per_id_usec(lambda: router.lookup_many(ids), 10):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-call timings of `to_uuidbase62` for each supported input shape.
+
+    python -m benchmarks.bench_types
+"""
+
+import timeit
+import uuid
+
+from uuidbase62.types import to_uuidbase62
+
+NUMBER = 100_000
+PREFIX = "book"
+
+
+def main() -> None:
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+    inputs = [
+        ("uuid", uuid_),
+        ("canonical str", str(uuid_)),
+        ("hex str", uuid_.hex),
+        ("prefixed", str(to_uuidbase62(uuid_, PREFIX))),
+        ("bytes", uuid_.bytes),
+        ("tagged bytes", to_uuidbase62(uuid_, PREFIX).to_bytes(tagged=True)),
+        ("wrong prefix", f"other_{to_uuidbase62(uuid_).base62_str}"),
+    ]
+
+    print(f"{'input':<16}{'per call (us)':>16}")
+    for name, value in inputs:
+
+        def call(value=value):
+            try:
+                to_uuidbase62(value, PREFIX)
+            except ValueError:
+                pass
+
+        usec = min(timeit.repeat(call, number=NUMBER, repeat=5)) / NUMBER * 1e6
+        print(f"{name:<16}{usec:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
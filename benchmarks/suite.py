@@ -0,0 +1,165 @@
+"""
+Benchmark suite covering the codec, validation, dependency and response serialization hot paths. Each case reports its
+best per-call time; results can be saved as a baseline, and later runs compared against it, flagging (and failing on)
+cases slower than the baseline by more than the threshold.
+
+    python -m benchmarks.suite --save           # eg. on the main branch
+    python -m benchmarks.suite --threshold 0.1  # on a branch: exits with status 1 on regressions
+    python -m benchmarks.suite --filter codec   # only cases whose name contains "codec"
+
+Baselines are machine specific, and are stored in `benchmarks/baseline.json` (not committed) unless `--baseline`
+says otherwise.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import typing
+import uuid
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from uuidbase62 import UUIDBase62, UUIDBase62JSONResponse, base62, con_uuidbase62, get_validated_uuidbase62
+from uuidbase62.types import to_uuidbase62
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+PREFIXED = "book_7yNMTpVy8ddRxYKGJqtk7e"
+BATCH = [uuid.UUID(int=(index * 0x9E3779B97F4A7C15F39CC0605CEDC834) % 2**128) for index in range(1, 1001)]
+
+BookId = con_uuidbase62(prefix="book")
+AuthorId = con_uuidbase62(prefix="author")
+
+
+class Book(BaseModel):
+    id: BookId  # type: ignore
+    author_ids: typing.List[AuthorId]  # type: ignore
+
+
+class Case(typing.NamedTuple):
+    name: str
+    func: typing.Callable[[], typing.Any]
+    # number of calls per timing, and number of operations per call (eg. for batches)
+    number: int
+    ops: int = 1
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    book_id_dependency = Depends(get_validated_uuidbase62("book_id", "book"))
+
+    @app.get("/books/{book_id}", response_class=UUIDBase62JSONResponse)
+    async def get_book(book_id: UUIDBase62 = book_id_dependency):
+        return {"id": book_id}
+
+    return app
+
+
+def build_cases() -> typing.List[Case]:
+    encoded = base62.encode(UUID_)
+    encoded_batch = base62.encode_many(BATCH)
+    author_ids = [to_uuidbase62(uuid_, "author") for uuid_ in BATCH[:10]]
+    books = [Book(id=uuid_, author_ids=author_ids) for uuid_ in BATCH[:100]]
+    response = UUIDBase62JSONResponse(content=None)
+    client = TestClient(build_app())
+
+    return [
+        Case("codec.encode", lambda: base62.encode(UUID_), 100_000),
+        Case("codec.decode", lambda: base62.decode(encoded), 100_000),
+        Case("codec.encode_many", lambda: base62.encode_many(BATCH), 100, len(BATCH)),
+        Case("codec.decode_many", lambda: base62.decode_many(encoded_batch), 100, len(BATCH)),
+        Case("to_uuidbase62.uuid", lambda: to_uuidbase62(UUID_, "book"), 100_000),
+        Case("to_uuidbase62.canonical_str", lambda: to_uuidbase62(str(UUID_), "book"), 100_000),
+        Case("to_uuidbase62.hex_str", lambda: to_uuidbase62(UUID_.hex, "book"), 100_000),
+        Case("to_uuidbase62.prefixed", lambda: to_uuidbase62(PREFIXED, "book"), 100_000),
+        Case("validate.con_uuidbase62", lambda: BookId.validate(PREFIXED), 100_000),
+        Case("model.validate", lambda: Book(id=PREFIXED, author_ids=author_ids), 10_000),
+        Case("response.render", lambda: response.render(books), 100, len(books)),
+        Case("request.valid_id", lambda: client.get(f"/books/{PREFIXED}"), 500),
+        Case("request.invalid_id", lambda: client.get("/books/author_7yNMTpVy8ddRxYKGJqtk7e"), 500),
+    ]
+
+
+def measure(case: Case, repeat: int) -> float:
+    """
+    :return: best time per operation, in microseconds
+    """
+    case.func()
+    return min(timeit.repeat(case.func, number=case.number, repeat=repeat)) / case.number / case.ops * 1e6
+
+
+def compare(
+    results: typing.Mapping[str, float], baseline: typing.Mapping[str, float], threshold: float
+) -> typing.List[str]:
+    """
+    :return: names of the cases slower than their baseline by more than `threshold` (a fraction, eg. 0.2 for 20%)
+    """
+    return [
+        name for name, usec in results.items() if name in baseline and usec > baseline[name] * (1 + threshold)
+    ]
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    description, examples, _ = __doc__.strip().split("\n\n")
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description=description,
+        epilog=examples,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="baseline file to compare against or save to"
+    )
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"slowdown flagged as a regression, as a fraction (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7, help="timings per case; the best one is kept")
+    args = parser.parse_args(argv)
+
+    baseline: typing.Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    print(f"{'case':<30}{'per op (us)':>14}{'baseline (us)':>16}{'change':>10}")
+    for case in build_cases():
+        if args.filter not in case.name:
+            continue
+        usec = results[case.name] = measure(case, args.repeat)
+        if case.name in baseline:
+            change = usec / baseline[case.name] - 1
+            flag = "  REGRESSION" if compare({case.name: usec}, baseline, args.threshold) else ""
+            print(f"{case.name:<30}{usec:>14.3f}{baseline[case.name]:>16.3f}{change:>+10.1%}{flag}")
+        else:
+            print(f"{case.name:<30}{usec:>14.3f}{'-':>16}{'-':>10}")
+
+    if args.save:
+        # cases that weren't run (eg. with --filter) keep their previous baseline
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
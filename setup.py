@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from setuptools import setup
+from setuptools import Extension, setup
 from pathlib import Path
 
 try:
@@ -26,6 +26,8 @@ setup(
         'Tracker': 'https://github.com/jaddison/fastapi-uuidbase62/issues',
     },
     packages=['uuidbase62'],
+    # optional compiled codec; the package falls back to pure Python when it can't be built
+    ext_modules=[Extension('uuidbase62._speedups', sources=['uuidbase62/_speedups.c'], optional=True)],
     keywords='stripe uuid base62 fastapi pydantic serialize',
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -42,5 +44,10 @@ setup(
         'Topic :: Internet :: WWW/HTTP :: HTTP Servers',
     ],
     python_requires='>=3.7, <4',
-    install_requires=['fastapi']
+    install_requires=['fastapi'],
+    extras_require={
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+        'sqlalchemy': ['sqlalchemy>=1.4'],
+    },
 )
@@ -1,8 +1,93 @@
-from .dependencies import (  # noqa: F401
-    ParamSource,
-    get_validated_uuidbase62,
-    get_validated_uuidbase62_by_model,
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .cache import cache_info, disable_cache, enable_cache  # noqa: F401
+    from .dependencies import (  # noqa: F401
+        ParamSource,
+        get_uuidbase62_loader,
+        get_validated_cursor,
+        get_validated_uuidbase62,
+        get_validated_uuidbase62_by_model,
+        get_validated_uuidbase62_list,
+    )
+    from .exceptions import Base62MissingPrefix  # noqa: F401
+    from .instrumentation import (  # noqa: F401
+        disable_instrumentation,
+        enable_instrumentation,
+    )
+    from .loaders import UUIDBase62Loader  # noqa: F401
+    from .models import UUIDBase62ModelMixin  # noqa: F401
+    from .pagination import Cursor, decode_cursor, encode_cursor  # noqa: F401
+    from .responses import UUIDBase62JSONResponse  # noqa: F401
+    from .types import UUIDBase62, UUIDBase62List, con_uuidbase62  # noqa: F401
+
+# public names, by the module defining them; modules are only imported when one of their names is first accessed, so
+# that eg. `uuidbase62.base62` and `uuidbase62.types` can be used without importing FastAPI or Pydantic
+_LAZY_NAMES = {
+    "cache_info": "cache",
+    "disable_cache": "cache",
+    "enable_cache": "cache",
+    "ParamSource": "dependencies",
+    "get_validated_cursor": "dependencies",
+    "get_validated_uuidbase62": "dependencies",
+    "get_validated_uuidbase62_by_model": "dependencies",
+    "get_validated_uuidbase62_list": "dependencies",
+    "get_uuidbase62_loader": "dependencies",
+    "Base62MissingPrefix": "exceptions",
+    "disable_instrumentation": "instrumentation",
+    "enable_instrumentation": "instrumentation",
+    "UUIDBase62Loader": "loaders",
+    "UUIDBase62ModelMixin": "models",
+    "Cursor": "pagination",
+    "decode_cursor": "pagination",
+    "encode_cursor": "pagination",
+    "UUIDBase62JSONResponse": "responses",
+    "UUIDBase62": "types",
+    "UUIDBase62List": "types",
+    "con_uuidbase62": "types",
+}
+
+# submodules, imported on first access too, so that eg. `import uuidbase62; uuidbase62.base62` works without an explicit
+# `import uuidbase62.base62`
+_SUBMODULES = frozenset(
+    {
+        "base62",
+        "cache",
+        "cli",
+        "compat",
+        "dependencies",
+        "exceptions",
+        "generators",
+        "instrumentation",
+        "loaders",
+        "middleware",
+        "models",
+        "pagination",
+        "responses",
+        "routing",
+        "sqlalchemy",
+        "streaming",
+        "types",
+    }
 )
-from .exceptions import Base62MissingPrefix  # noqa: F401
-from .models import UUIDBase62ModelMixin  # noqa: F401
-from .types import UUIDBase62, con_uuidbase62  # noqa: F401
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _SUBMODULES:
+        # importing a submodule sets it as an attribute of the package, so later accesses skip this function
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # cache the value, so later accesses skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
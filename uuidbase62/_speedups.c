@@ -0,0 +1,187 @@
+/*
+ * Optional compiled implementation of the fixed-width base62 codec primitives in `uuidbase62.base62`.
+ *
+ * Both functions mirror `base62._py_encode_int` and `base62._py_decode_int` exactly, including the ValueError
+ * messages. 128-bit values are held as four 32-bit limbs (most significant first) so the arithmetic stays within
+ * portable 64-bit integers.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#define BASE62_WIDTH 22
+#define CHUNK_BASE 916132832u /* 62 ** 5, fits in 30 bits */
+
+static const char BASE62[] = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ";
+static signed char DIGITS[256];
+
+static PyObject *
+split_int(PyObject *num, uint32_t limbs[4])
+{
+    PyObject *shift, *high;
+    unsigned long long high_value, low_value;
+
+    low_value = PyLong_AsUnsignedLongLongMask(num);
+    if (low_value == (unsigned long long)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    shift = PyLong_FromLong(64);
+    if (shift == NULL) {
+        return NULL;
+    }
+    high = PyNumber_Rshift(num, shift);
+    Py_DECREF(shift);
+    if (high == NULL) {
+        return NULL;
+    }
+    high_value = PyLong_AsUnsignedLongLong(high);
+    Py_DECREF(high);
+    if (high_value == (unsigned long long)-1 && PyErr_Occurred()) {
+        if (PyErr_ExceptionMatches(PyExc_OverflowError)) {
+            PyErr_Clear();
+            PyErr_SetString(PyExc_ValueError, "Base62 value is out of range");
+        }
+        return NULL;
+    }
+
+    limbs[0] = (uint32_t)(high_value >> 32);
+    limbs[1] = (uint32_t)high_value;
+    limbs[2] = (uint32_t)(low_value >> 32);
+    limbs[3] = (uint32_t)low_value;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+join_int(const uint32_t limbs[4])
+{
+    PyObject *high, *low, *shift, *shifted, *result;
+
+    high = PyLong_FromUnsignedLongLong(((unsigned long long)limbs[0] << 32) | limbs[1]);
+    if (high == NULL) {
+        return NULL;
+    }
+    shift = PyLong_FromLong(64);
+    if (shift == NULL) {
+        Py_DECREF(high);
+        return NULL;
+    }
+    shifted = PyNumber_Lshift(high, shift);
+    Py_DECREF(high);
+    Py_DECREF(shift);
+    if (shifted == NULL) {
+        return NULL;
+    }
+    low = PyLong_FromUnsignedLongLong(((unsigned long long)limbs[2] << 32) | limbs[3]);
+    if (low == NULL) {
+        Py_DECREF(shifted);
+        return NULL;
+    }
+    result = PyNumber_Or(shifted, low);
+    Py_DECREF(shifted);
+    Py_DECREF(low);
+    return result;
+}
+
+static PyObject *
+encode_int(PyObject *module, PyObject *num)
+{
+    uint32_t limbs[4];
+    char out[BASE62_WIDTH];
+    int position = BASE62_WIDTH;
+    int column, i;
+    PyObject *ok;
+
+    if (!PyLong_Check(num)) {
+        PyErr_SetString(PyExc_TypeError, "encode_int() requires an int");
+        return NULL;
+    }
+    ok = split_int(num, limbs);
+    if (ok == NULL) {
+        return NULL;
+    }
+    Py_DECREF(ok);
+
+    while (position > 0) {
+        /* divide by 62**5, the remainder holds the next 5 (least significant) digits */
+        uint64_t remainder = 0;
+        for (column = 0; column < 4; column++) {
+            uint64_t current = (remainder << 32) | limbs[column];
+            limbs[column] = (uint32_t)(current / CHUNK_BASE);
+            remainder = current % CHUNK_BASE;
+        }
+        for (i = 0; i < 5 && position > 0; i++) {
+            out[--position] = BASE62[remainder % 62];
+            remainder /= 62;
+        }
+    }
+
+    return PyUnicode_FromStringAndSize(out, BASE62_WIDTH);
+}
+
+static PyObject *
+decode_int(PyObject *module, PyObject *value)
+{
+    const char *data;
+    Py_ssize_t length, i;
+    uint32_t limbs[4] = {0, 0, 0, 0};
+    int column;
+
+    if (!PyUnicode_Check(value)) {
+        PyErr_SetString(PyExc_TypeError, "decode_int() requires a str");
+        return NULL;
+    }
+    if (PyUnicode_GET_LENGTH(value) > BASE62_WIDTH) {
+        PyErr_SetString(PyExc_ValueError, "Base62 value is too long");
+        return NULL;
+    }
+    data = PyUnicode_AsUTF8AndSize(value, &length);
+    if (data == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < length; i++) {
+        signed char digit = DIGITS[(unsigned char)data[i]];
+        uint64_t carry;
+        if (digit < 0) {
+            PyErr_SetString(PyExc_ValueError, "Base62 value contains invalid characters");
+            return NULL;
+        }
+        carry = (uint64_t)digit;
+        for (column = 3; column >= 0; column--) {
+            uint64_t current = (uint64_t)limbs[column] * 62 + carry;
+            limbs[column] = (uint32_t)current;
+            carry = current >> 32;
+        }
+        if (carry) {
+            PyErr_SetString(PyExc_ValueError, "Base62 value is out of range");
+            return NULL;
+        }
+    }
+
+    return join_int(limbs);
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"encode_int", (PyCFunction)encode_int, METH_O,
+     "Encode a 128-bit integer as a fixed-width, zero-padded, 22 character base62 string"},
+    {"decode_int", (PyCFunction)decode_int, METH_O,
+     "Decode a base62 string of up to 22 characters into a 128-bit integer"},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT, "uuidbase62._speedups", NULL, -1, speedups_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    int i;
+
+    memset(DIGITS, -1, sizeof(DIGITS));
+    for (i = 0; i < 62; i++) {
+        DIGITS[(unsigned char)BASE62[i]] = (signed char)i;
+    }
+    return PyModule_Create(&speedups_module);
+}
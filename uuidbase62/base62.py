@@ -1,55 +1,357 @@
 from __future__ import annotations
 
+import functools
+import os
 import typing
 import uuid
 
+from . import instrumentation
+
 BASE62 = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 BASE62_LENGTH = len(BASE62)
+# number of base62 digits required to represent any 128-bit value; 62**22 > 2**128
+BASE62_WIDTH = 22
+
+# char -> digit lookup, replacing a linear `BASE62.index()` scan per character
+_DIGITS = {char: index for index, char in enumerate(BASE62)}
+# every two-character digit pair, indexed by its value (0 - 3843)
+_PAIRS = tuple(high + low for high in BASE62 for low in BASE62)
+_PAIR_BASE = BASE62_LENGTH**2
+# 5 base62 digits fit in a single 30-bit CPython int digit, keeping the per-chunk arithmetic cheap
+_CHUNK_BASE = BASE62_LENGTH**5
+_HALF_WIDTH = BASE62_WIDTH // 2
+_HALF_BASE = BASE62_LENGTH**_HALF_WIDTH
+_MAX_INT = 1 << 128
+# the alphabet's digit order (0-9, a-z, A-Z) differs from ASCII order (0-9, A-Z, a-z); sort keys map each digit onto
+# a character in ASCII order instead
+_SORT_TABLE = str.maketrans(BASE62, "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+# batches smaller than this are converted per value; NumPy's per-call overhead outweighs its gains
+NUMPY_MIN_BATCH = 256
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from .types import UUIDBase62
 
+BytesLike = typing.Union[bytes, bytearray, memoryview]
 
-def encode(value: typing.Union[uuid.UUID, str, "UUIDBase62"]) -> str:
-    from .types import UUIDBase62
 
-    if isinstance(value, UUIDBase62):
-        return value.base62_str
-    elif isinstance(value, str):
-        try:
-            value = uuid.UUID(value)
-        except:
-            raise ValueError("Base62 encoding requires a UUID value")
-    elif not isinstance(value, uuid.UUID):
-        raise ValueError("Base62 encoding requires a UUID value")
+def _py_encode_int(num: int) -> str:
+    """
+    Encode a 128-bit integer as a fixed-width, zero-padded, 22 character base62 string
+    """
+    if not 0 <= num < _MAX_INT:
+        raise ValueError("Base62 value is out of range")
+
+    pairs = _PAIRS
+    # split into a 2 digit head and four 5 digit chunks, each small enough to be cheap to divide
+    head, num = divmod(num, _CHUNK_BASE**4)
+    chunk_1, num = divmod(num, _CHUNK_BASE**3)
+    chunk_2, num = divmod(num, _CHUNK_BASE**2)
+    chunk_3, chunk_4 = divmod(num, _CHUNK_BASE)
+
+    # each 5 digit chunk is emitted as a single digit followed by two digit pairs
+    mid_1, low_1 = divmod(chunk_1, _PAIR_BASE)
+    top_1, mid_1 = divmod(mid_1, _PAIR_BASE)
+    mid_2, low_2 = divmod(chunk_2, _PAIR_BASE)
+    top_2, mid_2 = divmod(mid_2, _PAIR_BASE)
+    mid_3, low_3 = divmod(chunk_3, _PAIR_BASE)
+    top_3, mid_3 = divmod(mid_3, _PAIR_BASE)
+    mid_4, low_4 = divmod(chunk_4, _PAIR_BASE)
+    top_4, mid_4 = divmod(mid_4, _PAIR_BASE)
+
+    return (
+        f"{pairs[head]}"
+        f"{BASE62[top_1]}{pairs[mid_1]}{pairs[low_1]}"
+        f"{BASE62[top_2]}{pairs[mid_2]}{pairs[low_2]}"
+        f"{BASE62[top_3]}{pairs[mid_3]}{pairs[low_3]}"
+        f"{BASE62[top_4]}{pairs[mid_4]}{pairs[low_4]}"
+    )
+
+
+def _py_decode_int(value: str) -> int:
+    """
+    Decode a base62 string of up to 22 characters into a 128-bit integer
+    """
+    if len(value) > BASE62_WIDTH:
+        raise ValueError("Base62 value is too long")
+
+    digits = _DIGITS
+    split = max(len(value) - _HALF_WIDTH, 0)
+    high = 0
+    low = 0
+    try:
+        # accumulate each half separately so intermediate values stay small
+        for char in value[:split]:
+            high = high * BASE62_LENGTH + digits[char]
+        for char in value[split:]:
+            low = low * BASE62_LENGTH + digits[char]
+    except KeyError:
+        raise ValueError("Base62 value contains invalid characters")
+
+    num = high * _HALF_BASE + low
+    if num >= _MAX_INT:
+        raise ValueError("Base62 value is out of range")
+    return num
+
+
+_encode_int = _py_encode_int
+_decode_int = _py_decode_int
+HAS_SPEEDUPS = False
 
-    num = value.int
-    if num == 0:
-        return BASE62[0]
+# use the optional compiled codec when it was built, unless explicitly disabled
+if not os.environ.get("UUIDBASE62_NO_EXTENSIONS"):
+    try:
+        import uuidbase62._speedups as _speedups  # type: ignore
 
-    arr = []
-    while num:
-        num, rem = divmod(num, BASE62_LENGTH)
-        arr.append(BASE62[rem])
+        _encode_int = _speedups.encode_int
+        _decode_int = _speedups.decode_int
+        HAS_SPEEDUPS = True
+    except ImportError:
+        pass
 
-    arr.reverse()
-    return "".join(arr)
+
+def _encode_compact(num: int) -> str:
+    # the encoding has never been zero-padded; keep the output identical to earlier releases
+    return _encode_int(num).lstrip(BASE62[0]) or BASE62[0]
+
+
+def encode(value: typing.Union[uuid.UUID, str, "UUIDBase62"], *, fixed_width: bool = False) -> str:
+    """
+    :param value: the UUID to encode
+    :param fixed_width: when True, the result is zero padded to `BASE62_WIDTH` characters
+    """
+    if instrumentation.active_sink is not None:
+        return instrumentation.observe("encode", None, _encode, value, fixed_width)
+    if type(value) is uuid.UUID:
+        return _encode_int(value.int) if fixed_width else _encode_compact(value.int)
+    return _encode(value, fixed_width)
+
+
+def _encode(value: typing.Union[uuid.UUID, str, "UUIDBase62"], fixed_width: bool) -> str:
+    if not isinstance(value, uuid.UUID):
+        from .types import UUIDBase62
+
+        if isinstance(value, UUIDBase62):
+            base62_str = value.base62_str
+            return base62_str.rjust(BASE62_WIDTH, BASE62[0]) if fixed_width else base62_str
+        elif isinstance(value, str):
+            try:
+                value = uuid.UUID(value)
+            except:
+                raise ValueError("Base62 encoding requires a UUID value")
+        else:
+            raise ValueError("Base62 encoding requires a UUID value")
+
+    return _encode_int(value.int) if fixed_width else _encode_compact(value.int)
 
 
 def decode(value: typing.Union[str, uuid.UUID, "UUIDBase62"]) -> uuid.UUID:
-    from .types import UUIDBase62
+    if instrumentation.active_sink is not None:
+        return instrumentation.observe("decode", None, _decode, value)
+    if type(value) is str:
+        return uuid.UUID(int=_decode_int(value))
+    return _decode(value)
+
 
-    if isinstance(value, UUIDBase62):
-        return value.uuid
-    elif isinstance(value, uuid.UUID):
-        return value
+def _decode(value: typing.Union[str, uuid.UUID, "UUIDBase62"]) -> uuid.UUID:
+    if type(value) is not str:
+        from .types import UUIDBase62
+
+        if isinstance(value, UUIDBase62):
+            return value.uuid
+        elif isinstance(value, uuid.UUID):
+            return value
 
     # Decode a Base 62 encoded string into a UUID.
-    strlen = len(value)
-    num = 0
+    return uuid.UUID(int=_decode_int(value))
+
+
+def sort_key(value: str) -> str:
+    """
+    Order-preserving key of a (non-prefixed) base62 string: comparing keys as plain strings (or bytes, eg. with a "C"
+    collation) matches comparing the encoded values numerically, whether or not the values are zero padded
+    """
+    return value.rjust(BASE62_WIDTH, BASE62[0]).translate(_SORT_TABLE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numpy() -> typing.Any:
+    """
+    NumPy is an optional dependency, only imported the first time a large batch is converted
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _batch_numpy(count: int) -> typing.Any:
+    """
+    NumPy module to use for a batch of `count` values, if any; the compiled codec outperforms it per value
+    """
+    if HAS_SPEEDUPS or count < NUMPY_MIN_BATCH:
+        return None
+    return _get_numpy()
+
+
+def _to_ints(values: typing.Iterable[typing.Union[uuid.UUID, "UUIDBase62", BytesLike]]) -> typing.List[int]:
+    from .types import UUIDBase62
+
+    from_bytes = int.from_bytes
+    ints = []
+    for value in values:
+        if isinstance(value, uuid.UUID):
+            ints.append(value.int)
+        elif isinstance(value, UUIDBase62):
+            ints.append(value.uuid.int)
+        elif isinstance(value, (bytes, bytearray, memoryview)) and len(value) == 16:
+            ints.append(from_bytes(value, "big"))
+        else:
+            raise ValueError("Base62 encoding requires a UUID value")
+    return ints
+
+
+def _unpack(packed: BytesLike) -> typing.List[int]:
+    packed = bytes(packed)
+    if len(packed) % 16:
+        raise ValueError("Packed UUID buffer length must be a multiple of 16 bytes")
+    from_bytes = int.from_bytes
+    return [from_bytes(packed[offset : offset + 16], "big") for offset in range(0, len(packed), 16)]
+
+
+def _encode_many_python(ints: typing.List[int], fixed_width: bool) -> typing.List[str]:
+    encode_int = _encode_int if fixed_width else _encode_compact
+    return [encode_int(num) for num in ints]
+
+
+def _encode_many_numpy(numpy: typing.Any, packed: BytesLike, fixed_width: bool) -> typing.List[str]:
+    # the hi/lo uint64 halves are processed as four 32-bit limbs, so that a limb shifted on top of a remainder
+    # (< 62**5 < 2**30) still fits within uint64 during long division
+    limbs = numpy.frombuffer(packed, dtype=">u4").reshape(-1, 4).astype(numpy.uint64)
+    count = len(limbs)
+    shift = numpy.uint64(32)
+    chunk_base = numpy.uint64(_CHUNK_BASE)
+    base = numpy.uint64(BASE62_LENGTH)
+
+    digits = numpy.zeros((count, BASE62_WIDTH), dtype=numpy.uint8)
+    position = BASE62_WIDTH
+    while position > 0:
+        # divide every value by 62**5, the remainder holds the next 5 (least significant) digits
+        remainder = numpy.zeros(count, dtype=numpy.uint64)
+        for column in range(4):
+            current = (remainder << shift) | limbs[:, column]
+            limbs[:, column] = current // chunk_base
+            remainder = current % chunk_base
+        for _ in range(min(5, position)):
+            position -= 1
+            digits[:, position] = remainder % base
+            remainder //= base
+
+    alphabet = numpy.frombuffer(BASE62.encode("ascii"), dtype=numpy.uint8)
+    text = alphabet[digits].tobytes().decode("ascii")
+    if fixed_width:
+        return [text[offset : offset + BASE62_WIDTH] for offset in range(0, len(text), BASE62_WIDTH)]
+    zero = BASE62[0]
+    return [
+        text[offset : offset + BASE62_WIDTH].lstrip(zero) or zero
+        for offset in range(0, len(text), BASE62_WIDTH)
+    ]
+
+
+def _decode_many_numpy(numpy: typing.Any, values: typing.Sequence[str]) -> bytes:
+    count = len(values)
+    zero = BASE62[0]
+    text = "".join([value.rjust(BASE62_WIDTH, zero) for value in values])
+    if len(text) != count * BASE62_WIDTH:
+        raise ValueError("Base62 value is too long")
+    try:
+        raw = numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8).reshape(count, BASE62_WIDTH)
+    except UnicodeEncodeError:
+        raise ValueError("Base62 value contains invalid characters")
+
+    lookup = numpy.full(256, 255, dtype=numpy.uint8)
+    lookup[numpy.frombuffer(BASE62.encode("ascii"), dtype=numpy.uint8)] = numpy.arange(
+        BASE62_LENGTH, dtype=numpy.uint8
+    )
+    digits = lookup[raw]
+    if (digits == 255).any():
+        raise ValueError("Base62 value contains invalid characters")
+    digits = digits.astype(numpy.uint64)
+
+    shift = numpy.uint64(32)
+    mask = numpy.uint64(0xFFFFFFFF)
+    base = numpy.uint64(BASE62_LENGTH)
+    limbs = numpy.zeros((count, 4), dtype=numpy.uint64)
+    overflow = numpy.zeros(count, dtype=bool)
+    # a 2 digit head followed by four 5 digit chunks, each multiplied into the 32-bit limbs
+    start = 0
+    for width in (2, 5, 5, 5, 5):
+        chunk = numpy.zeros(count, dtype=numpy.uint64)
+        for column in range(start, start + width):
+            chunk = chunk * base + digits[:, column]
+        start += width
+
+        multiplier = numpy.uint64(BASE62_LENGTH**width)
+        carry = chunk
+        for column in range(3, -1, -1):
+            current = limbs[:, column] * multiplier + carry
+            limbs[:, column] = current & mask
+            carry = current >> shift
+        overflow |= carry != 0
+
+    if overflow.any():
+        raise ValueError("Base62 value is out of range")
+    return limbs.astype(">u4").tobytes()
+
+
+def encode_many(
+    values: typing.Union[BytesLike, typing.Iterable[typing.Union[uuid.UUID, "UUIDBase62", BytesLike]]],
+    *,
+    sep: typing.Optional[str] = None,
+    fixed_width: bool = False,
+) -> typing.Union[typing.List[str], str]:
+    """
+    Base62 encode a batch of UUID values
+    :param values: an iterable of UUID/UUIDBase62 values or 16 byte big-endian values, or a single contiguous buffer
+    of packed 128-bit values
+    :param sep: when given, the encoded values are returned as a single string joined by `sep`
+    :param fixed_width: when True, the results are zero padded to `BASE62_WIDTH` characters
+    :return: list of base62 strings, identical to calling `encode` on each value
+    """
+    is_buffer = isinstance(values, (bytes, bytearray, memoryview))
+    if is_buffer and len(values) % 16:  # type: ignore
+        raise ValueError("Packed UUID buffer length must be a multiple of 16 bytes")
+    ints = None if is_buffer else _to_ints(values)  # type: ignore
+    count = len(values) // 16 if is_buffer else len(ints)  # type: ignore
+
+    numpy = _batch_numpy(count)
+    if numpy is not None:
+        packed = values if is_buffer else b"".join([num.to_bytes(16, "big") for num in ints])  # type: ignore
+        encoded = _encode_many_numpy(numpy, packed, fixed_width)  # type: ignore
+    else:
+        encoded = _encode_many_python(_unpack(values) if is_buffer else ints, fixed_width)  # type: ignore
+    return encoded if sep is None else sep.join(encoded)
+
 
-    for idx, char in enumerate(value):
-        power = strlen - (idx + 1)
-        num += BASE62.index(char) * (BASE62_LENGTH**power)
+def decode_many(
+    values: typing.Iterable[str], *, packed: bool = False
+) -> typing.Union[typing.List[uuid.UUID], bytes]:
+    """
+    Decode a batch of (non-prefixed) base62 strings
+    :param values: an iterable of base62 strings
+    :param packed: when True, return a single contiguous buffer of big-endian 128-bit values instead of UUIDs
+    :return: list of UUID values, identical to calling `decode` on each value
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    numpy = _batch_numpy(len(values))
+    if numpy is not None:
+        buffer = _decode_many_numpy(numpy, values)
+        if packed:
+            return buffer
+        return [uuid.UUID(bytes=buffer[offset : offset + 16]) for offset in range(0, len(buffer), 16)]
 
-    return uuid.UUID(int=num)
+    ints = [_decode_int(value) for value in values]
+    if packed:
+        return b"".join([num.to_bytes(16, "big") for num in ints])
+    return [uuid.UUID(int=num) for num in ints]
@@ -0,0 +1,87 @@
+import collections
+import threading
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .types import UUIDBase62
+
+CacheKey = typing.Tuple[typing.Any, typing.Optional[str]]
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class UUIDBase62Cache:
+    """
+    Bounded, least-recently-used cache of `to_uuidbase62` results, keyed on (value, prefix). Safe to share between
+    threads; each worker process holds its own cache.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "collections.OrderedDict[CacheKey, UUIDBase62]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> typing.Optional["UUIDBase62"]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: CacheKey, value: "UUIDBase62") -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# the cache consulted by `to_uuidbase62`; caching is opt-in, so there is none until `enable_cache` is called
+active_cache: typing.Optional[UUIDBase62Cache] = None
+
+
+def enable_cache(maxsize: int = 4096) -> UUIDBase62Cache:
+    """
+    Memoize `to_uuidbase62` results (and so Pydantic field validation) in a bounded LRU cache
+    :param maxsize: maximum number of cached values; the least recently used value is evicted beyond this
+    :return: the newly active cache
+    """
+    global active_cache
+    active_cache = UUIDBase62Cache(maxsize)
+    return active_cache
+
+
+def disable_cache() -> None:
+    global active_cache
+    active_cache = None
+
+
+def cache_info() -> typing.Optional[CacheInfo]:
+    return active_cache.cache_info() if active_cache is not None else None
@@ -0,0 +1,292 @@
+import argparse
+import csv
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+import typing
+import uuid
+
+from . import base62
+from .exceptions import Base62MissingPrefix
+from .types import _parse_uuid_str, con_uuidbase62
+
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# (CSV column index or NDJSON key, prefix)
+Column = typing.Tuple[typing.Union[int, str], typing.Optional[str]]
+
+
+class _Task(typing.NamedTuple):
+    """
+    A chunk of whole lines of the input file, converted by a worker process; only its location is sent to the worker,
+    which maps the file itself
+    """
+
+    path: str
+    start: int
+    end: int
+    format: str
+    columns: typing.Tuple[Column, ...]
+    decode: bool
+    lineterminator: str
+
+
+def _invalid(value: typing.Any, error: str) -> ValueError:
+    return ValueError(f"{error}: {value!r}")
+
+
+def _encode_values(values: typing.List[typing.Any], prefix: typing.Optional[str]) -> typing.List[str]:
+    """
+    UUID strings to prefixed base62 strings, encoded with a single `base62.encode_many` call
+    """
+    packed = bytearray()
+    for value in values:
+        num = _parse_uuid_str(value) if isinstance(value, str) else None
+        if num is None:
+            raise _invalid(value, "Value must be a UUID")
+        packed += num.to_bytes(16, "big")
+    head = f"{prefix}_" if prefix else ""
+    return [f"{head}{base62_str}" for base62_str in base62.encode_many(packed)]
+
+
+def _decode_values(values: typing.List[typing.Any], prefix: typing.Optional[str]) -> typing.List[str]:
+    """
+    (Prefixed) base62 strings to UUID strings, decoded with a single `base62.decode_many` call
+    """
+    base62_strs = []
+    for value in values:
+        if not isinstance(value, str):
+            raise _invalid(value, "Value must be a string")
+        found_prefix, _, base62_str = value.rpartition("_")
+        if prefix is not None and prefix != found_prefix:
+            raise _invalid(
+                value, f"Field's expected '{prefix}' prefix does not match given prefix '{found_prefix}'"
+            )
+        base62_strs.append(base62_str)
+
+    try:
+        packed = typing.cast(bytes, base62.decode_many(base62_strs, packed=True))
+    except ValueError:
+        # find the offending value, for a useful error
+        for value, base62_str in zip(values, base62_strs):
+            try:
+                base62._decode_int(base62_str)
+            except ValueError as e:
+                raise _invalid(value, str(e))
+        raise
+    return [str(uuid.UUID(bytes=packed[offset : offset + 16])) for offset in range(0, len(packed), 16)]
+
+
+def _convert_csv(text: str, task: _Task) -> typing.Tuple[int, str]:
+    rows = list(csv.reader(io.StringIO(text, newline="")))
+    convert = _decode_values if task.decode else _encode_values
+    for column, prefix in task.columns:
+        index = typing.cast(int, column)
+        targets = [row for row in rows if len(row) > index and row[index]]
+        converted = convert([row[index] for row in targets], prefix)
+        for row, value in zip(targets, converted):
+            row[index] = value
+
+    output = io.StringIO()
+    csv.writer(output, lineterminator=task.lineterminator).writerows(rows)
+    return sum(1 for row in rows if row), output.getvalue()
+
+
+def _convert_ndjson(text: str, task: _Task) -> typing.Tuple[int, str]:
+    # only "\n" ends a record: `splitlines` would also split on characters that JSON strings may hold unescaped, such as
+    # U+2028 or U+0085
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    records = [json.loads(line) if line.strip() else None for line in (line.rstrip("\r") for line in lines)]
+    convert = _decode_values if task.decode else _encode_values
+    for key, prefix in task.columns:
+        targets = [record for record in records if isinstance(record, dict) and record.get(key) is not None]
+        converted = convert([record[key] for record in targets], prefix)
+        for record, value in zip(targets, converted):
+            record[key] = value
+
+    lines = [
+        "" if record is None else json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        for record in records
+    ]
+    return sum(1 for record in records if record is not None), "".join(
+        f"{line}{task.lineterminator}" for line in lines
+    )
+
+
+def _convert_chunk(task: _Task) -> typing.Tuple[int, bytes]:
+    with open(task.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[task.start : task.end].decode("utf-8")
+    convert = _convert_csv if task.format == "csv" else _convert_ndjson
+    count, converted = convert(text, task)
+    return count, converted.encode("utf-8")
+
+
+def _chunk_bounds(mapped: mmap.mmap, start: int, chunk_size: int) -> typing.Iterator[typing.Tuple[int, int]]:
+    """
+    Split the file from `start` into chunks of at least `chunk_size` bytes, ending on a line boundary
+    """
+    size = len(mapped)
+    while start < size:
+        end = mapped.find(b"\n", min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+def convert_file(
+    path: str,
+    output: typing.BinaryIO,
+    columns: typing.Mapping[str, typing.Optional[str]],
+    *,
+    decode: bool = False,
+    format: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Convert columns of a CSV (with a header row) or NDJSON file between UUID strings and prefixed base62 strings. The
+    file is memory mapped and split into chunks of whole lines, converted by a pool of worker processes (one batch
+    codec call per column per chunk) and written in their original order. CSV values must not span lines.
+    :param path: the input file
+    :param output: binary file the converted rows are written to
+    :param columns: column names (or NDJSON keys), mapped to their prefix; when decoding, a prefix of None accepts
+    values with any prefix
+    :param decode: when True, prefixed base62 values are converted to UUID strings, rather than the reverse
+    :param format: "csv" or "ndjson"; guessed from the file extension by default
+    :param workers: number of worker processes; defaults to the number of CPUs, 1 converts in this process
+    :param chunk_size: approximate size of the chunks, in bytes
+    :return: number of rows converted
+    """
+    if format is None:
+        format = FORMATS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Unknown file format, expected one of: {', '.join(sorted(FORMATS))}")
+    elif format not in FORMATS.values():
+        raise ValueError(f"Unknown file format '{format}'")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    for prefix in columns.values():
+        if prefix is not None:
+            # validates the prefix, same as for model fields
+            con_uuidbase62(prefix=prefix)
+        elif not decode:
+            raise ValueError("Every column requires a prefix to encode values with")
+
+    if os.path.getsize(path) == 0:
+        return 0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        first_line_end = mapped.find(b"\n")
+        first_line = mapped[: first_line_end + 1] if first_line_end != -1 else mapped[:]
+        lineterminator = "\r\n" if first_line.endswith(b"\r\n") else "\n"
+
+        start = 0
+        selected: typing.List[Column] = list(columns.items())
+        if format == "csv":
+            header = next(csv.reader([first_line.decode("utf-8")]), [])
+            missing = [column for column in columns if column not in header]
+            if missing:
+                raise ValueError(f"Columns not found in the header: {', '.join(missing)}")
+            selected = [(header.index(column), prefix) for column, prefix in columns.items()]
+            output.write(first_line)
+            start = len(first_line)
+
+        tasks = [
+            _Task(path, chunk_start, chunk_end, format, tuple(selected), decode, lineterminator)
+            for chunk_start, chunk_end in _chunk_bounds(mapped, start, chunk_size)
+        ]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+    count = 0
+    if workers == 1:
+        for rows, converted in map(_convert_chunk, tasks):
+            count += rows
+            output.write(converted)
+        return count
+
+    with multiprocessing.Pool(workers) as pool:
+        # `imap` yields results in task order, as soon as each is ready
+        for rows, converted in pool.imap(_convert_chunk, tasks):
+            count += rows
+            output.write(converted)
+    return count
+
+
+def _column(value: str) -> typing.Tuple[str, typing.Optional[str]]:
+    column, separator, prefix = value.partition("=")
+    if not column:
+        raise argparse.ArgumentTypeError(f"invalid column '{value}', expected COLUMN=PREFIX")
+    return column, prefix if separator else None
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m uuidbase62",
+        description="Convert columns of CSV or NDJSON files from UUIDs to prefixed base62 IDs, or back (--decode).",
+        epilog="example: python -m uuidbase62 books.csv -c id=book -c author_id=author -o books.base62.csv",
+    )
+    parser.add_argument("input", help="CSV (with a header row) or NDJSON file")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument(
+        "-c",
+        "--column",
+        type=_column,
+        action="append",
+        required=True,
+        metavar="COLUMN=PREFIX",
+        help="column (or NDJSON key) to convert, and its prefix; repeatable. With --decode, the prefix is optional "
+        "and checked when given",
+    )
+    parser.add_argument(
+        "-d",
+        "--decode",
+        action="store_true",
+        help="convert prefixed base62 IDs to UUIDs, rather than the reverse",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=sorted(set(FORMATS.values())), help="default: from the extension"
+    )
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: number of CPUs)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"bytes of input per chunk sent to a worker (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    started = time.perf_counter()
+    try:
+        count = convert_file(
+            args.input,
+            output,
+            dict(args.column),
+            decode=args.decode,
+            format=args.format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    except Base62MissingPrefix:
+        print("error: prefixes may only contain letters, digits and underscores", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0.0
+    print(f"{count} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)", file=sys.stderr)
+    return 0
@@ -0,0 +1,30 @@
+import sys
+import types
+import typing
+
+import pydantic
+
+PYDANTIC_V2 = int(pydantic.VERSION.split(".", 1)[0]) >= 2
+
+
+def get_field_type(model: typing.Any, field: str) -> typing.Any:
+    """
+    The declared type of a Pydantic model field, for either Pydantic v1 or v2 models
+    """
+    if PYDANTIC_V2:
+        return _unwrap_optional(model.model_fields[field].annotation)
+    return model.__fields__[field].type_
+
+
+def _unwrap_optional(annotation: typing.Any) -> typing.Any:
+    """
+    `X` for an `Optional[X]` (or `X | None`) annotation, same as the field type Pydantic v1 reports
+    """
+    is_union = getattr(annotation, "__origin__", None) is typing.Union or (
+        sys.version_info >= (3, 10) and isinstance(annotation, types.UnionType)  # type: ignore
+    )
+    if is_union:
+        args = [arg for arg in annotation.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
@@ -1,14 +1,20 @@
 import enum
 import http
 import typing
+import uuid
 
 import fastapi
 from fastapi import Body, Header, Path, Query
 
+from . import base62, instrumentation
+from .compat import get_field_type
+from .loaders import Fetch, UUIDBase62Loader
 from .models import UUIDBase62ModelMixin
-from .types import UUIDBase62, to_uuidbase62
+from .pagination import Cursor, Secret, decode_cursor
+from .types import UUIDBase62, UUIDBase62List, _validate_to_int, _value_type
 
 
+# functions aren't enum members: `ParamSource.QUERY` etc. are the FastAPI param functions themselves, typed as such
 class ParamSource(enum.Enum):
     PATH = Path
     QUERY = Query
@@ -16,6 +22,18 @@ class ParamSource(enum.Enum):
     BODY = Body
 
 
+# dependency callables already built, by factory and (normalized) arguments; returning the same callable for the same
+# arguments lets FastAPI share its per-request dependency cache between routes, and skips rebuilding the signature
+_dependencies: typing.Dict[typing.Tuple, typing.Callable] = {}
+
+
+def _memoize(key: typing.Tuple, build: typing.Callable[[], typing.Callable]) -> typing.Callable:
+    try:
+        return _dependencies[key]
+    except KeyError:
+        return _dependencies.setdefault(key, build())
+
+
 def get_validated_uuidbase62_by_model(
     model: UUIDBase62ModelMixin, field: str, param: str, param_source: ParamSource = ParamSource.PATH
 ) -> typing.Callable:
@@ -30,15 +48,11 @@ def get_validated_uuidbase62_by_model(
     :return: UUIDBase62 value representation of the param from the Request
     """
 
-    def _inner(item_id: str = param_source(..., alias=param)) -> "UUIDBase62":  # type: ignore # noqa: B008
-        try:
-            return model.to_uuidbase62(field, item_id)
-        except ValueError as e:
-            status_code = 404
-            detail = f"{http.HTTPStatus(status_code).phrase}; {e}"
-            raise fastapi.exceptions.HTTPException(status_code=status_code, detail=detail)
+    def build() -> typing.Callable:
+        field_type = get_field_type(model, field)
+        return _build_dependency(field_type.validate, param, param_source, field_type.prefix)
 
-    return _inner
+    return _memoize(("by_model", model, field, param, param_source), build)
 
 
 def get_validated_uuidbase62(
@@ -53,13 +67,181 @@ def get_validated_uuidbase62(
     found within the Request
     :return: UUIDBase62 value representation of the param from the Request
     """
+    return _memoize(
+        ("single", param, prefix, param_source),
+        lambda: _build_dependency(_value_type(prefix).validate, param, param_source, prefix),
+    )
+
 
+def _build_dependency(
+    validate: typing.Callable[[typing.Any], UUIDBase62],
+    param: str,
+    param_source: ParamSource,
+    prefix: typing.Optional[str],
+) -> typing.Callable:
     def _inner(item_id: str = param_source(..., alias=param)) -> "UUIDBase62":  # type: ignore # noqa: B008
         try:
-            return to_uuidbase62(item_id, prefix)
+            if instrumentation.active_sink is None:
+                return validate(item_id)
+            # rejections are reported as "dependency" failures, telling them apart from the app's own 404s
+            return instrumentation.observe("dependency", prefix, validate, item_id)
         except ValueError as e:
             status_code = 404
             detail = f"{http.HTTPStatus(status_code).phrase}; {e}"
             raise fastapi.exceptions.HTTPException(status_code=status_code, detail=detail)
 
     return _inner
+
+
+def get_validated_uuidbase62_list(
+    param: str,
+    prefix: typing.Optional[str] = None,
+    param_source: typing.Callable[..., typing.Any] = ParamSource.QUERY,
+    *,
+    deduplicate: bool = False,
+    max_count: typing.Optional[int] = None,
+    separator: str = ",",
+) -> typing.Callable:
+    """
+    Useful FastAPI dependency injection function to retrieve and validate a list of inbound values from a Request as
+    UUIDBase62 values; eg. `?ids=a,b,c` or `?ids=a&ids=b&ids=c` for a Query param. Every value is validated, and all
+    invalid values are reported together in a single 422 response.
+    :param param: the name of the inbound Request parameter containing the values to validate
+    :param prefix: the prefix expected for the UUIDBase62 values
+    :param param_source: one of Query (default), Header, Body; where the param is expected to be found within the
+    Request
+    :param deduplicate: drop repeated values, keeping the first occurrence
+    :param max_count: maximum number of values accepted, counted after de-duplication
+    :param separator: each inbound value is also split on this separator
+    :return: UUIDBase62List of the values from the Request, with the decoded UUIDs available as its `uuids`
+    """
+    if param_source is ParamSource.PATH:
+        raise ValueError("Lists of UUIDBase62 values can't be read from a Path param")
+    return _memoize(
+        ("list", param, prefix, param_source, deduplicate, max_count, separator),
+        lambda: _build_list_dependency(param, prefix, param_source, deduplicate, max_count, separator),
+    )
+
+
+def _build_list_dependency(
+    param: str,
+    prefix: typing.Optional[str],
+    param_source: typing.Callable[..., typing.Any],
+    deduplicate: bool,
+    max_count: typing.Optional[int],
+    separator: str,
+) -> typing.Callable:
+    value_type = _value_type(prefix)
+    source_name = param_source.__name__.lower()  # type: ignore
+    status_code = 422
+
+    def _inner(items: typing.List[str] = param_source(..., alias=param)) -> UUIDBase62List:  # type: ignore # noqa: B008
+        values = [value for item in items for value in item.split(separator)] if separator else list(items)
+        if deduplicate:
+            values = list(dict.fromkeys(values))
+        # counted after de-duplication, and reported in the same shape as invalid values
+        if max_count is not None and len(values) > max_count:
+            detail = [
+                {
+                    "loc": [source_name, param],
+                    "msg": f"At most {max_count} values are accepted",
+                    "type": "value_error",
+                    "input": values,
+                }
+            ]
+            raise fastapi.exceptions.HTTPException(status_code=status_code, detail=detail)
+
+        validated = []
+        uuids = []
+        errors = []
+        observe = instrumentation.active_sink is not None
+        for index, value in enumerate(values):
+            try:
+                if observe:
+                    result = instrumentation.observe("dependency", prefix, value_type.validate, value)
+                    num = base62._decode_int(result.base62_str)
+                else:
+                    # each value is decoded once, while being validated
+                    result, num = _validate_to_int(value_type, value)
+            except ValueError as e:
+                errors.append(
+                    {"loc": [source_name, param, index], "msg": str(e), "type": "value_error", "input": value}
+                )
+                continue
+            validated.append(result)
+            uuids.append(uuid.UUID(int=num))
+        if errors:
+            raise fastapi.exceptions.HTTPException(status_code=status_code, detail=errors)
+
+        return UUIDBase62List(validated, uuids)
+
+    return _inner
+
+
+def get_validated_cursor(
+    param: str = "cursor",
+    prefix: typing.Optional[str] = None,
+    param_source: typing.Callable[..., typing.Any] = ParamSource.QUERY,
+    *,
+    secret: typing.Optional[Secret] = None,
+) -> typing.Callable:
+    """
+    Useful FastAPI dependency injection function to retrieve and validate an inbound keyset pagination cursor (see
+    `uuidbase62.pagination.encode_cursor`) from a Request
+    :param param: the name of the inbound Request parameter containing the cursor
+    :param prefix: the prefix expected for the cursor's ID
+    :param param_source: one of Query (default), Header, Body; where the param is expected to be found within the
+    Request
+    :param secret: the secret cursors are signed with, if any
+    :return: the decoded Cursor, whose `uuid` is the page boundary; None when the param is missing (the first page)
+    """
+    if param_source is ParamSource.PATH:
+        raise ValueError("Cursors can't be read from a Path param, as the first page has none")
+    return _memoize(
+        ("cursor", param, prefix, param_source, secret),
+        lambda: _build_cursor_dependency(param, prefix, param_source, secret),
+    )
+
+
+def _build_cursor_dependency(
+    param: str,
+    prefix: typing.Optional[str],
+    param_source: typing.Callable[..., typing.Any],
+    secret: typing.Optional[Secret],
+) -> typing.Callable:
+    status_code = 400
+
+    def _inner(
+        cursor: typing.Optional[str] = param_source(None, alias=param),  # type: ignore # noqa: B008
+    ) -> typing.Optional[Cursor]:
+        if cursor is None:
+            return None
+        try:
+            return decode_cursor(cursor, prefix, secret=secret)
+        except ValueError as e:
+            detail = f"{http.HTTPStatus(status_code).phrase}; {e}"
+            raise fastapi.exceptions.HTTPException(status_code=status_code, detail=detail)
+
+    return _inner
+
+
+def get_uuidbase62_loader(fetch: Fetch, *, max_batch_size: typing.Optional[int] = None) -> typing.Callable:
+    """
+    Useful FastAPI dependency injection function providing a UUIDBase62Loader for the current Request: FastAPI caches
+    dependency values per Request, so the route and all its dependencies share the same loader (and its cache), and
+    each Request starts with an empty cache
+    :param fetch: async function called with a prefix and a list of distinct UUIDs, returning a mapping of the UUIDs
+    found to their value
+    :param max_batch_size: maximum number of UUIDs passed to a single `fetch` call
+    :return: a new UUIDBase62Loader, per Request
+    """
+    return _memoize(
+        ("loader", fetch, max_batch_size), lambda: _build_loader_dependency(fetch, max_batch_size)
+    )
+
+
+def _build_loader_dependency(fetch: Fetch, max_batch_size: typing.Optional[int]) -> typing.Callable:
+    async def _inner() -> UUIDBase62Loader:
+        return UUIDBase62Loader(fetch, max_batch_size=max_batch_size)
+
+    return _inner
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+import typing
+import uuid
+import weakref
+
+from .base62 import _encode_compact
+from .types import UUIDBase62, _from_int, _new_value, _value_type, con_uuidbase62
+
+# UUIDv7 layout: 48-bit unix timestamp (ms), 4-bit version, 12-bit rand_a, 2-bit variant, 62-bit rand_b; rand_a and
+# rand_b together hold a 74-bit sequence, randomly seeded each millisecond and incremented within it
+_SEQUENCE_BITS = 74
+_RAND_B_BITS = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+_VERSION_AND_VARIANT = (0x7 << 76) | (0b10 << 62)
+# UUIDv4: 122 random bits, with the version and variant bits overwritten
+_V4_RANDOM_MASK = ~((0xF << 76) | (0b11 << 62)) & ((1 << 128) - 1)
+_V4_VERSION_AND_VARIANT = (0x4 << 76) | (0b10 << 62)
+
+_lock = threading.Lock()
+_last_timestamp = -1
+_last_sequence = 0
+
+
+class _EntropyPool:
+    """
+    Random bytes drawn from `os.urandom` in large blocks, rather than with one syscall per value
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._block = b""
+        self._offset = 0
+        _pools.add(self)
+
+    def take(self, count: int) -> bytes:
+        if count > self.size:
+            return os.urandom(count)
+        with self._lock:
+            offset = self._offset
+            if offset + count > len(self._block):
+                self._block = os.urandom(self.size)
+                offset = 0
+            self._offset = offset + count
+            return self._block[offset : offset + count]
+
+    def clear(self) -> None:
+        self._block = b""
+        self._offset = 0
+
+
+_pools: "weakref.WeakSet[_EntropyPool]" = weakref.WeakSet()
+_default_pool = _EntropyPool(4096)
+
+
+def _reset() -> None:
+    global _lock, _last_timestamp
+    # a forked child must neither continue its parent's sequence nor reuse the random bytes the parent buffered, which
+    # would yield the same values in both processes
+    _lock = threading.Lock()
+    _last_timestamp = -1
+    for pool in list(_pools):
+        pool._lock = threading.Lock()
+        pool.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
+
+
+def _random_sequence(pool: _EntropyPool) -> int:
+    # the top bit is left clear, leaving room to increment the sequence within the same millisecond
+    return int.from_bytes(pool.take(10), "big") >> (80 - _SEQUENCE_BITS + 1)
+
+
+def _uuid7_ints(count: int, pool: _EntropyPool) -> typing.List[int]:
+    global _last_timestamp, _last_sequence
+    timestamp = time.time_ns() // 1_000_000
+    ints = []
+    with _lock:
+        if timestamp > _last_timestamp:
+            sequence = _random_sequence(pool)
+        else:
+            # same millisecond, or the clock went backwards: stay ordered after the last value
+            timestamp = _last_timestamp
+            sequence = _last_sequence + 1
+        for _ in range(count):
+            if sequence >> _SEQUENCE_BITS:
+                timestamp += 1
+                sequence = _random_sequence(pool)
+            rand_a = sequence >> _RAND_B_BITS
+            ints.append((timestamp << 80) | _VERSION_AND_VARIANT | (rand_a << 64) | (sequence & _RAND_B_MASK))
+            sequence += 1
+        _last_timestamp = timestamp
+        _last_sequence = sequence - 1
+    return ints
+
+
+def _uuid4_ints(count: int, pool: _EntropyPool) -> typing.List[int]:
+    block = pool.take(count * 16)
+    from_bytes = int.from_bytes
+    return [
+        from_bytes(block[offset : offset + 16], "big") & _V4_RANDOM_MASK | _V4_VERSION_AND_VARIANT
+        for offset in range(0, len(block), 16)
+    ]
+
+
+def uuid7() -> uuid.UUID:
+    """
+    A time-ordered (version 7) UUID; values generated within a process are strictly increasing, even within the same
+    millisecond, which keeps B-tree index inserts on the most recent page
+    """
+    return uuid.UUID(int=_uuid7_ints(1, _default_pool)[0])
+
+
+def generate_uuidbase62(prefix: typing.Optional[str] = None) -> UUIDBase62:
+    """
+    A new UUIDv7 as a prefixed base62 value, encoded the same as `to_uuidbase62(uuid7(), prefix)`; sort values by
+    `base62.sort_key` of their `base62_str` to order them by creation time
+    :param prefix: the prefix of the value
+    :return: the UUIDBase62 value, of the same type as `con_uuidbase62(prefix=prefix)`
+    """
+    if prefix is not None:
+        # validates the prefix, same as for model fields
+        con_uuidbase62(prefix=prefix)
+    return _from_int(_uuid7_ints(1, _default_pool)[0], prefix)
+
+
+class UUIDBase62Generator:
+    """
+    Generates new prefixed base62 values in bulk: randomness is drawn from `os.urandom` in large blocks and values are
+    encoded a batch at a time. Instances can be shared between threads and asyncio tasks (no lock is ever held across
+    an await), and buffered randomness is discarded in forked children, eg. gunicorn workers.
+
+        generate_book_id = UUIDBase62Generator(prefix="book")
+        generate_book_id()  # UUIDBase62('book_...')
+        generate_book_id.generate_many(10_000)
+    """
+
+    def __init__(self, prefix: typing.Optional[str] = None, *, version: int = 7, pool_size: int = 64 * 1024):
+        """
+        :param prefix: the prefix of the values
+        :param version: 7 for time-ordered values (same as `generate_uuidbase62`), or 4 for random values, encoded the
+        same as `to_uuidbase62(uuid.uuid4(), prefix)`
+        :param pool_size: number of random bytes drawn from the OS at a time
+        """
+        if version not in (4, 7):
+            raise ValueError("Only version 4 and 7 UUIDs can be generated")
+        if prefix is not None:
+            # validates the prefix, same as for model fields
+            con_uuidbase62(prefix=prefix)
+        self.prefix = prefix
+        self.version = version
+        self._value_type = _value_type(prefix)
+        self._head = f"{prefix}_" if prefix else ""
+        self._ints = _uuid7_ints if version == 7 else _uuid4_ints
+        self._pool = _EntropyPool(pool_size)
+
+    def __call__(self) -> UUIDBase62:
+        return _new_value(self._value_type, f"{self._head}{_encode_compact(self._ints(1, self._pool)[0])}")
+
+    def generate_many(self, count: int) -> typing.List[UUIDBase62]:
+        """
+        :param count: number of values to generate
+        :return: new values; version 7 values are in increasing UUID order
+        """
+        value_type = self._value_type
+        head = self._head
+        encode = _encode_compact
+        return [_new_value(value_type, f"{head}{encode(num)}") for num in self._ints(count, self._pool)]
+
+    def uuids(self, count: int) -> typing.List[uuid.UUID]:
+        """
+        :param count: number of values to generate
+        :return: new UUID values, eg. for database keys generated ahead of their prefixed IDs
+        """
+        return [uuid.UUID(int=num) for num in self._ints(count, self._pool)]
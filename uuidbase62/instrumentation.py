@@ -0,0 +1,242 @@
+import collections
+import random
+import threading
+import time
+import typing
+
+T = typing.TypeVar("T")
+
+# ValueError message prefixes, mapped to the failure reasons reported to sinks
+_FAILURE_REASONS = (
+    ("Field's expected", "prefix_mismatch"),
+    ("Value contains invalid characters", "invalid_characters"),
+    ("Base62 value contains invalid characters", "invalid_characters"),
+    ("Base62 value is too long", "too_long"),
+    ("Base62 value is out of range", "out_of_range"),
+    ("Binary value", "invalid_bytes"),
+    ("Value must be", "invalid_type"),
+    ("Base62 encoding requires", "invalid_type"),
+)
+
+
+def failure_reason(error: Exception) -> str:
+    """
+    :return: a short, stable reason for a conversion or validation error, eg. "prefix_mismatch"
+    """
+    message = str(error)
+    for start, reason in _FAILURE_REASONS:
+        if message.startswith(start):
+            return reason
+    return "other"
+
+
+class Sink:
+    """
+    Receives instrumentation events; subclasses override the events they record. `operation` is one of "encode",
+    "decode", "to_uuidbase62" or "dependency", and `prefix` is the expected prefix, if any.
+    """
+
+    def record_call(self, operation: str, prefix: typing.Optional[str]) -> None:
+        pass
+
+    def record_failure(self, operation: str, prefix: typing.Optional[str], reason: str) -> None:
+        pass
+
+    def record_timing(
+        self, operation: str, prefix: typing.Optional[str], seconds: float, failed: bool
+    ) -> None:
+        pass
+
+
+class TimingInfo(typing.NamedTuple):
+    samples: int
+    total_seconds: float
+    max_seconds: float
+
+
+class CounterSink(Sink):
+    """
+    In-process counters of calls, failures (by reason) and sampled timings, by operation and prefix
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls: typing.Counter[typing.Tuple[str, typing.Optional[str]]] = collections.Counter()
+        self.failures: typing.Counter[typing.Tuple[str, typing.Optional[str], str]] = collections.Counter()
+        self.timings: typing.Dict[typing.Tuple[str, typing.Optional[str], bool], TimingInfo] = {}
+
+    def record_call(self, operation: str, prefix: typing.Optional[str]) -> None:
+        with self._lock:
+            self.calls[operation, prefix] += 1
+
+    def record_failure(self, operation: str, prefix: typing.Optional[str], reason: str) -> None:
+        with self._lock:
+            self.failures[operation, prefix, reason] += 1
+
+    def record_timing(
+        self, operation: str, prefix: typing.Optional[str], seconds: float, failed: bool
+    ) -> None:
+        key = (operation, prefix, failed)
+        with self._lock:
+            samples, total_seconds, max_seconds = self.timings.get(key, (0, 0.0, 0.0))
+            self.timings[key] = TimingInfo(samples + 1, total_seconds + seconds, max(max_seconds, seconds))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.failures.clear()
+            self.timings.clear()
+
+
+def _labels(**labels: typing.Optional[str]) -> str:
+    escaped = (
+        (name, (value or "").replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return ",".join(f'{name}="{value}"' for name, value in escaped)
+
+
+class PrometheusSink(CounterSink):
+    """
+    In-process counters, rendered in the Prometheus text exposition format by `exposition()`, eg. from a `/metrics`
+    route
+    """
+
+    def exposition(self) -> str:
+        with self._lock:
+            calls = sorted(self.calls.items(), key=str)
+            failures = sorted(self.failures.items(), key=str)
+            timings = sorted(self.timings.items(), key=str)
+
+        lines = [
+            "# HELP uuidbase62_calls_total Conversions and validations, by operation and expected prefix.",
+            "# TYPE uuidbase62_calls_total counter",
+        ]
+        for (operation, prefix), count in calls:
+            lines.append(f"uuidbase62_calls_total{{{_labels(operation=operation, prefix=prefix)}}} {count}")
+        lines += [
+            "# HELP uuidbase62_failures_total Failed conversions and validations, by reason.",
+            "# TYPE uuidbase62_failures_total counter",
+        ]
+        for (operation, prefix, reason), count in failures:
+            labels = _labels(operation=operation, prefix=prefix, reason=reason)
+            lines.append(f"uuidbase62_failures_total{{{labels}}} {count}")
+        lines += [
+            "# HELP uuidbase62_duration_seconds Sampled durations of conversions and validations.",
+            "# TYPE uuidbase62_duration_seconds summary",
+        ]
+        for (operation, prefix, failed), info in timings:
+            labels = _labels(operation=operation, prefix=prefix, outcome="failure" if failed else "success")
+            lines.append(f"uuidbase62_duration_seconds_count{{{labels}}} {info.samples}")
+            lines.append(f"uuidbase62_duration_seconds_sum{{{labels}}} {info.total_seconds!r}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink(Sink):
+    """
+    Records events as OpenTelemetry metrics (`uuidbase62.calls`, `uuidbase62.failures` counters and a
+    `uuidbase62.duration` histogram); requires the `opentelemetry-api` package
+    """
+
+    def __init__(self, meter: typing.Any = None):
+        """
+        :param meter: the OpenTelemetry meter to create instruments with; defaults to a meter of the global provider
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError:
+                raise ImportError("OpenTelemetrySink requires the opentelemetry-api package")
+            meter = metrics.get_meter("uuidbase62")
+        self._calls = meter.create_counter("uuidbase62.calls", description="Conversions and validations")
+        self._failures = meter.create_counter(
+            "uuidbase62.failures", description="Failed conversions and validations"
+        )
+        self._duration = meter.create_histogram(
+            "uuidbase62.duration", unit="s", description="Sampled durations of conversions and validations"
+        )
+
+    def record_call(self, operation: str, prefix: typing.Optional[str]) -> None:
+        self._calls.add(1, {"operation": operation, "prefix": prefix or ""})
+
+    def record_failure(self, operation: str, prefix: typing.Optional[str], reason: str) -> None:
+        self._failures.add(1, {"operation": operation, "prefix": prefix or "", "reason": reason})
+
+    def record_timing(
+        self, operation: str, prefix: typing.Optional[str], seconds: float, failed: bool
+    ) -> None:
+        outcome = "failure" if failed else "success"
+        self._duration.record(seconds, {"operation": operation, "prefix": prefix or "", "outcome": outcome})
+
+
+class _MultiSink(Sink):
+    def __init__(self, sinks: typing.Sequence[Sink]):
+        self.sinks = tuple(sinks)
+
+    def record_call(self, operation: str, prefix: typing.Optional[str]) -> None:
+        for sink in self.sinks:
+            sink.record_call(operation, prefix)
+
+    def record_failure(self, operation: str, prefix: typing.Optional[str], reason: str) -> None:
+        for sink in self.sinks:
+            sink.record_failure(operation, prefix, reason)
+
+    def record_timing(
+        self, operation: str, prefix: typing.Optional[str], seconds: float, failed: bool
+    ) -> None:
+        for sink in self.sinks:
+            sink.record_timing(operation, prefix, seconds, failed)
+
+
+# the sink instrumented call sites report to; instrumentation is opt-in, so there is none (and call sites skip all
+# instrumentation after a single check) until `enable_instrumentation` is called
+active_sink: typing.Optional[Sink] = None
+_sample_rate = 0.0
+
+
+def enable_instrumentation(*sinks: Sink, sample_rate: float = 0.01) -> Sink:
+    """
+    Report calls and failures of the codec, `to_uuidbase62` and the dependencies to `sinks`
+    :param sinks: the sinks to report to
+    :param sample_rate: fraction of calls that are also timed
+    :return: the newly active sink
+    """
+    global active_sink, _sample_rate
+    if not sinks:
+        raise ValueError("At least one sink is required")
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("Sample rate must be between 0 and 1")
+    _sample_rate = sample_rate
+    active_sink = sinks[0] if len(sinks) == 1 else _MultiSink(sinks)
+    return active_sink
+
+
+def disable_instrumentation() -> None:
+    global active_sink
+    active_sink = None
+
+
+def observe(
+    operation: str, prefix: typing.Optional[str], func: typing.Callable[..., T], *args: typing.Any
+) -> T:
+    """
+    Call `func(*args)`, reporting the call, its failure (ValueError) and, when sampled, its duration to the active
+    sink
+    """
+    sink = active_sink
+    if sink is None:
+        return func(*args)
+
+    sink.record_call(operation, prefix)
+    timed = _sample_rate and random.random() < _sample_rate
+    start = time.perf_counter() if timed else 0.0
+    try:
+        result = func(*args)
+    except ValueError as e:
+        sink.record_failure(operation, prefix, failure_reason(e))
+        if timed:
+            sink.record_timing(operation, prefix, time.perf_counter() - start, True)
+        raise
+    if timed:
+        sink.record_timing(operation, prefix, time.perf_counter() - start, False)
+    return result
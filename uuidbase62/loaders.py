@@ -0,0 +1,138 @@
+import asyncio
+import collections.abc
+import typing
+import uuid
+
+from . import base62
+
+T = typing.TypeVar("T")
+
+# fetches the values of a batch of UUIDs sharing a prefix; UUIDs missing from the result load as None
+Fetch = typing.Callable[
+    [typing.Optional[str], typing.List[uuid.UUID]], typing.Awaitable[typing.Mapping[uuid.UUID, T]]
+]
+
+
+def _split(key: str) -> typing.Tuple[str, int]:
+    if not isinstance(key, str):
+        raise ValueError("Loader keys must be UUIDBase62 values")
+    prefix, _, base62_str = key.rpartition("_")
+    return prefix, base62._decode_int(base62_str)
+
+
+class UUIDBase62Loader(typing.Generic[T]):
+    """
+    Batches and caches lookups by UUIDBase62 value (DataLoader style): values loaded within the same event loop
+    iteration are collected by prefix, and each prefix's de-duplicated UUIDs are passed to a single `fetch` call,
+    turning N lookups into one query per prefix. Loaded values are cached by the loader, which is meant to live for a
+    single request (see `get_uuidbase62_loader`).
+
+        async def fetch(prefix, uuids):
+            rows = await db.fetch_all(tables[prefix].select().where(tables[prefix].c.id.in_(uuids)))
+            return {row.id: row for row in rows}
+
+        loader = UUIDBase62Loader(fetch)
+        author, org = await asyncio.gather(loader.load(book.author_id), loader.load(book.org_id))
+    """
+
+    def __init__(self, fetch: Fetch, *, max_batch_size: typing.Optional[int] = None):
+        """
+        :param fetch: async function called with a prefix (None for values without one) and a list of distinct UUIDs,
+        returning a mapping of the UUIDs found to their value
+        :param max_batch_size: maximum number of UUIDs passed to a single `fetch` call
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("Max batch size must be at least 1")
+        self._fetch = fetch
+        self._max_batch_size = max_batch_size
+        # futures of every value loaded, by prefix and UUID int, and those not fetched yet, by prefix
+        self._futures: typing.Dict[typing.Tuple[str, int], "asyncio.Future[typing.Optional[T]]"] = {}
+        self._pending: typing.Dict[str, typing.Dict[int, "asyncio.Future[typing.Optional[T]]"]] = {}
+        self._tasks: typing.Set["asyncio.Task[None]"] = set()
+
+    def load(self, key: str) -> "asyncio.Future[typing.Optional[T]]":
+        """
+        :param key: the UUIDBase62 value (or prefixed base62 string) to load
+        :return: a future of the value fetched for `key`, or None when not found
+        """
+        prefix, num = _split(key)
+        future = self._futures.get((prefix, num))
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._futures[prefix, num] = loop.create_future()
+        pending = self._pending.get(prefix)
+        if pending is None:
+            pending = self._pending[prefix] = {}
+            # fetch once every task that is ready to run has had the chance to add its keys to the batch
+            loop.call_soon(self._dispatch, prefix)
+        pending[num] = future
+        return future
+
+    def load_many(self, keys: typing.Iterable[str]) -> "asyncio.Future[typing.List[typing.Optional[T]]]":
+        """
+        :param keys: the UUIDBase62 values to load
+        :return: a future of the values, in the order of `keys`
+        """
+        return asyncio.gather(*[self.load(key) for key in keys])
+
+    def prime(self, key: str, value: T) -> None:
+        """
+        Cache `value` for `key`, eg. a value already fetched with another query, unless `key` is already loaded
+        """
+        prefix, num = _split(key)
+        if (prefix, num) not in self._futures:
+            future = self._futures[prefix, num] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+
+    def clear(self, key: typing.Optional[str] = None) -> None:
+        """
+        Drop `key` (or every value, when None) from the cache, so that it's fetched again by the next load
+        """
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(_split(key), None)
+
+    def _dispatch(self, prefix: str) -> None:
+        pending = self._pending.pop(prefix)
+        nums = list(pending)
+        size = self._max_batch_size or len(nums)
+        for start in range(0, len(nums), size):
+            batch = {num: pending[num] for num in nums[start : start + size]}
+            task = asyncio.ensure_future(self._fetch_batch(prefix, batch))
+            # keep a reference to the task until it's done
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_batch(
+        self, prefix: str, batch: typing.Dict[int, "asyncio.Future[typing.Optional[T]]"]
+    ) -> None:
+        uuids = [uuid.UUID(int=num) for num in batch]
+        try:
+            values = await self._fetch(prefix or None, uuids)
+            if not isinstance(values, collections.abc.Mapping):
+                raise TypeError(
+                    f"Loader fetch must return a mapping of UUIDs to values, not {type(values).__name__}"
+                )
+            results = [values.get(uuid_) for uuid_ in uuids]
+        except BaseException as e:
+            # every load of the batch fails, rather than waiting forever
+            for num, future in batch.items():
+                # failures aren't cached, so that a later load retries
+                if self._futures.get((prefix, num)) is future:
+                    del self._futures[prefix, num]
+                if not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                # cancellation, KeyboardInterrupt, etc. still propagate
+                raise
+            return
+
+        for future, result in zip(batch.values(), results):
+            if not future.done():
+                future.set_result(result)
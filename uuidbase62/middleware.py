@@ -0,0 +1,115 @@
+import http
+import json
+import typing
+import uuid
+
+from .types import _validate_to_int, _value_type
+
+Scope = typing.MutableMapping[str, typing.Any]
+Receive = typing.Callable[[], typing.Awaitable[typing.MutableMapping[str, typing.Any]]]
+Send = typing.Callable[[typing.MutableMapping[str, typing.Any]], typing.Awaitable[None]]
+ASGIApp = typing.Callable[[Scope, Receive, Send], typing.Awaitable[None]]
+
+
+class _PathTemplate:
+    """
+    A path template (eg. "/books/{book_id}/pages/{page_id}") compiled into its literal segments, and the positions of
+    the segments holding prefixed IDs along with their validators
+    """
+
+    def __init__(self, template: str, prefixes: typing.Mapping[str, str]):
+        self.template = template
+        self.segments = template.strip("/").split("/")
+        self.literals = []
+        self.params = []
+        for index, segment in enumerate(self.segments):
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if name in prefixes:
+                    self.params.append((index, name, _value_type(prefixes[name])))
+            else:
+                self.literals.append((index, segment))
+        unknown = set(prefixes) - {name for _, name, _ in self.params}
+        if unknown:
+            raise ValueError(f"Path template '{template}' has no {sorted(unknown)} params")
+        # segments expected to hold a prefixed ID, which only look like one when they contain a "_"
+        self.prefixed = [index for index, _, value_type in self.params if value_type.prefix]
+
+    def matches(self, segments: typing.List[str]) -> bool:
+        """
+        Whether `segments` match the literal segments, and every prefixed ID segment looks like an ID; paths of
+        literal routes sharing the template's shape (eg. "/books/search" for "/books/{book_id}") are left to routing
+        """
+        return all(segments[index] == literal for index, literal in self.literals) and all(
+            "_" in segments[index] for index in self.prefixed
+        )
+
+
+class UUIDBase62PathMiddleware:
+    """
+    Pure ASGI middleware that validates prefixed base62 IDs in request paths before routing; requests with an invalid
+    (or wrongly prefixed) ID are rejected with the same 404 response as `get_validated_uuidbase62`, without reaching
+    routing or dependency resolution. The decoded UUIDs of valid IDs are attached to `scope["state"]["uuidbase62"]`
+    (ie. `request.state.uuidbase62`) by param name. Segments without a "_" don't look like prefixed IDs, and are
+    passed through unvalidated, so that literal routes such as "/books/search" aren't shadowed by "/books/{book_id}".
+
+        app.add_middleware(UUIDBase62PathMiddleware, routes={"/books/{book_id}": {"book_id": "book"}})
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: typing.Mapping[str, typing.Mapping[str, str]],
+        *,
+        attach_state: bool = True,
+    ):
+        """
+        :param app: the ASGI application to wrap
+        :param routes: path template -> {param name -> prefix}, for the path params holding prefixed IDs
+        :param attach_state: whether to attach decoded UUIDs to the scope state
+        """
+        self.app = app
+        self.attach_state = attach_state
+        # templates are only compared against paths with the same number of segments
+        self.templates: typing.Dict[int, typing.List[_PathTemplate]] = {}
+        for template, prefixes in routes.items():
+            compiled = _PathTemplate(template, prefixes)
+            self.templates.setdefault(len(compiled.segments), []).append(compiled)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            segments = scope["path"].strip("/").split("/")
+            for template in self.templates.get(len(segments), ()):
+                if template.matches(segments):
+                    uuids = {}
+                    for index, name, value_type in template.params:
+                        try:
+                            if self.attach_state:
+                                # decoded once, while being validated
+                                uuids[name] = uuid.UUID(int=_validate_to_int(value_type, segments[index])[1])
+                            else:
+                                value_type.validate(segments[index])
+                        except ValueError as e:
+                            await self._reject(send, str(e))
+                            return
+                    if uuids:
+                        scope.setdefault("state", {})["uuidbase62"] = uuids
+                    break
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send: Send, error: str) -> None:
+        status_code = 404
+        body = json.dumps({"detail": f"{http.HTTPStatus(status_code).phrase}; {error}"}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -1,10 +1,11 @@
 import typing
 import uuid
 
+from .compat import get_field_type
 from .types import UUIDBase62
 
 
 class UUIDBase62ModelMixin:
     @classmethod
     def to_uuidbase62(cls, field: str, value: typing.Union[str, uuid.UUID, UUIDBase62]) -> UUIDBase62:
-        return cls.__fields__[field].type_.validate(value)  # type: ignore
+        return get_field_type(cls, field).validate(value)
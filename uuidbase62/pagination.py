@@ -0,0 +1,100 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import typing
+import uuid
+
+from .types import UUIDBase62, _value_type
+
+# cursor fields are separated by ".", which neither prefixed base62 values nor base64url text contain
+_SEPARATOR = "."
+_ASCENDING = "a"
+_DESCENDING = "d"
+# truncated HMAC-SHA256 digest; 128 bits, 22 base64url characters
+_SIGNATURE_BYTES = 16
+
+Secret = typing.Union[str, bytes]
+
+
+class Cursor(typing.NamedTuple):
+    """
+    A decoded keyset pagination cursor: the page boundary, eg. for a `WHERE id > :uuid ORDER BY id` query (`<` when
+    `descending`), or `WHERE (sort_key, id) > (:sort_key, :uuid)` when paginating by another column
+    """
+
+    uuid: uuid.UUID
+    last_id: UUIDBase62
+    sort_key: typing.Optional[str] = None
+    descending: bool = False
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.b64decode(value + "=" * (-len(value) % 4), altchars=b"-_", validate=True)
+
+
+def _sign(body: str, secret: Secret) -> str:
+    key = secret.encode("utf-8") if isinstance(secret, str) else secret
+    return _b64encode(hmac.new(key, body.encode("utf-8"), hashlib.sha256).digest()[:_SIGNATURE_BYTES])
+
+
+def encode_cursor(
+    last_id: typing.Union[UUIDBase62, str, uuid.UUID],
+    prefix: typing.Optional[str] = None,
+    *,
+    sort_key: typing.Optional[str] = None,
+    descending: bool = False,
+    secret: typing.Optional[Secret] = None,
+) -> str:
+    """
+    Opaque, URL safe cursor pointing after `last_id`, eg. `book_7yNMTpVy8ddRxYKGJqtk7e` when ascending by ID
+    :param last_id: the ID of the last item of the page
+    :param prefix: the prefix expected for `last_id`; required when `last_id` is a UUID
+    :param sort_key: the last item's value of the column the page is sorted by, if not the ID
+    :param descending: whether the page is sorted in descending order
+    :param secret: when given, the cursor is signed with an HMAC, so that clients can't forge or alter it
+    :return: the cursor
+    """
+    body = _value_type(prefix).validate(last_id).value
+    if descending or sort_key is not None:
+        body += f"{_SEPARATOR}{_DESCENDING if descending else _ASCENDING}"
+    if sort_key is not None:
+        body += f"{_SEPARATOR}{_b64encode(sort_key.encode('utf-8'))}"
+    if secret is not None:
+        body += f"{_SEPARATOR}{_sign(body, secret)}"
+    return body
+
+
+def decode_cursor(
+    cursor: str, prefix: typing.Optional[str] = None, *, secret: typing.Optional[Secret] = None
+) -> Cursor:
+    """
+    :param cursor: a cursor from `encode_cursor`
+    :param prefix: the prefix expected for the cursor's ID
+    :param secret: the secret the cursor was signed with, if any
+    :return: the decoded cursor; its `uuid` is the page boundary
+    """
+    body = cursor
+    if secret is not None:
+        body, _, signature = cursor.rpartition(_SEPARATOR)
+        if not body or not hmac.compare_digest(
+            signature.encode("utf-8"), _sign(body, secret).encode("ascii")
+        ):
+            raise ValueError("Invalid cursor signature")
+
+    last_id, *fields = body.split(_SEPARATOR)
+    if len(fields) > 2 or (fields and fields[0] not in (_ASCENDING, _DESCENDING)):
+        raise ValueError("Invalid cursor")
+    sort_key = None
+    if len(fields) == 2:
+        try:
+            sort_key = _b64decode(fields[1]).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            raise ValueError("Invalid cursor sort key")
+
+    value = _value_type(prefix).validate(last_id)
+    return Cursor(value.uuid, value, sort_key, bool(fields) and fields[0] == _DESCENDING)
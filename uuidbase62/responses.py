@@ -0,0 +1,78 @@
+import functools
+import json
+import typing
+import uuid
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from .compat import PYDANTIC_V2
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def json_default(obj: typing.Any) -> typing.Any:
+    """
+    `default` hook for JSON encoders, for values they don't handle natively. UUIDBase62 values need no special
+    handling: as `str` subclasses, both `json` and `orjson` write them directly as their prefixed string.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump() if PYDANTIC_V2 else obj.dict()  # type: ignore
+    elif isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: typing.Any) -> bytes:
+    """
+    Compact JSON encoding of `content`, with `orjson` when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        default=json_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: typing.Type[BaseModel]) -> typing.Any:
+    from pydantic import TypeAdapter  # type: ignore
+
+    return TypeAdapter(typing.List[model])  # type: ignore
+
+
+def _render_pydantic_core(content: typing.Any) -> typing.Optional[bytes]:
+    """
+    Render a model, or a list of models of the same type, entirely within pydantic-core (Pydantic v2 only)
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")  # type: ignore
+    elif isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        model = type(content[0])
+        if all(type(item) is model for item in content):
+            return _list_adapter(model).dump_json(content)
+    return None
+
+
+class UUIDBase62JSONResponse(JSONResponse):
+    """
+    JSON response rendered with `orjson` when it is installed (falling back to `json`), that also accepts Pydantic
+    models (and lists of them) as content; with Pydantic v2, those are serialized by pydantic-core directly. Returning
+    model instances wrapped in this response from a path operation skips FastAPI's `jsonable_encoder` pass over every
+    field.
+    """
+
+    def render(self, content: typing.Any) -> bytes:
+        if PYDANTIC_V2:
+            rendered = _render_pydantic_core(content)
+            if rendered is not None:
+                return rendered
+        return dumps(content)
@@ -0,0 +1,113 @@
+import typing
+
+from .middleware import ASGIApp, Receive, Scope, Send
+from .types import UUIDBase62, con_uuidbase62
+
+T = typing.TypeVar("T")
+
+
+class PrefixRouter(typing.Generic[T]):
+    """
+    Maps prefixed base62 IDs to targets (eg. services, or ASGI apps) by their prefix. The prefix of an ID is everything
+    before its last underscore (base62 values never contain one), so a lookup is a single split and hash of the prefix,
+    regardless of how many prefixes are registered.
+    """
+
+    def __init__(self, targets: typing.Optional[typing.Mapping[typing.Union[str, type], T]] = None):
+        self._targets: typing.Dict[str, T] = {}
+        for prefix, target in (targets or {}).items():
+            self.register(prefix, target)
+
+    def register(self, prefix: typing.Union[str, typing.Type[UUIDBase62]], target: T) -> None:
+        """
+        :param prefix: a prefix, or a `con_uuidbase62` type
+        :param target: the target IDs with the prefix map to
+        """
+        if isinstance(prefix, type) and issubclass(prefix, UUIDBase62):
+            if prefix.prefix is None:
+                raise ValueError("Only con_uuidbase62 types with a prefix can be registered")
+            prefix = prefix.prefix
+        # validates the prefix, same as for model fields
+        value_type = con_uuidbase62(prefix=prefix)  # type: ignore
+        self._targets[value_type.prefix] = target  # type: ignore
+
+    def lookup(self, value: str) -> typing.Optional[T]:
+        """
+        :param value: a prefixed base62 ID
+        :return: the target registered for the ID's prefix, or None
+        """
+        prefix = value.prefix if isinstance(value, UUIDBase62) and value.prefix else value.rpartition("_")[0]
+        return self._targets.get(prefix)
+
+    def lookup_many(self, values: typing.Iterable[str]) -> typing.List[typing.Optional[T]]:
+        """
+        :param values: prefixed base62 IDs
+        :return: the target (or None) of each ID, in order
+        """
+        get = self._targets.get
+        return [get(value.rpartition("_")[0]) for value in values]
+
+    def group(self, values: typing.Iterable[str]) -> typing.Dict[typing.Optional[T], typing.List[str]]:
+        """
+        :param values: prefixed base62 IDs
+        :return: the IDs grouped by target; IDs without a registered target are grouped under None
+        """
+        groups: typing.Dict[typing.Optional[T], typing.List[str]] = {}
+        get = self._targets.get
+        for value in values:
+            groups.setdefault(get(value.rpartition("_")[0]), []).append(value)
+        return groups
+
+    def __contains__(self, prefix: object) -> bool:
+        return prefix in self._targets
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+
+class PrefixDispatcher:
+    """
+    ASGI application forwarding each request to the sub-app registered for the prefix of the ID found in its path (by
+    segment position), eg. `/objects/book_7yNMTpVy8ddRxYKGJqtk7e` to the "book" service. The request is forwarded
+    as-is; requests whose ID has no registered sub-app go to `default`, or get a 404.
+    """
+
+    def __init__(
+        self,
+        router: PrefixRouter[ASGIApp],
+        *,
+        segment: int = -1,
+        default: typing.Optional[ASGIApp] = None,
+    ):
+        """
+        :param router: prefix -> ASGI sub-app
+        :param segment: position of the path segment holding the ID; negative positions count from the end
+        :param default: ASGI app for requests without a matching prefix (and for non-HTTP scopes, eg. lifespan)
+        """
+        self.router = router
+        self.segment = segment
+        self.default = default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        app = None
+        if scope["type"] in ("http", "websocket"):
+            segments = scope["path"].strip("/").split("/")
+            try:
+                app = self.router.lookup(segments[self.segment])
+            except IndexError:
+                pass
+
+        app = app or self.default
+        if app is not None:
+            await app(scope, receive, send)
+        elif scope["type"] == "http":
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 404,
+                    "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", b"9")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b"Not Found"})
+        elif scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1000})
@@ -0,0 +1,118 @@
+import typing
+import uuid
+
+from sqlalchemy import types
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+
+from . import base62
+from .types import UUIDBase62, _new_value, _value_type, con_uuidbase62
+
+
+class UUIDBase62Type(types.TypeDecorator):
+    """
+    SQLAlchemy column type storing UUIDBase62 values as UUIDs: a native UUID column on PostgreSQL, BINARY(16)
+    (big-endian) elsewhere. UUIDBase62, UUID and (prefixed) base62/UUID string values can be bound; rows hold values of
+    `con_uuidbase62(prefix=prefix)`, whose UUID is only decoded when accessed.
+
+    Values are read back in the same encoding as `to_uuidbase62` and generated IDs, eg. from `UUIDBase62Generator`.
+
+        class Book(Base):
+            __tablename__ = "books"
+            id = Column(UUIDBase62Type(prefix="book"), primary_key=True, default=UUIDBase62Generator("book"))
+    """
+
+    impl = types.BINARY(16)
+    cache_ok = True
+
+    def __init__(self, prefix: typing.Optional[str] = None):
+        """
+        :param prefix: the prefix of the column's values
+        """
+        super().__init__()
+        if prefix is not None:
+            # validates the prefix, same as for model fields
+            con_uuidbase62(prefix=prefix)
+        self.prefix = prefix
+
+    @property
+    def python_type(self) -> typing.Type[UUIDBase62]:
+        return _value_type(self.prefix)
+
+    def load_dialect_impl(self, dialect: Dialect) -> types.TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(types.BINARY(16))
+
+    def _to_int(self, value: typing.Any) -> int:
+        if isinstance(value, uuid.UUID):
+            return value.int
+        elif isinstance(value, (bytes, bytearray, memoryview)) and len(value) == 16:
+            return int.from_bytes(value, "big")
+        return base62._decode_int(_value_type(self.prefix).validate(value).base62_str)
+
+    def process_bind_param(self, value: typing.Any, dialect: Dialect) -> typing.Any:
+        if value is None:
+            return None
+        num = self._to_int(value)
+        if dialect.name == "postgresql":
+            return uuid.UUID(int=num)
+        return num.to_bytes(16, "big")
+
+    def process_result_value(self, value: typing.Any, dialect: Dialect) -> typing.Optional[UUIDBase62]:
+        if value is None:
+            return None
+        num = value.int if isinstance(value, uuid.UUID) else int.from_bytes(value, "big")
+        base62_str = base62._encode_compact(num)
+        return _new_value(
+            _value_type(self.prefix), f"{self.prefix}_{base62_str}" if self.prefix else base62_str
+        )
+
+    def bind_many(self, values: typing.Iterable[typing.Any], dialect: Dialect) -> typing.List[typing.Any]:
+        """
+        Convert a column of values for a bulk `executemany` in one batch codec call, rather than once per row; the
+        results are bound as-is
+        :param values: values accepted by the column
+        :param dialect: the dialect of the connection, eg. `engine.dialect`
+        :return: driver values (UUIDs, or 16 byte values), in order; None values stay None
+        """
+        values = list(values)
+        value_type = _value_type(self.prefix)
+        present = [value for value in values if value is not None]
+        strs = [
+            value for value in present if not isinstance(value, (uuid.UUID, bytes, bytearray, memoryview))
+        ]
+        packed = typing.cast(
+            bytes, base62.decode_many([value_type.validate(value).base62_str for value in strs], packed=True)
+        )
+        decoded = iter([packed[offset : offset + 16] for offset in range(0, len(packed), 16)])
+
+        native = dialect.name == "postgresql"
+        results: typing.List[typing.Any] = []
+        for value in values:
+            if value is None:
+                results.append(None)
+                continue
+            if isinstance(value, uuid.UUID):
+                raw = value.bytes
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                raw = bytes(value)
+            else:
+                raw = next(decoded)
+            results.append(uuid.UUID(bytes=raw) if native else raw)
+        return results
+
+    def result_many(self, values: typing.Iterable[typing.Any]) -> typing.List[typing.Optional[UUIDBase62]]:
+        """
+        Convert a column of raw driver values (eg. from a `text()` query or a raw DBAPI cursor) in one batch codec
+        call, rather than once per row
+        :param values: UUIDs or 16 byte values
+        :return: UUIDBase62 values, in order; None values stay None
+        """
+        values = list(values)
+        value_type = _value_type(self.prefix)
+        head = f"{self.prefix}_" if self.prefix else ""
+        encoded = iter(base62.encode_many([value for value in values if value is not None]))
+        return [
+            None if value is None else _new_value(value_type, f"{head}{next(encoded)}") for value in values
+        ]
@@ -0,0 +1,131 @@
+import csv
+import io
+import itertools
+import typing
+
+from . import base62
+from .responses import dumps
+from .types import con_uuidbase62
+
+Row = typing.Mapping[str, typing.Any]
+Rows = typing.Union[typing.Iterable[Row], typing.AsyncIterable[Row]]
+Chunks = typing.Union[typing.Iterator[bytes], typing.AsyncIterator[bytes]]
+
+
+def _convert_batch(batch: typing.List[Row], prefixes: typing.Mapping[str, str]) -> typing.List[typing.Dict]:
+    """
+    Copy a batch of rows, replacing UUID (or 16 byte) values in the `prefixes` columns by their prefixed base62 string;
+    each column is encoded with a single `base62.encode_many` call
+    """
+    converted = [dict(row) for row in batch]
+    for column, prefix in prefixes.items():
+        targets = [row for row in converted if row.get(column) is not None]
+        if not targets:
+            continue
+        encoded = base62.encode_many([row[column] for row in targets])
+        for row, base62_str in zip(targets, encoded):
+            row[column] = f"{prefix}_{base62_str}"
+    return converted
+
+
+def _batches(rows: typing.Iterable[Row], batch_size: int) -> typing.Iterator[typing.List[Row]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+async def _abatches(
+    rows: typing.AsyncIterable[Row], batch_size: int
+) -> typing.AsyncIterator[typing.List[Row]]:
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _stream(
+    rows: Rows,
+    prefixes: typing.Mapping[str, str],
+    batch_size: int,
+    render: typing.Callable[[typing.List[typing.Dict]], bytes],
+    head: bytes = b"",
+) -> Chunks:
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    for prefix in prefixes.values():
+        # validates the prefix, same as for model fields
+        con_uuidbase62(prefix=prefix)
+
+    if hasattr(rows, "__aiter__"):
+
+        async def agenerate() -> typing.AsyncIterator[bytes]:
+            if head:
+                yield head
+            async for batch in _abatches(rows, batch_size):  # type: ignore
+                yield render(_convert_batch(batch, prefixes))
+
+        return agenerate()
+
+    def generate() -> typing.Iterator[bytes]:
+        if head:
+            yield head
+        for batch in _batches(rows, batch_size):  # type: ignore
+            yield render(_convert_batch(batch, prefixes))
+
+    return generate()
+
+
+def ndjson_stream(rows: Rows, prefixes: typing.Mapping[str, str], *, batch_size: int = 1000) -> Chunks:
+    """
+    Stream rows as newline delimited JSON, converting UUID columns to prefixed base62 strings on the fly. Only one
+    batch of rows is held in memory at a time; the result can be passed directly to FastAPI's `StreamingResponse`.
+    :param rows: sync or async iterable of mappings (eg. database rows)
+    :param prefixes: column name -> prefix, for the columns holding UUID (or 16 byte) values
+    :param batch_size: number of rows converted, and rendered into a single chunk, at a time
+    :return: iterator (or async iterator, for async `rows`) of encoded chunks
+    """
+
+    def render(batch: typing.List[typing.Dict]) -> bytes:
+        return b"".join([dumps(row) + b"\n" for row in batch])
+
+    return _stream(rows, prefixes, batch_size, render)
+
+
+def csv_stream(
+    rows: Rows,
+    prefixes: typing.Mapping[str, str],
+    fieldnames: typing.Sequence[str],
+    *,
+    header: bool = True,
+    batch_size: int = 1000,
+    **fmtparams: typing.Any,
+) -> Chunks:
+    """
+    Stream rows as CSV, converting UUID columns to prefixed base62 strings on the fly. Only one batch of rows is held
+    in memory at a time; the result can be passed directly to FastAPI's `StreamingResponse`.
+    :param rows: sync or async iterable of mappings (eg. database rows)
+    :param prefixes: column name -> prefix, for the columns holding UUID (or 16 byte) values
+    :param fieldnames: the columns written, in order
+    :param header: whether to write a header row first
+    :param batch_size: number of rows converted, and rendered into a single chunk, at a time
+    :param fmtparams: formatting parameters passed on to `csv.DictWriter`
+    :return: iterator (or async iterator, for async `rows`) of encoded chunks
+    """
+
+    def render(batch: typing.Optional[typing.List[typing.Dict]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames, **fmtparams)
+        if batch is None:
+            writer.writeheader()
+        else:
+            writer.writerows(batch)
+        return buffer.getvalue().encode("utf-8")
+
+    return _stream(rows, prefixes, batch_size, render, head=render(None) if header else b"")
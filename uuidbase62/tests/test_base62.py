@@ -73,3 +73,141 @@ def test_type_encode__with_invalid_uuid_str__raises_error():
 def test_type_encode__with_invalid_uuid_any__raises_error():
     with pytest.raises(ValueError):
         base62.encode(None)
+
+
+def _legacy_encode(num):
+    # the original per-digit implementation, kept here to guarantee output compatibility
+    if num == 0:
+        return base62.BASE62[0]
+    arr = []
+    while num:
+        num, rem = divmod(num, base62.BASE62_LENGTH)
+        arr.append(base62.BASE62[rem])
+    arr.reverse()
+    return "".join(arr)
+
+
+@pytest.mark.parametrize(
+    "uuid_",
+    [
+        uuid.UUID(int=0),
+        uuid.UUID(int=1),
+        uuid.UUID(int=61),
+        uuid.UUID(int=62),
+        uuid.UUID(int=62**11 - 1),
+        uuid.UUID(int=62**11),
+        uuid.UUID(int=2**64),
+        uuid.UUID(int=2**128 - 1),
+        *[uuid.UUID(int=(i * 0x9E3779B97F4A7C15F39CC0605CEDC834) % 2**128) for i in range(1, 50)],
+    ],
+)
+def test_type_encode_decode__matches_legacy_encoding(uuid_):
+    encoded_str = base62.encode(uuid_)
+
+    assert encoded_str == _legacy_encode(uuid_.int)
+    assert base62.decode(encoded_str) == uuid_
+    assert base62.decode(encoded_str.rjust(base62.BASE62_WIDTH, "0")) == uuid_
+
+
+def test_type_encode__with_fixed_width__zero_pads_value():
+    uuid_ = uuid.UUID(int=61)
+
+    assert base62.encode(uuid_, fixed_width=True) == "0" * 21 + "Z"
+    assert base62.encode(str(uuid_), fixed_width=True) == "0" * 21 + "Z"
+    assert (
+        base62.encode(con_uuidbase62(prefix="my_prefix").validate(uuid_), fixed_width=True) == "0" * 21 + "Z"
+    )
+    assert base62.decode(base62.encode(uuid_, fixed_width=True)) == uuid_
+
+
+def test_sort_key__with_padded_and_compact_values__matches_numeric_order():
+    ints = sorted({0, 9, 10, 35, 36, 61, 62, 2**128 - 1, *BATCH_INTS})
+    compact = [base62.encode(uuid.UUID(int=num)) for num in ints]
+    padded = [base62.encode(uuid.UUID(int=num), fixed_width=True) for num in ints]
+
+    # the alphabet isn't in ASCII order, so neither form sorts numerically as-is
+    assert sorted(padded) != padded
+    assert sorted(compact + padded, key=base62.sort_key) == [
+        value for pair in zip(compact, padded) for value in pair
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "invalid-value",
+        "1WfVMU43m1UQUtAHULNBz!",
+        "1" * (base62.BASE62_WIDTH + 1),
+        "Z" * base62.BASE62_WIDTH,
+    ],
+)
+def test_type_decode__with_invalid_str__raises_error(value):
+    with pytest.raises(ValueError):
+        base62.decode(value)
+
+
+BATCH_INTS = [(i * 0x9E3779B97F4A7C15F39CC0605CEDC834) % 2**128 for i in range(1, 300)]
+BATCH_UUIDS = [
+    uuid.UUID(int=0),
+    uuid.UUID(int=61),
+    uuid.UUID(int=2**128 - 1),
+    *[uuid.UUID(int=num) for num in BATCH_INTS],
+]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def batch_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(base62, "NUMPY_MIN_BATCH", 0)
+        monkeypatch.setattr(base62, "HAS_SPEEDUPS", False)
+    else:
+        monkeypatch.setattr(base62, "_get_numpy", lambda: None)
+    return request.param
+
+
+def test_encode_many__with_uuids__matches_encode(batch_backend):
+    assert base62.encode_many(BATCH_UUIDS) == [base62.encode(uuid_) for uuid_ in BATCH_UUIDS]
+
+
+def test_encode_many__with_fixed_width__matches_encode(batch_backend):
+    expected = [base62.encode(uuid_, fixed_width=True) for uuid_ in BATCH_UUIDS]
+
+    assert base62.encode_many(BATCH_UUIDS, fixed_width=True) == expected
+
+
+def test_encode_many__with_packed_buffer_and_bytes__matches_encode(batch_backend):
+    packed = b"".join(uuid_.bytes for uuid_ in BATCH_UUIDS)
+    expected = [base62.encode(uuid_) for uuid_ in BATCH_UUIDS]
+
+    assert base62.encode_many(packed) == expected
+    assert base62.encode_many(memoryview(packed)) == expected
+    assert base62.encode_many([uuid_.bytes for uuid_ in BATCH_UUIDS]) == expected
+
+
+def test_encode_many__with_sep__returns_joined_str(batch_backend):
+    result = base62.encode_many(BATCH_UUIDS, sep="\n")
+
+    assert result == "\n".join(base62.encode(uuid_) for uuid_ in BATCH_UUIDS)
+
+
+def test_encode_many__with_invalid_values__raises_error(batch_backend):
+    with pytest.raises(ValueError):
+        base62.encode_many(b"\x00" * 17)
+    with pytest.raises(ValueError):
+        base62.encode_many([uuid.uuid4(), "not-a-uuid"])
+
+
+def test_decode_many__with_valid_values__matches_decode(batch_backend):
+    encoded = [base62.encode(uuid_) for uuid_ in BATCH_UUIDS]
+
+    assert base62.decode_many(encoded) == BATCH_UUIDS
+    assert base62.decode_many(iter(encoded), packed=True) == b"".join(uuid_.bytes for uuid_ in BATCH_UUIDS)
+
+
+@pytest.mark.parametrize(
+    "value", ["invalid-value", "é", "1" * (base62.BASE62_WIDTH + 1), "Z" * base62.BASE62_WIDTH]
+)
+def test_decode_many__with_invalid_value__raises_error(batch_backend, value):
+    with pytest.raises(ValueError):
+        base62.decode_many(["0", value])
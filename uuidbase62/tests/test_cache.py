@@ -0,0 +1,112 @@
+import threading
+import uuid
+
+import pytest
+
+from uuidbase62 import cache, cache_info, con_uuidbase62, disable_cache, enable_cache
+from uuidbase62.cache import UUIDBase62Cache
+from uuidbase62.types import to_uuidbase62
+
+
+@pytest.fixture
+def lru_cache():
+    active_cache = enable_cache(maxsize=2)
+    yield active_cache
+    disable_cache()
+
+
+def test_cache__disabled_by_default__returns_new_instances():
+    assert cache.active_cache is None
+    assert cache_info() is None
+
+    assert to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e") is not to_uuidbase62(
+        "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    )
+
+
+def test_cache__with_repeated_value__returns_cached_instance(lru_cache):
+    result = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    result2 = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+
+    assert result is result2
+    assert result.uuid == uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+    assert cache_info() == (1, 1, 0, 2, 1)
+
+
+def test_cache__with_different_prefix__is_a_separate_entry(lru_cache):
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    result = to_uuidbase62(uuid_, "my_prefix")
+    result2 = to_uuidbase62(uuid_, "other_prefix")
+
+    assert result == "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert result2 == "other_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert cache_info().misses == 2
+
+
+def test_cache__beyond_maxsize__evicts_least_recently_used(lru_cache):
+    first = to_uuidbase62(uuid.UUID(int=1), "a")
+    to_uuidbase62(uuid.UUID(int=2), "a")
+    # touch the first value, so that the second is least recently used
+    to_uuidbase62(uuid.UUID(int=1), "a")
+    to_uuidbase62(uuid.UUID(int=3), "a")
+
+    info = cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+    assert to_uuidbase62(uuid.UUID(int=1), "a") is first
+    assert lru_cache.get((uuid.UUID(int=2), "a")) is None
+
+
+def test_cache__with_invalid_value__is_not_cached(lru_cache):
+    with pytest.raises(ValueError):
+        to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "different_prefix")
+
+    assert cache_info().currsize == 0
+
+
+def test_cache__cached_values__are_immutable(lru_cache):
+    result = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e")
+
+    with pytest.raises(AttributeError):
+        result.prefix = "other"
+    with pytest.raises(AttributeError):
+        del result.uuid
+
+
+def test_cache__with_concurrent_threads__keeps_consistent_counts():
+    active_cache = UUIDBase62Cache(maxsize=50)
+    uuids = [uuid.UUID(int=i) for i in range(100)]
+
+    def worker():
+        for uuid_ in uuids:
+            key = (uuid_, "a")
+            if active_cache.get(key) is None:
+                active_cache.put(key, to_uuidbase62(uuid_, "a"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = active_cache.cache_info()
+    assert info.hits + info.misses == 800
+    assert info.currsize == 50
+    assert len(active_cache) == 50
+
+
+def test_cache__with_invalid_maxsize__raises_error():
+    with pytest.raises(ValueError):
+        UUIDBase62Cache(maxsize=0)
+
+
+def test_con_uuidbase62_validate__with_cache_enabled__skips_cache_for_well_formed_values(lru_cache):
+    value_type = con_uuidbase62(prefix="book")
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    assert value_type.validate("book_7yNMTpVy8ddRxYKGJqtk7e") == "book_7yNMTpVy8ddRxYKGJqtk7e"
+    assert value_type.validate(uuid_) == "book_7yNMTpVy8ddRxYKGJqtk7e"
+    assert lru_cache.cache_info().misses == 0
+    assert value_type.validate(str(uuid_)) == "book_7yNMTpVy8ddRxYKGJqtk7e"
+    assert lru_cache.cache_info().misses == 1
@@ -0,0 +1,141 @@
+import io
+import json
+import uuid
+
+import pytest
+
+from uuidbase62 import Base62MissingPrefix
+from uuidbase62.cli import convert_file, main
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+UUIDS = [uuid.UUID(int=(index * 0x9E3779B97F4A7C15F39CC0605CEDC834) % 2**128) for index in range(1, 301)]
+CSV = 'id,title,author_id\r\nf8711c37-c1d1-4961-ba3c-98cdc5b4fda8,"Red, Mars",f8711c37c1d14961ba3c98cdc5b4fda8\r\n'
+ENCODED_CSV = (
+    'id,title,author_id\r\nbook_7yNMTpVy8ddRxYKGJqtk7e,"Red, Mars",author_7yNMTpVy8ddRxYKGJqtk7e\r\n'
+)
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content.encode("utf-8"))
+    return str(path)
+
+
+def convert(path, columns, **kwargs):
+    output = io.BytesIO()
+    count = convert_file(path, output, columns, **kwargs)
+    return count, output.getvalue().decode("utf-8")
+
+
+def test_convert_file__with_csv__encodes_columns(tmp_path):
+    path = write(tmp_path, "books.csv", CSV)
+
+    assert convert(path, {"id": "book", "author_id": "author"}, workers=1) == (1, ENCODED_CSV)
+
+
+def test_convert_file__with_encoded_csv__decodes_columns(tmp_path):
+    path = write(tmp_path, "books.csv", ENCODED_CSV)
+
+    count, output = convert(path, {"id": "book", "author_id": None}, decode=True, workers=1)
+
+    assert count == 1
+    assert output == ENCODED_CSV.replace("book_7yNMTpVy8ddRxYKGJqtk7e", str(UUID_)).replace(
+        "author_7yNMTpVy8ddRxYKGJqtk7e", str(UUID_)
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_convert_file__with_many_chunks__preserves_row_order(tmp_path, workers):
+    lines = [f"{index},{uuid_},\n" for index, uuid_ in enumerate(UUIDS)]
+    path = write(tmp_path, "books.csv", "row,id,empty\n" + "".join(lines))
+
+    count, output = convert(path, {"id": "book"}, workers=workers, chunk_size=500)
+    encoded_path = write(tmp_path, "encoded.csv", output)
+    decoded_count, decoded = convert(
+        encoded_path, {"id": "book"}, decode=True, workers=workers, chunk_size=500
+    )
+
+    assert count == decoded_count == len(UUIDS)
+    rows = [line.split(",") for line in output.splitlines()[1:]]
+    assert [row[0] for row in rows] == [str(index) for index in range(len(UUIDS))]
+    assert all(row[1].startswith("book_") and row[2] == "" for row in rows)
+    assert decoded == "row,id,empty\n" + "".join(lines)
+
+
+def test_convert_file__with_ndjson__converts_keys_and_keeps_others(tmp_path):
+    records = [{"id": str(UUID_), "tags": ["a"], "author_id": None}, {"title": "Blue Mars"}]
+    path = write(tmp_path, "books.ndjson", "".join(json.dumps(record) + "\n" for record in records))
+
+    count, output = convert(path, {"id": "book", "author_id": "author"}, workers=1)
+
+    assert count == 2
+    assert [json.loads(line) for line in output.splitlines()] == [
+        {"id": "book_7yNMTpVy8ddRxYKGJqtk7e", "tags": ["a"], "author_id": None},
+        {"title": "Blue Mars"},
+    ]
+
+
+@pytest.mark.parametrize("lineterminator", ["\n", "\r\n"])
+def test_convert_file__with_ndjson_line_separators_in_strings__keeps_records_whole(tmp_path, lineterminator):
+    records = [{"id": str(UUID_), "title": "Red\u2028Mars\x85\x0c\x1c"}, {"title": "Blue\u2029Mars"}]
+    content = "".join(json.dumps(record, ensure_ascii=False) + lineterminator for record in records)
+    path = write(tmp_path, "books.ndjson", content)
+
+    count, output = convert(path, {"id": "book"}, workers=1)
+
+    assert count == 2
+    assert output.endswith(lineterminator)
+    assert [json.loads(line) for line in output.split(lineterminator)[:-1]] == [
+        {"id": "book_7yNMTpVy8ddRxYKGJqtk7e", "title": "Red\u2028Mars\x85\x0c\x1c"},
+        {"title": "Blue\u2029Mars"},
+    ]
+
+
+def test_convert_file__with_empty_file__writes_nothing(tmp_path):
+    path = write(tmp_path, "books.jsonl", "")
+
+    assert convert(path, {"id": "book"}) == (0, "")
+
+
+@pytest.mark.parametrize(
+    "name,content,columns,kwargs,message",
+    [
+        ("books.txt", CSV, {"id": "book"}, {}, "Unknown file format"),
+        ("books.csv", CSV, {"id": None}, {}, "Every column requires a prefix"),
+        ("books.csv", CSV, {"missing": "book"}, {}, "Columns not found in the header: missing"),
+        ("books.csv", CSV, {"title": "book"}, {}, "Value must be a UUID: 'Red, Mars'"),
+        ("books.csv", ENCODED_CSV, {"id": "author"}, {"decode": True}, "expected 'author' prefix"),
+        ("books.csv", "id\nbook_abc!\n", {"id": "book"}, {"decode": True}, "invalid characters: 'book_abc!'"),
+        ("books.ndjson", '{"id": 1}\n', {"id": "book"}, {}, "Value must be a UUID: 1"),
+    ],
+)
+def test_convert_file__with_invalid_input__raises(tmp_path, name, content, columns, kwargs, message):
+    path = write(tmp_path, name, content)
+
+    with pytest.raises(ValueError) as e:
+        convert(path, columns, workers=1, **kwargs)
+    assert message in str(e.value)
+
+
+def test_convert_file__with_invalid_prefix__raises(tmp_path):
+    path = write(tmp_path, "books.csv", CSV)
+
+    with pytest.raises(Base62MissingPrefix):
+        convert(path, {"id": "book-id"})
+
+
+def test_main__with_output_file__converts_and_reports_rate(tmp_path, capsys):
+    path = write(tmp_path, "books.csv", CSV)
+    output = tmp_path / "out.csv"
+
+    assert main([path, "-c", "id=book", "-c", "author_id=author", "-o", str(output), "-w", "1"]) == 0
+
+    assert output.read_bytes().decode("utf-8") == ENCODED_CSV
+    assert "1 rows in" in capsys.readouterr().err
+
+
+def test_main__with_invalid_input__reports_error(tmp_path, capsys):
+    path = write(tmp_path, "books.csv", CSV)
+
+    assert main([path, "-c", "title=book", "-o", str(tmp_path / "out.csv")]) == 1
+    assert capsys.readouterr().err == "error: Value must be a UUID: 'Red, Mars'\n"
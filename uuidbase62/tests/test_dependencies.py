@@ -2,14 +2,19 @@ import uuid
 
 import fastapi
 import pytest
+from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from uuidbase62 import (
+    ParamSource,
     UUIDBase62,
+    UUIDBase62List,
     UUIDBase62ModelMixin,
+    base62,
     con_uuidbase62,
     get_validated_uuidbase62,
     get_validated_uuidbase62_by_model,
+    get_validated_uuidbase62_list,
 )
 
 
@@ -71,3 +76,137 @@ def test_get_validated_uuidbase62_by_model_function__with_invalid_input__returns
         func(value)
 
     assert e.value.status_code == 404
+
+
+def _list_client(**kwargs):
+    app = fastapi.FastAPI()
+
+    @app.get("/books")
+    def get_books(
+        ids: UUIDBase62List = fastapi.Depends(get_validated_uuidbase62_list("ids", "book", **kwargs))
+    ):
+        return {"ids": list(ids), "uuids": [str(uuid_) for uuid_ in ids.uuids]}
+
+    return TestClient(app)
+
+
+def test_get_validated_uuidbase62_list_function__with_valid_query__returns_values_and_uuids():
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    response = _list_client().get(
+        "/books", params=[("ids", "book_7yNMTpVy8ddRxYKGJqtk7e,book_0"), ("ids", str(uuid_))]
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "ids": ["book_7yNMTpVy8ddRxYKGJqtk7e", "book_0", "book_7yNMTpVy8ddRxYKGJqtk7e"],
+        "uuids": [str(uuid_), str(uuid.UUID(int=0)), str(uuid_)],
+    }
+
+
+def test_get_validated_uuidbase62_list_function__with_valid_query__decodes_each_value_once(monkeypatch):
+    decode_int = base62._decode_int
+    calls = []
+    monkeypatch.setattr(base62, "_decode_int", lambda value: calls.append(value) or decode_int(value))
+
+    response = _list_client().get("/books", params={"ids": "book_7yNMTpVy8ddRxYKGJqtk7e,book_0,book_1"})
+
+    assert response.status_code == 200
+    assert calls == ["7yNMTpVy8ddRxYKGJqtk7e", "0", "1"]
+
+
+def test_get_validated_uuidbase62_list_function__with_invalid_values__reports_all_errors():
+    response = _list_client().get("/books", params={"ids": "book_0,author_0,book_7yNMTpVy8ddRxYKGJqtk7!"})
+
+    assert response.status_code == 422
+    assert [(error["loc"], error["input"]) for error in response.json()["detail"]] == [
+        (["query", "ids", 1], "author_0"),
+        (["query", "ids", 2], "book_7yNMTpVy8ddRxYKGJqtk7!"),
+    ]
+
+
+def test_get_validated_uuidbase62_list_function__with_deduplicate__drops_repeated_values():
+    response = _list_client(deduplicate=True).get("/books", params={"ids": "book_1,book_0,book_1"})
+
+    assert response.json()["ids"] == ["book_1", "book_0"]
+
+
+def test_get_validated_uuidbase62_list_function__beyond_max_count__fails():
+    response = _list_client(max_count=2).get("/books", params={"ids": "book_1,book_0,book_2"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {
+            "loc": ["query", "ids"],
+            "msg": "At most 2 values are accepted",
+            "type": "value_error",
+            "input": ["book_1", "book_0", "book_2"],
+        }
+    ]
+
+
+def test_get_validated_uuidbase62_list_function__with_deduplicate__applies_max_count_to_distinct_values():
+    client = _list_client(deduplicate=True, max_count=3)
+
+    response = client.get("/books", params={"ids": "book_1,book_1,book_0,book_1"})
+
+    assert response.status_code == 200
+    assert response.json()["ids"] == ["book_1", "book_0"]
+
+
+def test_get_validated_uuidbase62_list_function__with_header_and_body_sources__works():
+    app = fastapi.FastAPI()
+
+    @app.post("/books")
+    def post_books(
+        header_ids=fastapi.Depends(get_validated_uuidbase62_list("x-book-ids", "book", ParamSource.HEADER)),
+        body_ids=fastapi.Depends(get_validated_uuidbase62_list("ids", "book", ParamSource.BODY)),
+    ):
+        return {"header": list(header_ids), "body": list(body_ids)}
+
+    response = TestClient(app).post("/books", headers={"x-book-ids": "book_1,book_2"}, json=["book_3"])
+
+    assert response.status_code == 200
+    assert response.json() == {"header": ["book_1", "book_2"], "body": ["book_3"]}
+
+
+def test_get_validated_uuidbase62_list_function__with_path_source__raises_error():
+    with pytest.raises(ValueError):
+        get_validated_uuidbase62_list("ids", "book", ParamSource.PATH)
+
+
+def test_dependency_functions__with_same_arguments__return_same_callable():
+    assert get_validated_uuidbase62("item_id", "my_prefix") is get_validated_uuidbase62(
+        "item_id", prefix="my_prefix", param_source=ParamSource.PATH
+    )
+    assert get_validated_uuidbase62("item_id", "my_prefix") is not get_validated_uuidbase62(
+        "item_id", "other"
+    )
+    assert get_validated_uuidbase62_by_model(
+        Item, "client_id", "item_id"
+    ) is get_validated_uuidbase62_by_model(Item, "client_id", "item_id")
+    assert get_validated_uuidbase62_list("ids", "book") is get_validated_uuidbase62_list("ids", "book")
+    assert get_validated_uuidbase62_list("ids", "book") is not get_validated_uuidbase62_list(
+        "ids", "book", deduplicate=True
+    )
+
+
+def test_dependency_functions__used_twice_in_route__share_dependant_call():
+    app = fastapi.FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(
+        a=fastapi.Depends(get_validated_uuidbase62("item_id", "my_prefix")),
+        b=fastapi.Depends(get_validated_uuidbase62("item_id", "my_prefix")),
+    ):
+        return {"a": a, "b": b}
+
+    response = TestClient(app).get("/items/my_prefix_7yNMTpVy8ddRxYKGJqtk7e")
+    first, second = app.routes[-1].dependant.dependencies
+
+    assert response.json() == {
+        "a": "my_prefix_7yNMTpVy8ddRxYKGJqtk7e",
+        "b": "my_prefix_7yNMTpVy8ddRxYKGJqtk7e",
+    }
+    # FastAPI caches dependency results per request by their call, so the value is only validated once
+    assert first.call is second.call
@@ -0,0 +1,205 @@
+import asyncio
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from uuidbase62 import Base62MissingPrefix, base62, con_uuidbase62, generators
+from uuidbase62.types import UUIDBase62, to_uuidbase62
+
+
+def test_uuid7__returns_version_7_uuid_with_current_timestamp():
+    before = time.time_ns() // 1_000_000
+    result = generators.uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert result.version == 7
+    assert result.variant == uuid.RFC_4122
+    assert before <= result.int >> 80 <= after
+
+
+def test_uuid7__within_same_millisecond__is_strictly_increasing(monkeypatch):
+    monkeypatch.setattr(generators, "_last_timestamp", -1)
+    monkeypatch.setattr(generators.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    results = [generators.uuid7() for _ in range(1000)]
+
+    assert results == sorted(set(results))
+    assert {result.int >> 80 for result in results} == {1_700_000_000_000}
+
+
+def test_uuid7__with_clock_going_backwards__stays_increasing(monkeypatch):
+    first = generators.uuid7()
+    monkeypatch.setattr(generators.time, "time_ns", lambda: 0)
+
+    assert generators.uuid7() > first
+
+
+def test_uuid7__with_exhausted_sequence__moves_to_next_millisecond(monkeypatch):
+    monkeypatch.setattr(generators, "_last_timestamp", -1)
+    monkeypatch.setattr(generators.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    generators.uuid7()
+    monkeypatch.setattr(generators, "_last_sequence", (1 << generators._SEQUENCE_BITS) - 1)
+
+    result = generators.uuid7()
+
+    assert result.int >> 80 == 1_700_000_000_001
+    assert result.version == 7
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_uuid7__after_fork__does_not_repeat_parent_values(monkeypatch):
+    monkeypatch.setattr(generators, "_last_timestamp", -1)
+    monkeypatch.setattr(generators.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    generators.uuid7()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write_fd, generators.uuid7().bytes)
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = uuid.UUID(bytes=os.read(read_fd, 16))
+    parent = generators.uuid7()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    assert child != parent
+
+
+def test_generate_uuidbase62__with_prefix__returns_value_of_type_encoded_as_to_uuidbase62():
+    result = generators.generate_uuidbase62("my_prefix")
+
+    assert type(result) is con_uuidbase62(prefix="my_prefix")
+    assert result.prefix == "my_prefix"
+    assert result.uuid.version == 7
+    assert to_uuidbase62(result.uuid, "my_prefix") == result
+    assert con_uuidbase62(prefix="my_prefix").validate(result.uuid) == result
+    assert con_uuidbase62(prefix="my_prefix").validate(result) == result
+    assert con_uuidbase62(prefix="my_prefix").validate(result.value) == result
+
+
+def test_generate_uuidbase62__with_no_prefix__returns_plain_value():
+    result = generators.generate_uuidbase62()
+
+    assert type(result) is UUIDBase62
+    assert to_uuidbase62(result.uuid) == result
+
+
+def test_generate_uuidbase62__with_invalid_prefix__raises_error():
+    with pytest.raises(Base62MissingPrefix):
+        generators.generate_uuidbase62("my-prefix")
+
+
+def test_generate__sorts_in_generation_order():
+    value_type = con_uuidbase62(prefix="my_prefix")
+
+    results = [value_type.generate() for _ in range(1000)]
+
+    assert sorted(results, key=lambda value: base62.sort_key(value.base62_str)) == results
+    assert [result.uuid for result in results] == sorted(result.uuid for result in results)
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuidbase62_generator__returns_unique_values_of_version(version):
+    generate = generators.UUIDBase62Generator("my_prefix", version=version, pool_size=256)
+
+    results = [generate() for _ in range(100)] + generate.generate_many(1000)
+
+    assert len(set(results)) == len(results)
+    assert all(type(result) is con_uuidbase62(prefix="my_prefix") for result in results)
+    assert {result.uuid.version for result in results} == {version}
+    assert {result.uuid.variant for result in results} == {uuid.RFC_4122}
+    assert {uuid_.version for uuid_ in generate.uuids(10)} == {version}
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuidbase62_generator__encodes_same_as_to_uuidbase62(version):
+    generate = generators.UUIDBase62Generator("my_prefix", version=version)
+
+    for result in generate.generate_many(100) + [generate() for _ in range(10)]:
+        assert to_uuidbase62(result.uuid, "my_prefix") == result
+
+
+def test_uuidbase62_generator__with_version_7__returns_increasing_values():
+    generate = generators.UUIDBase62Generator(version=7)
+
+    results = generate.generate_many(1000) + [generate() for _ in range(100)] + generate.generate_many(1000)
+
+    assert results == sorted(results, key=base62.sort_key)
+
+
+def test_uuidbase62_generator__with_invalid_arguments__raises_error():
+    with pytest.raises(ValueError):
+        generators.UUIDBase62Generator(version=1)
+    with pytest.raises(Base62MissingPrefix):
+        generators.UUIDBase62Generator("my-prefix")
+
+
+def test_uuidbase62_generator__draws_randomness_in_blocks(monkeypatch):
+    calls = []
+    os_urandom = os.urandom
+
+    def urandom(count):
+        calls.append(count)
+        return os_urandom(count)
+
+    monkeypatch.setattr(generators.os, "urandom", urandom)
+    generate = generators.UUIDBase62Generator(version=4, pool_size=1600)
+
+    generate.generate_many(50)
+    generate.generate_many(50)
+    generate()
+
+    assert calls == [1600, 1600]
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuidbase62_generator__shared_between_threads__returns_unique_values(version):
+    generate = generators.UUIDBase62Generator(version=version, pool_size=256)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        batches = list(executor.map(lambda _: [generate() for _ in range(500)], range(16)))
+
+    results = [result for batch in batches for result in batch]
+    assert len(set(results)) == len(results)
+    if version == 7:
+        assert all(batch == sorted(batch, key=base62.sort_key) for batch in batches)
+
+
+def test_uuidbase62_generator__shared_between_tasks__returns_unique_values():
+    generate = generators.UUIDBase62Generator(version=4, pool_size=256)
+
+    async def task():
+        results = []
+        for _ in range(100):
+            results.append(generate())
+            await asyncio.sleep(0)
+        return results
+
+    async def main():
+        return await asyncio.gather(*[task() for _ in range(20)])
+
+    results = [result for batch in asyncio.run(main()) for result in batch]
+    assert len(set(results)) == len(results)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_uuidbase62_generator__after_fork__does_not_repeat_parent_values():
+    generate = generators.UUIDBase62Generator(version=4)
+    generate()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write_fd, generate().uuid.bytes)
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = uuid.UUID(bytes=os.read(read_fd, 16))
+    parent = generate()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    assert child != parent.uuid
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+import uuidbase62
+
+# modules only needed by the FastAPI and Pydantic integrations
+HEAVY_MODULES = ("fastapi", "starlette", "pydantic", "pydantic_core")
+# cumulative import time budget of the codec and types modules, in microseconds; importing FastAPI alone takes several
+# times as long
+IMPORT_BUDGET_US = 100_000
+
+
+def import_times(statement):
+    """
+    :return: cumulative import time (us) of each module imported by `statement`, from `python -X importtime`
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement", ["import uuidbase62.base62", "import uuidbase62.types", "import uuidbase62"]
+)
+def test_import__of_codec_and_types__skips_fastapi_and_pydantic(statement):
+    times = import_times(statement)
+
+    assert "uuidbase62" in times
+    assert not [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+
+
+def test_import__of_types__is_within_budget():
+    times = import_times("import uuidbase62.types")
+
+    assert times["uuidbase62.types"] < IMPORT_BUDGET_US
+
+
+def test_import__of_public_names__resolves_lazily():
+    code = (
+        "import sys, uuidbase62\n"
+        "uuidbase62.UUIDBase62, uuidbase62.enable_cache\n"
+        "assert 'fastapi' not in sys.modules\n"
+        "uuidbase62.get_validated_uuidbase62\n"
+        "assert 'fastapi' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package__submodules__resolve_without_explicit_import():
+    code = (
+        "import sys, uuidbase62\n"
+        "assert uuidbase62.base62.encode is sys.modules['uuidbase62.base62'].encode\n"
+        "assert uuidbase62.types.UUIDBase62 is uuidbase62.UUIDBase62\n"
+        "assert 'fastapi' not in sys.modules\n"
+        "assert uuidbase62.dependencies.get_validated_uuidbase62 is uuidbase62.get_validated_uuidbase62\n"
+        "assert 'base62' in dir(uuidbase62) and 'base62' not in uuidbase62.__all__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package__public_names__are_listed_and_resolve():
+    for name in uuidbase62.__all__:
+        assert getattr(uuidbase62, name) is not None
+        assert name in dir(uuidbase62)
+    with pytest.raises(AttributeError):
+        uuidbase62.missing_name
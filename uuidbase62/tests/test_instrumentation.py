@@ -0,0 +1,183 @@
+import uuid
+
+import fastapi
+import pytest
+from fastapi.testclient import TestClient
+
+from uuidbase62 import (
+    UUIDBase62,
+    base62,
+    con_uuidbase62,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_validated_uuidbase62,
+    get_validated_uuidbase62_list,
+    instrumentation,
+)
+from uuidbase62.instrumentation import CounterSink, PrometheusSink, Sink, failure_reason
+from uuidbase62.types import to_uuidbase62
+
+
+@pytest.fixture
+def counters():
+    sink = enable_instrumentation(CounterSink(), sample_rate=1)
+    yield sink
+    disable_instrumentation()
+
+
+def test_instrumentation__disabled_by_default__records_nothing():
+    sink = CounterSink()
+
+    to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    base62.decode("7yNMTpVy8ddRxYKGJqtk7e")
+
+    assert instrumentation.active_sink is None
+    assert not sink.calls
+
+
+def test_instrumentation__with_to_uuidbase62__records_calls_and_failure_reasons(counters):
+    to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    con_uuidbase62(prefix="my_prefix").validate(uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8"))
+    for value in ("other_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix_7yNMTpVy8ddRxYKGJqt!!", 1234):
+        with pytest.raises(ValueError):
+            to_uuidbase62(value, "my_prefix")
+
+    assert counters.calls["to_uuidbase62", "my_prefix"] == 5
+    assert counters.failures == {
+        ("to_uuidbase62", "my_prefix", "prefix_mismatch"): 1,
+        ("to_uuidbase62", "my_prefix", "invalid_characters"): 1,
+        ("to_uuidbase62", "my_prefix", "invalid_type"): 1,
+    }
+    assert counters.timings["to_uuidbase62", "my_prefix", False].samples == 2
+    assert counters.timings["to_uuidbase62", "my_prefix", True].samples == 3
+
+
+def test_instrumentation__with_codec__records_calls_and_failures(counters):
+    base62.encode(uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8"))
+    base62.decode("7yNMTpVy8ddRxYKGJqtk7e")
+    with pytest.raises(ValueError):
+        base62.decode("Z" * base62.BASE62_WIDTH)
+
+    assert counters.calls == {("encode", None): 1, ("decode", None): 2}
+    assert counters.failures == {("decode", None, "out_of_range"): 1}
+
+
+def test_instrumentation__with_dependencies__records_rejections_per_prefix(counters):
+    app = fastapi.FastAPI()
+
+    @app.get("/books/{book_id}")
+    def get_book(book_id: UUIDBase62 = fastapi.Depends(get_validated_uuidbase62("book_id", "book"))):
+        return {"id": book_id}
+
+    @app.get("/books")
+    def get_books(book_ids=fastapi.Depends(get_validated_uuidbase62_list("ids", "book"))):
+        return {"ids": book_ids}
+
+    client = TestClient(app)
+    assert client.get("/books/book_7yNMTpVy8ddRxYKGJqtk7e").status_code == 200
+    assert client.get("/books/author_7yNMTpVy8ddRxYKGJqtk7e").status_code == 404
+    assert client.get("/books?ids=book_7yNMTpVy8ddRxYKGJqtk7e,book_!").status_code == 422
+
+    assert counters.calls["dependency", "book"] == 4
+    assert counters.failures["dependency", "book", "prefix_mismatch"] == 1
+    assert counters.failures["dependency", "book", "invalid_characters"] == 1
+
+
+def test_instrumentation__with_sample_rate_zero__records_no_timings():
+    sink = enable_instrumentation(CounterSink(), sample_rate=0)
+    try:
+        to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    finally:
+        disable_instrumentation()
+
+    assert sink.calls["to_uuidbase62", "my_prefix"] == 1
+    assert not sink.timings
+
+
+def test_instrumentation__with_several_sinks__records_to_each():
+    sinks = [CounterSink(), CounterSink()]
+    enable_instrumentation(*sinks)
+    try:
+        to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    finally:
+        disable_instrumentation()
+
+    assert [sink.calls["to_uuidbase62", "my_prefix"] for sink in sinks] == [1, 1]
+
+
+def test_enable_instrumentation__with_invalid_arguments__raises_error():
+    with pytest.raises(ValueError):
+        enable_instrumentation()
+    with pytest.raises(ValueError):
+        enable_instrumentation(Sink(), sample_rate=2)
+    assert instrumentation.active_sink is None
+
+
+def test_prometheus_sink__exposition__renders_counters_and_timings():
+    sink = PrometheusSink()
+    sink.record_call("to_uuidbase62", "book")
+    sink.record_call("to_uuidbase62", "book")
+    sink.record_call("decode", None)
+    sink.record_failure("to_uuidbase62", "book", "prefix_mismatch")
+    sink.record_timing("to_uuidbase62", "book", 0.25, True)
+
+    lines = sink.exposition().splitlines()
+
+    assert "# TYPE uuidbase62_calls_total counter" in lines
+    assert 'uuidbase62_calls_total{operation="to_uuidbase62",prefix="book"} 2' in lines
+    assert 'uuidbase62_calls_total{operation="decode",prefix=""} 1' in lines
+    assert (
+        'uuidbase62_failures_total{operation="to_uuidbase62",prefix="book",reason="prefix_mismatch"} 1'
+        in lines
+    )
+    assert (
+        'uuidbase62_duration_seconds_count{operation="to_uuidbase62",prefix="book",outcome="failure"} 1'
+        in lines
+    )
+    assert (
+        'uuidbase62_duration_seconds_sum{operation="to_uuidbase62",prefix="book",outcome="failure"} 0.25'
+        in lines
+    )
+
+
+def test_opentelemetry_sink__records_metrics():
+    metrics = pytest.importorskip("opentelemetry.sdk.metrics")
+    export = pytest.importorskip("opentelemetry.sdk.metrics.export")
+    from uuidbase62.instrumentation import OpenTelemetrySink
+
+    reader = export.InMemoryMetricReader()
+    meter = metrics.MeterProvider(metric_readers=[reader]).get_meter("test")
+    enable_instrumentation(OpenTelemetrySink(meter), sample_rate=1)
+    try:
+        to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+        with pytest.raises(ValueError):
+            to_uuidbase62("other_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+    finally:
+        disable_instrumentation()
+
+    data = reader.get_metrics_data()
+    points = {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+    assert [point.value for point in points["uuidbase62.calls"]] == [2]
+    assert [dict(point.attributes) for point in points["uuidbase62.failures"]] == [
+        {"operation": "to_uuidbase62", "prefix": "my_prefix", "reason": "prefix_mismatch"}
+    ]
+    assert sum(point.count for point in points["uuidbase62.duration"]) == 2
+
+
+@pytest.mark.parametrize(
+    "error,reason",
+    [
+        (ValueError("Field's expected 'a' prefix does not match given prefix 'b'"), "prefix_mismatch"),
+        (ValueError("Value contains invalid characters"), "invalid_characters"),
+        (ValueError("Base62 value is too long"), "too_long"),
+        (ValueError("Binary value must be 16 bytes, optionally preceded by a prefix tag"), "invalid_bytes"),
+        (ValueError("something else"), "other"),
+    ],
+)
+def test_failure_reason__returns_stable_reason(error, reason):
+    assert failure_reason(error) == reason
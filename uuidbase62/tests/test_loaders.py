@@ -0,0 +1,189 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from uuidbase62 import UUIDBase62Loader, get_uuidbase62_loader
+from uuidbase62.types import to_uuidbase62
+
+UUIDS = [uuid.UUID(int=index) for index in range(1, 6)]
+BOOK_IDS = [to_uuidbase62(uuid_, "book") for uuid_ in UUIDS]
+AUTHOR_IDS = [to_uuidbase62(uuid_, "author") for uuid_ in UUIDS]
+
+
+class Recorder:
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+
+    async def __call__(self, prefix, uuids):
+        self.calls.append((prefix, uuids))
+        await asyncio.sleep(0)
+        return {uuid_: f"{prefix}:{uuid_.int}" for uuid_ in uuids if uuid_ not in self.missing}
+
+
+def test_load__within_one_iteration__fetches_once_per_prefix():
+    fetch = Recorder()
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        return await asyncio.gather(
+            loader.load(BOOK_IDS[0]),
+            loader.load(AUTHOR_IDS[1]),
+            loader.load(BOOK_IDS[2]),
+            loader.load_many([BOOK_IDS[0], AUTHOR_IDS[3]]),
+        )
+
+    assert asyncio.run(run()) == ["book:1", "author:2", "book:3", ["book:1", "author:4"]]
+    assert sorted(fetch.calls) == [("author", [UUIDS[1], UUIDS[3]]), ("book", [UUIDS[0], UUIDS[2]])]
+
+
+def test_load__from_concurrent_tasks__coalesces_and_deduplicates():
+    fetch = Recorder()
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+
+        async def resolve(book_id):
+            return await loader.load(book_id)
+
+        return await asyncio.gather(*[resolve(book_id) for book_id in BOOK_IDS + BOOK_IDS])
+
+    assert asyncio.run(run()) == [f"book:{index}" for index in range(1, 6)] * 2
+    assert fetch.calls == [("book", UUIDS)]
+
+
+def test_load__with_loaded_key__uses_cache():
+    fetch = Recorder(missing=[UUIDS[1]])
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        first = await loader.load_many(BOOK_IDS[:2])
+        # equal values with a different (zero padded) encoding share the cache entry
+        second = await loader.load_many(["book_" + BOOK_IDS[0].base62_str.rjust(22, "0"), BOOK_IDS[1]])
+        loader.clear(BOOK_IDS[0])
+        third = await loader.load(BOOK_IDS[0])
+        return first, second, third
+
+    assert asyncio.run(run()) == (["book:1", None], ["book:1", None], "book:1")
+    assert fetch.calls == [("book", UUIDS[:2]), ("book", UUIDS[:1])]
+
+
+def test_load__with_max_batch_size__splits_batches():
+    fetch = Recorder()
+
+    async def run():
+        return await UUIDBase62Loader(fetch, max_batch_size=2).load_many(BOOK_IDS)
+
+    assert asyncio.run(run()) == [f"book:{index}" for index in range(1, 6)]
+    assert fetch.calls == [("book", UUIDS[:2]), ("book", UUIDS[2:4]), ("book", UUIDS[4:])]
+
+
+def test_load__with_unprefixed_key__fetches_with_none_prefix():
+    fetch = Recorder()
+
+    async def run():
+        return await UUIDBase62Loader(fetch).load(to_uuidbase62(UUIDS[0]))
+
+    assert asyncio.run(run()) == "None:1"
+
+
+def test_load__with_failing_fetch__raises_and_retries_later():
+    calls = []
+
+    async def fetch(prefix, uuids):
+        calls.append(uuids)
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        return {uuid_: "ok" for uuid_ in uuids}
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        with pytest.raises(RuntimeError):
+            await loader.load_many(BOOK_IDS[:2])
+        return await loader.load(BOOK_IDS[0])
+
+    assert asyncio.run(run()) == "ok"
+    assert len(calls) == 2
+
+
+def test_load__with_non_mapping_result__raises_and_retries_later():
+    calls = []
+
+    async def fetch(prefix, uuids):
+        calls.append(uuids)
+        return list(uuids) if len(calls) == 1 else {uuid_: "ok" for uuid_ in uuids}
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        with pytest.raises(TypeError, match="mapping"):
+            await asyncio.wait_for(loader.load_many(BOOK_IDS[:2]), 1)
+        return await loader.load(BOOK_IDS[0])
+
+    assert asyncio.run(run()) == "ok"
+    assert len(calls) == 2
+
+
+def test_load__with_cancelled_fetch__cancels_loads():
+    started = []
+
+    async def fetch(prefix, uuids):
+        started.append(asyncio.current_task())
+        await asyncio.sleep(10)
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        future = loader.load(BOOK_IDS[0])
+        while not started:
+            await asyncio.sleep(0)
+        started[0].cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(asyncio.shield(future), 1)
+        return future.cancelled(), started[0].cancelled()
+
+    assert asyncio.run(run()) == (True, True)
+
+
+def test_prime__with_value__skips_fetch():
+    fetch = Recorder()
+
+    async def run():
+        loader = UUIDBase62Loader(fetch)
+        loader.prime(BOOK_IDS[0], "primed")
+        return await loader.load(BOOK_IDS[0])
+
+    assert asyncio.run(run()) == "primed"
+    assert fetch.calls == []
+
+
+@pytest.mark.parametrize("key", [uuid.UUID(int=1), "book_abc!"])
+def test_load__with_invalid_key__raises(key):
+    with pytest.raises(ValueError):
+        UUIDBase62Loader(Recorder()).load(key)
+
+
+def test_get_uuidbase62_loader__in_route__shares_loader_per_request():
+    fetch = Recorder()
+    loader_dependency = get_uuidbase62_loader(fetch)
+    app = FastAPI()
+
+    async def get_author(loader: UUIDBase62Loader = Depends(loader_dependency)):
+        return await loader.load(AUTHOR_IDS[0])
+
+    @app.get("/books")
+    async def list_books(
+        author=Depends(get_author), loader: UUIDBase62Loader = Depends(loader_dependency)  # noqa: B008
+    ):
+        books = await loader.load_many(BOOK_IDS[:2])
+        return {"author": author, "books": books, "author_again": await loader.load(AUTHOR_IDS[0])}
+
+    client = TestClient(app)
+
+    expected = {"author": "author:1", "books": ["book:1", "book:2"], "author_again": "author:1"}
+    assert client.get("/books").json() == expected
+    assert client.get("/books").json() == expected
+    # the per request cache spans the route and its dependencies, and is empty for each request
+    assert [prefix for prefix, _ in fetch.calls] == ["author", "book", "author", "book"]
+    assert get_uuidbase62_loader(fetch) is loader_dependency
@@ -0,0 +1,111 @@
+import uuid
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from uuidbase62 import base62
+from uuidbase62.middleware import UUIDBase62PathMiddleware
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+
+@pytest.fixture
+def client_and_calls():
+    app = FastAPI()
+    calls = []
+
+    @app.get("/books/{book_id}/pages/{page_id}")
+    def get_page(book_id: str, page_id: str, request: Request):
+        calls.append(book_id)
+        return {"book_id": book_id, "uuids": {k: str(v) for k, v in request.state.uuidbase62.items()}}
+
+    @app.get("/books/{book_id}")
+    def get_book(book_id: str):
+        calls.append(book_id)
+        return {"book_id": book_id}
+
+    app.add_middleware(
+        UUIDBase62PathMiddleware,
+        routes={
+            "/books/{book_id}/pages/{page_id}": {"book_id": "book", "page_id": "page"},
+            "/authors/{author_id}": {"author_id": "author"},
+        },
+    )
+    return TestClient(app), calls
+
+
+def test_middleware__with_valid_ids__attaches_decoded_uuids(client_and_calls):
+    client, calls = client_and_calls
+
+    response = client.get("/books/book_7yNMTpVy8ddRxYKGJqtk7e/pages/page_0")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "book_id": "book_7yNMTpVy8ddRxYKGJqtk7e",
+        "uuids": {"book_id": str(UUID_), "page_id": str(uuid.UUID(int=0))},
+    }
+    assert calls == ["book_7yNMTpVy8ddRxYKGJqtk7e"]
+
+
+def test_middleware__with_valid_ids__decodes_each_id_once(client_and_calls, monkeypatch):
+    client, _ = client_and_calls
+    decode_int = base62._decode_int
+    calls = []
+    monkeypatch.setattr(base62, "_decode_int", lambda value: calls.append(value) or decode_int(value))
+
+    assert client.get("/books/book_7yNMTpVy8ddRxYKGJqtk7e/pages/page_0").status_code == 200
+    assert calls == ["7yNMTpVy8ddRxYKGJqtk7e", "0"]
+
+
+@pytest.mark.parametrize(
+    "path,message",
+    [
+        ("/books/author_7yNMTpVy8ddRxYKGJqtk7e/pages/page_0", "prefix does not match given prefix 'author'"),
+        ("/books/book_7yNMTpVy8ddRxYKGJqtk7e/pages/page_!", "Value contains invalid characters"),
+    ],
+)
+def test_middleware__with_invalid_id__rejects_before_routing(client_and_calls, path, message):
+    client, calls = client_and_calls
+
+    response = client.get(path)
+
+    assert response.status_code == 404
+    assert response.json()["detail"].startswith("Not Found; ")
+    assert message in response.json()["detail"]
+    assert calls == []
+
+
+def test_middleware__with_unconfigured_path__passes_through(client_and_calls):
+    client, calls = client_and_calls
+
+    response = client.get("/books/anything")
+
+    assert response.status_code == 200
+    assert calls == ["anything"]
+
+
+def test_middleware__with_literal_route_of_same_shape__passes_through():
+    app = FastAPI()
+
+    @app.get("/books/search")
+    def search_books():
+        return {"search": True}
+
+    @app.get("/books/{book_id}")
+    def get_book(book_id: str):
+        return {"book_id": book_id}
+
+    app.add_middleware(UUIDBase62PathMiddleware, routes={"/books/{book_id}": {"book_id": "book"}})
+    client = TestClient(app)
+
+    assert client.get("/books/search").json() == {"search": True}
+    assert client.get("/books/book_7yNMTpVy8ddRxYKGJqtk7e").json() == {
+        "book_id": "book_7yNMTpVy8ddRxYKGJqtk7e"
+    }
+    assert client.get("/books/author_7yNMTpVy8ddRxYKGJqtk7e").status_code == 404
+
+
+def test_middleware__with_unknown_template_param__raises_error():
+    with pytest.raises(ValueError):
+        UUIDBase62PathMiddleware(FastAPI(), routes={"/books/{book_id}": {"id": "book"}})
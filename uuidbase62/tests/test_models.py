@@ -1,9 +1,14 @@
+import typing
 import uuid
 
 import pytest
 from pydantic import BaseModel
 
-from uuidbase62 import UUIDBase62ModelMixin, con_uuidbase62
+from uuidbase62 import (
+    UUIDBase62ModelMixin,
+    con_uuidbase62,
+    get_validated_uuidbase62_by_model,
+)
 
 
 @pytest.mark.parametrize(
@@ -32,3 +37,20 @@ def test_to_uuidbase62_method_in_model__with_valid_uuid__yields_correct_values(v
     assert uuidbase62_value.uuid == uuid_
     assert uuidbase62_value.prefix == prefix
     assert uuidbase62_value.base62_str == encoded_value.rsplit("_", 1)[1]
+
+
+def test_to_uuidbase62_method_in_model__with_optional_field__validates_against_prefix():
+    BookId = con_uuidbase62(prefix="book")
+
+    class OptionalIdModel(UUIDBase62ModelMixin, BaseModel):
+        id: typing.Optional[BookId] = None  # type: ignore
+        parent_id: typing.Union[None, BookId] = None  # type: ignore
+
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    assert OptionalIdModel.to_uuidbase62("id", uuid_) == "book_7yNMTpVy8ddRxYKGJqtk7e"
+    assert OptionalIdModel.to_uuidbase62("parent_id", uuid_).prefix == "book"
+    with pytest.raises(ValueError):
+        OptionalIdModel.to_uuidbase62("id", "author_7yNMTpVy8ddRxYKGJqtk7e")
+    dependency = get_validated_uuidbase62_by_model(OptionalIdModel, "id", "book_id")
+    assert dependency("book_7yNMTpVy8ddRxYKGJqtk7e").uuid == uuid_
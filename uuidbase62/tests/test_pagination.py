@@ -0,0 +1,113 @@
+import uuid
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from uuidbase62 import (
+    Cursor,
+    ParamSource,
+    decode_cursor,
+    encode_cursor,
+    get_validated_cursor,
+)
+from uuidbase62.types import to_uuidbase62
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+BOOK_ID = "book_7yNMTpVy8ddRxYKGJqtk7e"
+SECRET = "s3cret"
+
+
+def test_encode_cursor__with_id__is_the_prefixed_id():
+    assert encode_cursor(BOOK_ID) == BOOK_ID
+    assert encode_cursor(UUID_, "book") == BOOK_ID
+
+
+@pytest.mark.parametrize(
+    "sort_key,descending,expected",
+    [
+        (None, True, f"{BOOK_ID}.d"),
+        ("2024-01-01", False, f"{BOOK_ID}.a.MjAyNC0wMS0wMQ"),
+        ("é.", True, f"{BOOK_ID}.d.w6ku"),
+    ],
+)
+def test_encode_cursor__with_sort_key_and_direction__round_trips(sort_key, descending, expected):
+    cursor = encode_cursor(BOOK_ID, sort_key=sort_key, descending=descending)
+
+    assert cursor == expected
+    assert decode_cursor(cursor, "book") == Cursor(UUID_, to_uuidbase62(BOOK_ID), sort_key, descending)
+
+
+def test_decode_cursor__with_id__returns_uuid_boundary():
+    cursor = decode_cursor(BOOK_ID, "book")
+
+    assert cursor.uuid == UUID_
+    assert cursor.last_id == BOOK_ID and cursor.last_id.prefix == "book"
+    assert cursor.sort_key is None and cursor.descending is False
+
+
+def test_encode_cursor__with_secret__is_signed():
+    cursor = encode_cursor(BOOK_ID, sort_key="10", secret=SECRET)
+
+    assert len(cursor) == len(f"{BOOK_ID}.a.MTA") + 1 + 22
+    assert decode_cursor(cursor, "book", secret=SECRET).sort_key == "10"
+    assert decode_cursor(cursor, "book", secret=SECRET.encode()).sort_key == "10"
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        BOOK_ID,
+        encode_cursor(BOOK_ID, secret="other"),
+        encode_cursor(BOOK_ID, secret=SECRET).replace(".", ".d.", 1),
+        encode_cursor(BOOK_ID, sort_key="10", secret=SECRET).replace("MTA", "MTE"),
+        encode_cursor(BOOK_ID, secret=SECRET) + "é",
+    ],
+)
+def test_decode_cursor__with_forged_cursor__raises(cursor):
+    with pytest.raises(ValueError) as e:
+        decode_cursor(cursor, "book", secret=SECRET)
+    assert str(e.value) == "Invalid cursor signature"
+
+
+@pytest.mark.parametrize(
+    "cursor,message",
+    [
+        (f"{BOOK_ID}.x", "Invalid cursor"),
+        (f"{BOOK_ID}.a.MTA.MTA", "Invalid cursor"),
+        (f"{BOOK_ID}.a.M!A", "Invalid cursor sort key"),
+        (f"{BOOK_ID}.a._w", "Invalid cursor sort key"),
+        ("author_7yNMTpVy8ddRxYKGJqtk7e", "Field's expected 'book' prefix"),
+        ("book_abc!", "Value contains invalid characters"),
+    ],
+)
+def test_decode_cursor__with_invalid_cursor__raises(cursor, message):
+    with pytest.raises(ValueError) as e:
+        decode_cursor(cursor, "book")
+    assert str(e.value).startswith(message)
+
+
+def test_get_validated_cursor__in_route__returns_boundary_or_none():
+    app = FastAPI()
+
+    @app.get("/books")
+    async def list_books(cursor: Cursor = Depends(get_validated_cursor(prefix="book", secret=SECRET))):
+        return {"after": str(cursor.uuid) if cursor else None}
+
+    client = TestClient(app)
+
+    assert client.get("/books").json() == {"after": None}
+    cursor = encode_cursor(BOOK_ID, secret=SECRET)
+    assert client.get("/books", params={"cursor": cursor}).json() == {"after": str(UUID_)}
+    response = client.get("/books", params={"cursor": BOOK_ID})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Bad Request; Invalid cursor signature"}
+
+
+def test_get_validated_cursor__with_same_arguments__returns_same_callable():
+    assert get_validated_cursor("after", "book") is get_validated_cursor("after", "book")
+
+
+def test_get_validated_cursor__with_path_param__raises():
+    with pytest.raises(ValueError):
+        get_validated_cursor("cursor", param_source=ParamSource.PATH)
@@ -0,0 +1,68 @@
+import json
+import typing
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from uuidbase62 import UUIDBase62JSONResponse, con_uuidbase62, responses
+
+
+class Book(BaseModel):
+    id: con_uuidbase62(prefix="book")  # type: ignore
+    title: str
+
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+EXPECTED = [{"id": "book_7yNMTpVy8ddRxYKGJqtk7e", "title": "Red Mars"}]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    return request.param
+
+
+def test_uuidbase62_json_response__with_models__renders_prefixed_strs(json_backend):
+    response = UUIDBase62JSONResponse([Book(id=UUID_, title="Red Mars")])
+
+    assert json.loads(response.body) == EXPECTED
+
+
+def test_uuidbase62_json_response__with_uuid__renders_uuid_str(json_backend):
+    response = UUIDBase62JSONResponse({"uuid": UUID_})
+
+    assert json.loads(response.body) == {"uuid": str(UUID_)}
+
+
+def test_uuidbase62_json_response__with_unsupported_value__raises_error(json_backend):
+    with pytest.raises(TypeError):
+        UUIDBase62JSONResponse({"value": object()})
+
+
+def test_uuidbase62_json_response__in_app__matches_default_response(json_backend):
+    app = FastAPI()
+
+    @app.get("/default", response_model=typing.List[Book])
+    def default_list():
+        return [{"id": UUID_, "title": "Red Mars"}]
+
+    @app.get("/class", response_model=typing.List[Book], response_class=UUIDBase62JSONResponse)
+    def response_class_list():
+        return [{"id": UUID_, "title": "Red Mars"}]
+
+    @app.get("/direct")
+    def direct_list():
+        return UUIDBase62JSONResponse([Book(id=UUID_, title="Red Mars")])
+
+    client = TestClient(app)
+
+    for path in ("/default", "/class", "/direct"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.json() == EXPECTED
@@ -0,0 +1,59 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from uuidbase62 import Base62MissingPrefix, UUIDBase62, con_uuidbase62
+from uuidbase62.routing import PrefixDispatcher, PrefixRouter
+from uuidbase62.types import to_uuidbase62
+
+
+def test_prefix_router__lookup__returns_target_by_prefix():
+    router = PrefixRouter({"book": "books-service", con_uuidbase62(prefix="my_prefix"): "prefix-service"})
+
+    assert router.lookup("book_7yNMTpVy8ddRxYKGJqtk7e") == "books-service"
+    assert router.lookup("my_prefix_7yNMTpVy8ddRxYKGJqtk7e") == "prefix-service"
+    assert router.lookup(to_uuidbase62("my_prefix_0", "my_prefix")) == "prefix-service"
+    assert router.lookup("prefix_7yNMTpVy8ddRxYKGJqtk7e") is None
+    assert router.lookup("7yNMTpVy8ddRxYKGJqtk7e") is None
+    assert "book" in router
+    assert len(router) == 2
+
+
+def test_prefix_router__bulk_lookups__keep_order_and_group():
+    router = PrefixRouter({"book": "books", "author": "authors"})
+    values = ["book_1", "author_2", "other_3", "book_4"]
+
+    assert router.lookup_many(values) == ["books", "authors", None, "books"]
+    assert router.group(values) == {"books": ["book_1", "book_4"], "authors": ["author_2"], None: ["other_3"]}
+
+
+@pytest.mark.parametrize("prefix", ["", "not-valid", UUIDBase62])
+def test_prefix_router__register_invalid_prefix__raises_error(prefix):
+    with pytest.raises((Base62MissingPrefix, ValueError)):
+        PrefixRouter().register(prefix, "target")
+
+
+def test_prefix_dispatcher__forwards_requests_by_id_prefix():
+    books = FastAPI()
+    authors = FastAPI()
+    fallback = FastAPI()
+
+    @books.get("/objects/{object_id}")
+    def get_book(object_id: str):
+        return {"service": "books", "id": object_id}
+
+    @authors.get("/objects/{object_id}")
+    def get_author(object_id: str):
+        return {"service": "authors", "id": object_id}
+
+    @fallback.get("/{path:path}")
+    def get_fallback(path: str):
+        return {"service": "fallback"}
+
+    client = TestClient(PrefixDispatcher(PrefixRouter({"book": books, "author": authors})))
+    fallback_client = TestClient(PrefixDispatcher(PrefixRouter({"book": books}), default=fallback))
+
+    assert client.get("/objects/book_0").json() == {"service": "books", "id": "book_0"}
+    assert client.get("/objects/author_0").json() == {"service": "authors", "id": "author_0"}
+    assert client.get("/objects/other_0").status_code == 404
+    assert fallback_client.get("/objects/other_0").json() == {"service": "fallback"}
@@ -0,0 +1,84 @@
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from uuidbase62 import base62
+
+speedups = pytest.importorskip("uuidbase62._speedups")
+
+RANDOM = random.Random(62)
+EDGE_INTS = [0, 1, 61, 62, 62**5 - 1, 62**5, 2**32 - 1, 2**32, 2**64 - 1, 2**64, 62**21, 2**128 - 1]
+ALPHABET = base62.BASE62 + "_-!~ é\x00"
+
+
+def _outcome(func, value):
+    try:
+        return "ok", func(value)
+    except ValueError as e:
+        return "error", str(e)
+
+
+def _random_ints(count):
+    for _ in range(count):
+        bits = RANDOM.choice([8, 32, 64, 96, 127, 128])
+        yield RANDOM.getrandbits(bits)
+
+
+def _random_strs(count):
+    for _ in range(count):
+        length = RANDOM.randint(0, base62.BASE62_WIDTH + 1)
+        alphabet = base62.BASE62 if RANDOM.random() < 0.8 else ALPHABET
+        yield "".join(RANDOM.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize("num", EDGE_INTS)
+def test_encode_int__matches_python_codec(num):
+    assert speedups.encode_int(num) == base62._py_encode_int(num)
+
+
+def test_encode_int__with_random_ints__matches_python_codec():
+    for num in _random_ints(5000):
+        assert speedups.encode_int(num) == base62._py_encode_int(num)
+
+
+@pytest.mark.parametrize("num", [-1, 2**128, 2**200])
+def test_encode_int__with_out_of_range_int__matches_python_codec(num):
+    assert _outcome(speedups.encode_int, num) == _outcome(base62._py_encode_int, num)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "0",
+        "Z" * 21,
+        "Z" * 22,
+        "7" * 22,
+        "7" * 23,
+        "1WfVMU43m1UQUtAHULNBz!",
+        *[base62._py_encode_int(num) for num in EDGE_INTS],
+    ],
+)
+def test_decode_int__matches_python_codec(value):
+    assert _outcome(speedups.decode_int, value) == _outcome(base62._py_decode_int, value)
+
+
+def test_decode_int__with_random_strs__matches_python_codec():
+    for value in _random_strs(5000):
+        assert _outcome(speedups.decode_int, value) == _outcome(base62._py_decode_int, value)
+
+
+def test_decode_int__round_trips_encode_int():
+    for num in _random_ints(2000):
+        assert speedups.decode_int(speedups.encode_int(num)) == num
+
+
+def test_speedups__with_no_extensions_env__uses_python_codec():
+    env = dict(os.environ, UUIDBASE62_NO_EXTENSIONS="1")
+    code = "from uuidbase62 import base62; print(base62.HAS_SPEEDUPS, base62._encode_int is base62._py_encode_int)"
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+    assert output.stdout.split() == ["False", "True"]
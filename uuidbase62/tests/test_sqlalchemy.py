@@ -0,0 +1,112 @@
+import uuid
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from uuidbase62 import con_uuidbase62  # noqa: E402
+from uuidbase62.generators import UUIDBase62Generator  # noqa: E402
+from uuidbase62.sqlalchemy import UUIDBase62Type  # noqa: E402
+from uuidbase62.types import to_uuidbase62  # noqa: E402
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+ENCODED = "book_7yNMTpVy8ddRxYKGJqtk7e"
+
+
+@pytest.fixture
+def table():
+    metadata = sqlalchemy.MetaData()
+    return sqlalchemy.Table(
+        "books",
+        metadata,
+        sqlalchemy.Column("id", UUIDBase62Type(prefix="book"), primary_key=True),
+        sqlalchemy.Column("author_id", UUIDBase62Type(prefix="author"), nullable=True),
+    )
+
+
+@pytest.fixture
+def connection(table):
+    engine = sqlalchemy.create_engine("sqlite://")
+    table.metadata.create_all(engine)
+    with engine.connect() as connection:
+        yield connection
+
+
+@pytest.mark.parametrize(
+    "value",
+    [UUID_, str(UUID_), ENCODED, to_uuidbase62(UUID_, "book"), UUID_.bytes],
+)
+def test_uuidbase62_type__with_sqlite__round_trips_values(table, connection, value):
+    connection.execute(table.insert(), {"id": value, "author_id": None})
+
+    row = connection.execute(sqlalchemy.select(table.c.id, table.c.author_id)).one()
+    raw = connection.execute(sqlalchemy.text("SELECT id FROM books")).scalar_one()
+
+    assert type(row.id) is con_uuidbase62(prefix="book")
+    assert row.id == ENCODED
+    assert row.id.uuid == UUID_
+    assert row.author_id is None
+    assert raw == UUID_.bytes
+
+
+def test_uuidbase62_type__in_where_clause__binds_prefixed_value(table, connection):
+    connection.execute(table.insert(), [{"id": UUID_}, {"id": uuid.uuid4()}])
+
+    result = connection.execute(sqlalchemy.select(table.c.id).where(table.c.id == ENCODED)).scalars().all()
+
+    assert result == [ENCODED]
+
+
+def test_uuidbase62_type__with_wrong_prefix__raises_error(table, connection):
+    with pytest.raises(sqlalchemy.exc.StatementError) as e:
+        connection.execute(table.insert(), {"id": "author_7yNMTpVy8ddRxYKGJqtk7e"})
+
+    assert "prefix does not match given prefix 'author'" in str(e.value)
+
+
+def test_uuidbase62_type__with_executemany__reads_back_generated_values_in_order(connection):
+    table = sqlalchemy.Table(
+        "events",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", UUIDBase62Type(prefix="event"), primary_key=True),
+    )
+    table.create(connection)
+    ids = UUIDBase62Generator("event").generate_many(500)
+    column_type = table.c.id.type
+
+    connection.execute(
+        table.insert(), [{"id": value} for value in column_type.bind_many(ids, connection.dialect)]
+    )
+    result = connection.execute(sqlalchemy.select(table.c.id).order_by(table.c.id)).scalars().all()
+
+    # BINARY(16) UUIDv7 values sort by creation time
+    assert result == ids
+    assert column_type.result_many(column_type.bind_many(ids, connection.dialect)) == ids
+
+
+def test_uuidbase62_type__bind_many_and_result_many__match_per_value_processing(table):
+    column_type = table.c.author_id.type
+    values = [UUID_, None, "author_7yNMTpVy8ddRxYKGJqtk7e", str(UUID_), UUID_.bytes]
+
+    for dialect in (sqlalchemy.create_engine("sqlite://").dialect, postgresql.dialect()):
+        bound = column_type.bind_many(values, dialect)
+
+        assert bound == [column_type.process_bind_param(value, dialect) for value in values]
+        assert column_type.result_many(bound) == [
+            None if value is None else "author_7yNMTpVy8ddRxYKGJqtk7e" for value in values
+        ]
+        assert column_type.result_many(bound) == [
+            column_type.process_result_value(value, dialect) for value in bound
+        ]
+
+
+def test_uuidbase62_type__with_postgresql__uses_native_uuid():
+    column_type = UUIDBase62Type(prefix="book")
+    dialect = postgresql.dialect()
+
+    assert isinstance(column_type.load_dialect_impl(dialect), postgresql.UUID)
+    assert column_type.process_bind_param(ENCODED, dialect) == UUID_
+    assert column_type.process_result_value(UUID_, dialect) == ENCODED
+    assert column_type.python_type is con_uuidbase62(prefix="book")
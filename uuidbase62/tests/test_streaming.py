@@ -0,0 +1,91 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from uuidbase62 import Base62MissingPrefix
+from uuidbase62.streaming import csv_stream, ndjson_stream
+
+UUID_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+ROWS = [
+    {"id": UUID_, "author_id": UUID_.bytes, "title": "Red Mars"},
+    {"id": uuid.UUID(int=0), "author_id": None, "title": "Green Mars"},
+    {"id": UUID_, "author_id": UUID_, "title": "Blue Mars"},
+]
+PREFIXES = {"id": "book", "author_id": "author"}
+EXPECTED = [
+    {"id": "book_7yNMTpVy8ddRxYKGJqtk7e", "author_id": "author_7yNMTpVy8ddRxYKGJqtk7e", "title": "Red Mars"},
+    {"id": "book_0", "author_id": None, "title": "Green Mars"},
+    {"id": "book_7yNMTpVy8ddRxYKGJqtk7e", "author_id": "author_7yNMTpVy8ddRxYKGJqtk7e", "title": "Blue Mars"},
+]
+
+
+async def _arows():
+    for row in ROWS:
+        yield row
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_ndjson_stream__with_rows__yields_prefixed_lines(batch_size):
+    chunks = list(ndjson_stream(ROWS, PREFIXES, batch_size=batch_size))
+
+    assert len(chunks) == -(-len(ROWS) // batch_size)
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == EXPECTED
+    # the source rows are left untouched
+    assert ROWS[0]["id"] == UUID_
+
+
+def test_ndjson_stream__with_async_rows__yields_prefixed_lines():
+    chunks = asyncio.run(_collect(ndjson_stream(_arows(), PREFIXES, batch_size=2)))
+
+    assert len(chunks) == 2
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == EXPECTED
+
+
+def test_csv_stream__with_rows__yields_header_and_prefixed_rows():
+    chunks = list(csv_stream(ROWS, PREFIXES, ["id", "author_id", "title"], batch_size=2))
+
+    assert b"".join(chunks).decode().splitlines() == [
+        "id,author_id,title",
+        "book_7yNMTpVy8ddRxYKGJqtk7e,author_7yNMTpVy8ddRxYKGJqtk7e,Red Mars",
+        "book_0,,Green Mars",
+        "book_7yNMTpVy8ddRxYKGJqtk7e,author_7yNMTpVy8ddRxYKGJqtk7e,Blue Mars",
+    ]
+
+
+def test_csv_stream__with_async_rows_and_no_header__yields_prefixed_rows():
+    chunks = asyncio.run(
+        _collect(csv_stream(_arows(), {"id": "book"}, ["id"], header=False, extrasaction="ignore"))
+    )
+
+    assert b"".join(chunks).decode().splitlines() == [
+        "book_7yNMTpVy8ddRxYKGJqtk7e",
+        "book_0",
+        "book_7yNMTpVy8ddRxYKGJqtk7e",
+    ]
+
+
+def test_ndjson_stream__with_invalid_prefix__raises_error():
+    with pytest.raises(Base62MissingPrefix):
+        ndjson_stream(ROWS, {"id": "not-valid"})
+
+
+def test_ndjson_stream__with_streaming_response__streams_rows():
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export():
+        return StreamingResponse(ndjson_stream(_arows(), PREFIXES), media_type="application/x-ndjson")
+
+    response = TestClient(app).get("/export")
+
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == EXPECTED
@@ -1,10 +1,20 @@
+import copy
+import pickle
+import typing
 import uuid
 
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from uuidbase62 import Base62MissingPrefix, con_uuidbase62
-from uuidbase62.types import UUIDBase62, to_uuidbase62
+from uuidbase62 import Base62MissingPrefix, base62, con_uuidbase62
+from uuidbase62.compat import PYDANTIC_V2
+from uuidbase62.types import (
+    UUIDBase62,
+    UUIDBase62List,
+    _validate_to_int,
+    _value_type,
+    to_uuidbase62,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,6 +63,21 @@ def test_to_uuidbase62_function__with_prefix__works(value):
     assert uuid_ == result.uuid
 
 
+def test_to_uuidbase62_function__with_empty_value__decodes_to_zero():
+    result = to_uuidbase62("")
+
+    assert type(result.base62_str) is str
+    assert result.base62_str == ""
+    assert result.uuid == uuid.UUID(int=0)
+
+
+def test_model__with_empty_unprefixed_value__decodes_to_zero():
+    class Model(BaseModel):
+        id: UUIDBase62
+
+    assert Model(id="").id.uuid == uuid.UUID(int=0)
+
+
 def test_to_uuidbase62_function__with_uuidbase62_no_prefix__works():
     prefix = "my_prefix"
     uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
@@ -116,7 +141,7 @@ def test_con_uuidbase62_function_in_model__with_invalid_uuid_invalid_prefix__rai
     with pytest.raises(ValidationError) as e:
         ValidPrefixModel(id="invalid-value")
 
-    assert "Field's expected 'my_prefix' prefix does not match given prefix ''" in str(e)
+    assert "Field's expected 'my_prefix' prefix does not match given prefix ''" in str(e.value)
 
 
 def test_con_uuidbase62_function_in_model__with_invalid_uuid_valid_prefix__raises_error():
@@ -126,7 +151,7 @@ def test_con_uuidbase62_function_in_model__with_invalid_uuid_valid_prefix__raise
     with pytest.raises(ValidationError) as e:
         ValidPrefixModel(id="my_prefix_invalid-value")
 
-    assert "Value contains invalid characters" in str(e)
+    assert "Value contains invalid characters" in str(e.value)
 
 
 @pytest.mark.parametrize(
@@ -190,3 +215,258 @@ def test_uuidbase62_str__with_valid_value__works_correctly():
     result = to_uuidbase62(uuid_, prefix=prefix)
 
     assert str(result) == encoded_value
+
+
+def test_uuidbase62__instances__have_no_dict_and_share_prefix():
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    result = to_uuidbase62(uuid_, "my_prefix")
+    result2 = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+
+    assert not hasattr(result, "__dict__")
+    assert type(result) is type(result2)
+    assert result.prefix is result2.prefix
+    assert result2.base62_str == "7yNMTpVy8ddRxYKGJqtk7e"
+    assert result2.uuid == uuid_
+
+
+def test_uuidbase62__hash__matches_str():
+    result = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+
+    assert hash(result) == hash("my_prefix_7yNMTpVy8ddRxYKGJqtk7e")
+    assert {result: 1}["my_prefix_7yNMTpVy8ddRxYKGJqtk7e"] == 1
+
+
+def test_uuidbase62_constructor__with_former_keywords__builds_value_of_prefix_type():
+    result = UUIDBase62(value="book_7yNMTpVy8ddRxYKGJqtk7e", prefix="book", base62_str="ignored", uuid_=None)
+
+    assert result == "book_7yNMTpVy8ddRxYKGJqtk7e"
+    assert type(result) is con_uuidbase62(prefix="book")
+    assert result.prefix == "book"
+    assert result.uuid == uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+    assert type(UUIDBase62("7yNMTpVy8ddRxYKGJqtk7e")) is UUIDBase62
+    assert type(con_uuidbase62(prefix="book")(value="book_1")) is con_uuidbase62(prefix="book")
+
+
+def test_uuidbase62__with_pickle_and_copy__round_trips():
+    result = to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")
+
+    for copied in (pickle.loads(pickle.dumps(result)), copy.copy(result), copy.deepcopy(result)):
+        assert copied == result
+        assert type(copied) is type(result)
+        assert copied.prefix == "my_prefix"
+        assert copied.uuid == result.uuid
+
+
+def test_uuidbase62_sorted_by_sort_key__with_compact_and_padded_values__follows_uuid_order():
+    uuids = [uuid.UUID(int=num) for num in (10, 36, 61, 62, 2**100, 2**127)]
+    compact = [to_uuidbase62(uuid_, "my_prefix") for uuid_ in uuids]
+    padded = [
+        to_uuidbase62(f"my_prefix_{base62.encode(uuid_, fixed_width=True)}", "my_prefix") for uuid_ in uuids
+    ]
+
+    def key(value):
+        return base62.sort_key(value.base62_str)
+
+    assert sorted(reversed(compact), key=key) == compact
+    assert sorted(reversed(padded), key=key) == padded
+    assert sorted(compact + padded, key=key) == [value for pair in zip(compact, padded) for value in pair]
+
+
+def test_uuidbase62_comparison__compares_as_plain_strings():
+    # "a" < "B" numerically, but not as strings
+    assert (to_uuidbase62("my_prefix_a", "my_prefix") < "my_prefix_B") is False
+    assert sorted([to_uuidbase62("my_prefix_a", "my_prefix"), "my_prefix_B"]) == [
+        "my_prefix_B",
+        "my_prefix_a",
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "f8711c37c1d14961ba3c98cdc5b4fda8",
+        "F8711C37-C1D1-4961-BA3C-98CDC5B4FDA8",
+        "{f8711c37-c1d1-4961-ba3c-98cdc5b4fda8}",
+        "urn:uuid:f8711c37-c1d1-4961-ba3c-98cdc5b4fda8",
+    ],
+)
+def test_to_uuidbase62_function__with_uuid_str_forms__works(value):
+    result = to_uuidbase62(value, "my_prefix")
+
+    assert result == "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert result.uuid == uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+
+@pytest.mark.parametrize(
+    "value,prefix,message",
+    [
+        ("f8711c37-c1d1-4961-ba3c-98cdc5b4fdaz", None, "Value contains invalid characters"),
+        ("f8711c37c1d14961ba3c98cdc5b4fdaz", None, "Value contains invalid characters"),
+        ("f8711c37-c1d1-4961-ba3c-98cdc5b4fd-8", None, "Value contains invalid characters"),
+        ("f8711c37-c1d1-4961-ba3c-98cdc5b4fd-8", "my_prefix", "prefix does not match given prefix ''"),
+        ("my_prefix_f8711c37-c1d1-4961-ba3c-98cdc5b4fda8", "my_prefix", "Value contains invalid characters"),
+        (1234, None, "Value must be a UUID, a string or bytes"),
+    ],
+)
+def test_to_uuidbase62_function__with_invalid_values__fails(value, prefix, message):
+    with pytest.raises(ValueError) as e:
+        to_uuidbase62(value, prefix)
+
+    assert message in str(e)
+
+
+UUID_BYTES = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8").bytes
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        UUID_BYTES,
+        bytearray(UUID_BYTES),
+        memoryview(b"\x00" * 7 + UUID_BYTES)[7:],
+        b"\x09my_prefix" + UUID_BYTES,
+        memoryview(b"\x09my_prefix" + UUID_BYTES),
+    ],
+)
+def test_to_uuidbase62_function__with_bytes__works(value):
+    result = to_uuidbase62(value, "my_prefix")
+
+    assert type(result) is con_uuidbase62(prefix="my_prefix")
+    assert result == "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert con_uuidbase62(prefix="my_prefix").validate(value) == result
+
+
+def test_to_uuidbase62_function__with_tagged_bytes_and_no_prefix__uses_tag():
+    assert to_uuidbase62(b"\x09my_prefix" + UUID_BYTES) == "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert to_uuidbase62(b"\x00" + UUID_BYTES) == "7yNMTpVy8ddRxYKGJqtk7e"
+    assert to_uuidbase62(UUID_BYTES) == "7yNMTpVy8ddRxYKGJqtk7e"
+
+
+@pytest.mark.parametrize(
+    "value,message",
+    [
+        (UUID_BYTES[:15], "Binary value must be 16 bytes"),
+        (b"", "Binary value must be 16 bytes"),
+        (b"\x05other" + UUID_BYTES, "prefix does not match given prefix 'other'"),
+        (b"\x09my_prefix" + UUID_BYTES + b"\x00", "Binary value must be 16 bytes"),
+        (b"\x09my-prefix" + UUID_BYTES, "Binary value contains an invalid prefix tag"),
+        (b"\x05my\xffab" + UUID_BYTES, "Binary value contains an invalid prefix tag"),
+    ],
+)
+def test_to_uuidbase62_function__with_invalid_bytes__fails(value, message):
+    with pytest.raises(ValueError) as e:
+        to_uuidbase62(value, "my_prefix")
+
+    assert message in str(e.value)
+
+
+def test_uuidbase62_to_bytes__round_trips():
+    result = to_uuidbase62(UUID_BYTES, "my_prefix")
+
+    assert result.to_bytes() == UUID_BYTES
+    assert result.to_bytes(tagged=True) == b"\x09my_prefix" + UUID_BYTES
+    assert to_uuidbase62(result.to_bytes(tagged=True), "my_prefix") == result
+    assert to_uuidbase62("7yNMTpVy8ddRxYKGJqtk7e").to_bytes(tagged=True) == b"\x00" + UUID_BYTES
+
+
+def test_uuidbase62_list_to_bytes__round_trips_packed_values():
+    uuids = [uuid.UUID(int=0), uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8"), uuid.uuid4()]
+    values = UUIDBase62List([to_uuidbase62(uuid_, "my_prefix") for uuid_ in uuids])
+
+    packed = values.to_bytes()
+    result = UUIDBase62List.from_bytes(memoryview(packed), "my_prefix")
+
+    assert packed == b"".join(uuid_.bytes for uuid_ in uuids)
+    assert result == values
+    assert result.uuids == uuids
+    assert all(type(value) is con_uuidbase62(prefix="my_prefix") for value in result)
+
+
+def test_con_uuidbase62_function__with_same_prefix__returns_same_type():
+    value_type = con_uuidbase62(prefix="my_prefix")
+
+    assert con_uuidbase62(prefix="my_prefix") is value_type
+    assert con_uuidbase62(prefix="other_prefix") is not value_type
+    assert type(to_uuidbase62("my_prefix_7yNMTpVy8ddRxYKGJqtk7e", "my_prefix")) is value_type
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8"),
+        "f8711c37-c1d1-4961-ba3c-98cdc5b4fda8",
+        "my_prefix_7yNMTpVy8ddRxYKGJqtk7e",
+    ],
+)
+def test_con_uuidbase62_validate__with_valid_value__returns_value_of_type(value):
+    value_type = con_uuidbase62(prefix="my_prefix")
+
+    result = value_type.validate(value)
+
+    assert type(result) is value_type
+    assert result == "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"
+    assert result.uuid == uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+
+@pytest.mark.parametrize(
+    "value,message",
+    [
+        ("my_prefix_7yNMTpVy8ddRxYKGJqtk7!", "Value contains invalid characters"),
+        ("my_prefix_a_7yNMTpVy8ddRxYKGJqtk7e", "prefix does not match given prefix 'my_prefix_a'"),
+        ("my_prefix_" + "1" * 23, "Value contains invalid characters"),
+        ("other_7yNMTpVy8ddRxYKGJqtk7e", "prefix does not match given prefix 'other'"),
+    ],
+)
+def test_con_uuidbase62_validate__with_invalid_value__raises_generic_errors(value, message):
+    with pytest.raises(ValueError) as e:
+        con_uuidbase62(prefix="my_prefix").validate(value)
+
+    assert message in str(e)
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="Pydantic v2 core schema")
+def test_con_uuidbase62_function_in_model__with_pydantic_v2__serializes_to_prefixed_str():
+    uuid_ = uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8")
+
+    class ValidPrefixModel(BaseModel):
+        id: con_uuidbase62(prefix="my_prefix")
+        ids: typing.List[con_uuidbase62(prefix="my_prefix")]
+
+    model_instance = ValidPrefixModel(id=uuid_, ids=[uuid_, "my_prefix_7yNMTpVy8ddRxYKGJqtk7e"])
+    json_ = model_instance.model_dump_json()
+    encoded_value = '"my_prefix_7yNMTpVy8ddRxYKGJqtk7e"'
+
+    assert json_ == f'{{"id":{encoded_value},"ids":[{encoded_value},{encoded_value}]}}'
+    assert ValidPrefixModel.model_validate_json(json_).ids[1].uuid == uuid_
+    assert isinstance(model_instance.model_dump()["id"], UUIDBase62)
+    assert ValidPrefixModel.model_json_schema()["properties"]["id"]["type"] == "string"
+
+
+@pytest.mark.parametrize(
+    "value,prefix,expected",
+    [
+        ("book_7yNMTpVy8ddRxYKGJqtk7e", "book", "book_7yNMTpVy8ddRxYKGJqtk7e"),
+        ("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8", "book", "book_7yNMTpVy8ddRxYKGJqtk7e"),
+        (uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8"), "book", "book_7yNMTpVy8ddRxYKGJqtk7e"),
+        ("book_7yNMTpVy8ddRxYKGJqtk7e", None, "book_7yNMTpVy8ddRxYKGJqtk7e"),
+        ("7yNMTpVy8ddRxYKGJqtk7e", None, "7yNMTpVy8ddRxYKGJqtk7e"),
+    ],
+)
+def test_validate_to_int__with_valid_value__returns_value_and_int(value, prefix, expected):
+    result, num = _validate_to_int(_value_type(prefix), value)
+
+    assert result == expected
+    assert result.prefix == prefix
+    assert num == uuid.UUID("f8711c37-c1d1-4961-ba3c-98cdc5b4fda8").int
+
+
+@pytest.mark.parametrize(
+    "value", ["author_7yNMTpVy8ddRxYKGJqtk7e", "book_x_7yNMTpVy8ddRxYKGJqtk7e", "book_!"]
+)
+def test_validate_to_int__with_invalid_value__raises_same_error_as_validate(value):
+    with pytest.raises(ValueError) as e:
+        _validate_to_int(_value_type("book"), value)
+    with pytest.raises(ValueError) as expected:
+        _value_type("book").validate(value)
+    assert str(e.value) == str(expected.value)
@@ -1,57 +1,249 @@
 import re
+import sys
 import typing
 import uuid
 
-from . import base62
+from . import base62, cache, instrumentation
 from .exceptions import Base62MissingPrefix
 
 
 class UUIDBase62(str):
-    def __new__(cls, value="", prefix="", base62_str="", uuid_=None):
-        return super().__new__(cls, value)
+    """
+    Prefixed base62 string value of a UUID. Instances hold only the string itself; the prefix is shared by every
+    instance of a per-prefix subclass, while `base62_str` and `uuid` are derived from the string when accessed.
+    Nothing is cached per instance: each access of `uuid` decodes the string again, so keep the result when it's
+    needed more than once.
+    """
 
-    def __init__(self, value="", prefix="", base62_str="", uuid_=None):
-        self.prefix = prefix
-        self.base62_str = base62_str
-        self.uuid = uuid_
-        self.value = value
+    __slots__ = ()
+
+    prefix: typing.Optional[str] = None
+
+    def __new__(
+        cls,
+        value: str = "",
+        prefix: typing.Optional[str] = None,
+        base62_str: typing.Optional[str] = None,
+        uuid_: typing.Optional[uuid.UUID] = None,
+    ) -> "UUIDBase62":
+        """
+        Same (unvalidated) constructor as before values became compact: a `prefix` selects the per-prefix type of the
+        value, while `base62_str` and `uuid_` are accepted for compatibility and ignored, both being derived from
+        `value`. Use `to_uuidbase62` or `validate` to build validated values.
+        """
+        if prefix and prefix != cls.prefix:
+            cls = _value_type(prefix)
+        return _new_value(cls, value)
+
+    @property
+    def value(self) -> str:
+        return str.__str__(self)
+
+    @property
+    def base62_str(self) -> str:
+        # a plain str, even when it's the whole (unprefixed) value
+        return str.__str__(self).rpartition("_")[2]
+
+    @property
+    def uuid(self) -> uuid.UUID:
+        # decoded on every access
+        return base62.decode(self.base62_str)
 
     @classmethod
     def validate(cls, value: typing.Any) -> "UUIDBase62":
         return to_uuidbase62(value, cls.prefix)
 
+    def to_bytes(self, *, tagged: bool = False) -> bytes:
+        """
+        Binary form of the value, eg. for internal RPC (msgpack, protobuf `bytes` fields)
+        :param tagged: when True, the 16 bytes are preceded by a compact prefix tag (a length byte and the ASCII prefix)
+        :return: the 16 byte big-endian UUID value, optionally tagged; accepted back by `to_uuidbase62`
+        """
+        prefix, _, base62_str = self.rpartition("_")
+        raw = base62._decode_int(base62_str).to_bytes(16, "big")
+        if not tagged:
+            return raw
+        tag = prefix.encode("ascii")
+        return bytes((len(tag),)) + tag + raw
+
+    @classmethod
+    def generate(cls) -> "UUIDBase62":
+        """
+        :return: a new, time-ordered (UUIDv7) value with this type's prefix
+        """
+        from .generators import generate_uuidbase62
+
+        return generate_uuidbase62(cls.prefix)
+
     @classmethod
     def __get_validators__(cls) -> typing.Generator[typing.Callable, None, None]:
+        # Pydantic v1
         yield cls.validate
 
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: typing.Any, handler: typing.Any) -> typing.Any:
+        # Pydantic v2; values serialize as plain strings within pydantic-core, without a Python callback per value
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls.validate, serialization=core_schema.simple_ser_schema("str")
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: typing.Any, handler: typing.Any) -> typing.Any:
+        from pydantic_core import core_schema
+
+        return handler(core_schema.str_schema())
+
+    def __reduce__(self) -> typing.Tuple[typing.Callable, typing.Tuple[str, typing.Optional[str]]]:
+        # per-prefix subclasses are created dynamically, so rebuild values through `to_uuidbase62`
+        return to_uuidbase62, (self.value, self.prefix)
+
     def __repr__(self) -> str:
         return f"UUIDBase62('{self.value}')"
 
-    def __str__(self) -> str:
-        return self.value
-
     def __eq__(self, other: typing.Any) -> bool:
-        return isinstance(other, str) and self.value == other
+        return isinstance(other, str) and str.__eq__(self, other)
+
+    # equal to the plain string, so hashed the same way
+    __hash__ = str.__hash__
+
+
+# builds a value of a UUIDBase62 type from its (already validated) string, without going through `UUIDBase62.__new__`
+_new_value = str.__new__
+
+
+class UUIDBase62List(list):
+    """
+    List of UUIDBase62 values, that also carries the (already decoded) UUID of each value in `uuids`, eg. for use in
+    an `IN (...)` database query
+    """
+
+    def __init__(
+        self, values: typing.Iterable[UUIDBase62] = (), uuids: typing.Optional[typing.List[uuid.UUID]] = None
+    ):
+        super().__init__(values)
+        self.uuids: typing.List[uuid.UUID] = (
+            uuids if uuids is not None else base62.decode_many([value.base62_str for value in self])  # type: ignore
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: the UUIDs of the values as a single contiguous buffer of 16 byte big-endian values
+        """
+        return b"".join([uuid_.bytes for uuid_ in self.uuids])
+
+    @classmethod
+    def from_bytes(cls, packed: base62.BytesLike, prefix: typing.Optional[str] = None) -> "UUIDBase62List":
+        """
+        :param packed: a contiguous buffer of 16 byte big-endian UUID values, eg. from `to_bytes`
+        :param prefix: the prefix of the values
+        :return: the values, with their UUIDs
+        """
+        view = memoryview(packed)
+        encoded = base62.encode_many(view)
+        value_type = _value_type(prefix)
+        head = f"{prefix}_" if prefix else ""
+        uuids = [uuid.UUID(bytes=bytes(view[offset : offset + 16])) for offset in range(0, len(view), 16)]
+        return cls([_new_value(value_type, f"{head}{base62_str}") for base62_str in encoded], uuids)
+
+
+_PREFIX_PATTERN = re.compile(r"^[a-zA-Z0-9_]+$")
+_UUID_HEX_LENGTH = 32
+_UUID_BYTES_LENGTH = 16
+_UUID_CANONICAL_LENGTH = 36
 
-    def __len__(self) -> int:
-        return len(self.value)
+# per-prefix UUIDBase62 subclasses, shared by `con_uuidbase62` field types and the values `to_uuidbase62` returns
+_value_types: typing.Dict[typing.Optional[str], typing.Type[UUIDBase62]] = {None: UUIDBase62}
+
+
+def _compile_validator(prefix: str) -> typing.Callable[[typing.Type[UUIDBase62], typing.Any], UUIDBase62]:
+    """
+    Build a `validate` specialized for `prefix`: well-formed values are checked against a precomputed head and maximum
+    length, everything else (including all invalid values, for consistent errors) goes through `to_uuidbase62` and its
+    cache, if enabled
+    """
+    head = f"{prefix}_" if prefix else ""
+    head_length = len(head)
+    max_length = head_length + base62.BASE62_WIDTH
+    decode_int = base62._decode_int
+    encode_compact = base62._encode_compact
+    new_value = _new_value
+
+    def validate(cls: typing.Type[UUIDBase62], value: typing.Any) -> UUIDBase62:
+        # the fast path is cheaper than a cache lookup, so it's taken whether or not a cache is enabled
+        if instrumentation.active_sink is None:
+            value_type = type(value)
+            if value_type is str:
+                if len(value) <= max_length and value.startswith(head):
+                    try:
+                        decode_int(value[head_length:])
+                    except ValueError:
+                        pass
+                    else:
+                        return new_value(cls, value)
+            elif value_type is uuid.UUID:
+                return new_value(cls, f"{head}{encode_compact(value.int)}")
+        return to_uuidbase62(value, prefix)
+
+    return validate
+
+
+def _validate_to_int(value_type: typing.Type[UUIDBase62], value: typing.Any) -> typing.Tuple[UUIDBase62, int]:
+    """
+    `value_type.validate(value)`, along with the integer value of its UUID; well-formed prefixed base62 strings are
+    only decoded once, rather than once to validate them and again to read their `uuid`
+    """
+    if type(value) is str and instrumentation.active_sink is None:
+        prefix = value_type.prefix
+        head_length = len(prefix) + 1 if prefix else 0
+        if len(value) <= head_length + base62.BASE62_WIDTH and (not prefix or value.startswith(f"{prefix}_")):
+            try:
+                return _new_value(value_type, value), base62._decode_int(value[head_length:])
+            except ValueError:
+                pass
+    result = value_type.validate(value)
+    return result, base62._decode_int(result.base62_str)
+
+
+def _value_type(prefix: typing.Optional[str]) -> typing.Type[UUIDBase62]:
+    """
+    The UUIDBase62 subclass whose instances share the (interned) `prefix`, created once per prefix
+    """
+    try:
+        return _value_types[prefix]
+    except KeyError:
+        prefix = sys.intern(prefix)  # type: ignore
+        namespace = dict(
+            __slots__=(),
+            prefix=prefix,
+            validate=classmethod(_compile_validator(prefix)),  # type: ignore
+        )
+        return _value_types.setdefault(prefix, type("UUIDBase62Value", (UUIDBase62,), namespace))
 
 
 def con_uuidbase62(
     *,
     prefix: str = "",
 ):
-    results = re.search(r"^[a-zA-Z0-9_]+$", prefix)
+    results = _PREFIX_PATTERN.search(prefix)
     if not results:
         raise Base62MissingPrefix
 
-    namespace = dict(
-        prefix=prefix,
-    )
-    return type("UUIDBase62Value", (UUIDBase62,), namespace)
+    return _value_type(prefix)
+
 
+def to_uuidbase62(
+    value: typing.Union[str, uuid.UUID, UUIDBase62, base62.BytesLike], prefix: typing.Optional[str] = None
+) -> UUIDBase62:
+    if instrumentation.active_sink is not None:
+        return instrumentation.observe("to_uuidbase62", prefix, _to_uuidbase62_cached, value, prefix)
+    return _to_uuidbase62_cached(value, prefix)
 
-def to_uuidbase62(value: typing.Union[str, uuid.UUID, UUIDBase62], prefix: str = None) -> UUIDBase62:
+
+def _to_uuidbase62_cached(
+    value: typing.Union[str, uuid.UUID, UUIDBase62, base62.BytesLike], prefix: typing.Optional[str]
+) -> UUIDBase62:
     if isinstance(value, UUIDBase62):
         if prefix is not None and prefix != value.prefix:
             raise ValueError(
@@ -59,36 +251,107 @@ def to_uuidbase62(value: typing.Union[str, uuid.UUID, UUIDBase62], prefix: str =
             )
         return value
 
-    if not isinstance(value, uuid.UUID):
+    active_cache = cache.active_cache
+    if active_cache is not None and type(value) in (str, uuid.UUID):
+        key = (value, prefix)
+        result = active_cache.get(key)
+        if result is None:
+            result = _to_uuidbase62(value, prefix)
+            active_cache.put(key, result)
+        return result
+
+    return _to_uuidbase62(value, prefix)
+
+
+def _parse_uuid_str(value: str) -> typing.Optional[int]:
+    """
+    Integer value of a UUID string, or None when `value` isn't one; canonical and 32 character hex forms are parsed
+    directly, other forms accepted by `uuid.UUID` (braces, urn prefix) go through it
+    """
+    if len(value) == _UUID_CANONICAL_LENGTH:
+        hex_ = value.replace("-", "")
+    elif len(value) == _UUID_HEX_LENGTH:
+        hex_ = value
+    else:
         try:
-            value = uuid.UUID(value)
-        except:
-            pass
+            return uuid.UUID(value).int
+        except ValueError:
+            return None
+
+    if len(hex_) != _UUID_HEX_LENGTH:
+        return None
+    try:
+        return int(hex_, 16)
+    except ValueError:
+        return None
+
+
+def _from_int(num: int, prefix: typing.Optional[str]) -> UUIDBase62:
+    base62_str = base62._encode_compact(num)
+    return _new_value(_value_type(prefix), f"{prefix}_{base62_str}" if prefix else base62_str)
+
+
+def _parse_bytes(value: base62.BytesLike) -> typing.Tuple[typing.Optional[str], int]:
+    """
+    The prefix tag (if any) and integer value of a binary value, as produced by `UUIDBase62.to_bytes`; the value is
+    read in place, without copying
+    """
+    if len(value) == _UUID_BYTES_LENGTH:
+        return None, int.from_bytes(value, "big")
+
+    view = memoryview(value)
+    tag_length = view[0] if len(view) else 0
+    if len(view) != 1 + tag_length + _UUID_BYTES_LENGTH:
+        raise ValueError("Binary value must be 16 bytes, optionally preceded by a prefix tag")
+    try:
+        found_prefix = bytes(view[1 : 1 + tag_length]).decode("ascii")
+    except UnicodeDecodeError:
+        found_prefix = None
+    if found_prefix is None or (found_prefix and not _PREFIX_PATTERN.search(found_prefix)):
+        raise ValueError("Binary value contains an invalid prefix tag")
+    return found_prefix, int.from_bytes(view[1 + tag_length :], "big")
 
-    if isinstance(value, uuid.UUID):
-        base62_str = base62.encode(value)
-        uuid_ = value
-        if prefix:
-            prefixed_base62_id = f"{prefix}_{base62_str}"
-        else:
-            prefixed_base62_id = base62_str
-    elif isinstance(value, str):
-        prefixed_base62_id = value
-        parts = prefixed_base62_id.rsplit("_", 1)
-        if len(parts) == 2:
-            found_prefix, base62_str = parts
-        else:
-            found_prefix = ""
-            base62_str = parts[0]
 
+def _to_uuidbase62(
+    value: typing.Union[str, uuid.UUID, base62.BytesLike], prefix: typing.Optional[str]
+) -> UUIDBase62:
+    if isinstance(value, uuid.UUID):
+        return _from_int(value.int, prefix)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        found_prefix, bytes_int = _parse_bytes(value)
+        if found_prefix is None:
+            return _from_int(bytes_int, prefix)
         if prefix is not None and prefix != found_prefix:
             raise ValueError(
                 f"Field's expected '{prefix}' prefix does not match given prefix '{found_prefix}'"
             )
+        base62_str = base62._encode_compact(bytes_int)
+        return _new_value(_value_type(prefix), f"{found_prefix}_{base62_str}" if found_prefix else base62_str)
+    elif not isinstance(value, str):
+        raise ValueError("Value must be a UUID, a string or bytes")
 
-        try:
-            uuid_ = base62.decode(base62_str)
-        except ValueError:
-            raise ValueError("Value contains invalid characters")
+    # classify strings by shape rather than probing with `uuid.UUID()`: UUID strings never contain an underscore and
+    # are longer than any (non-prefixed) base62 value
+    if "_" not in value and len(value) > base62.BASE62_WIDTH:
+        num = _parse_uuid_str(value)
+        if num is not None:
+            return _from_int(num, prefix)
+
+    prefixed_base62_id = value
+    parts = prefixed_base62_id.rsplit("_", 1)
+    if len(parts) == 2:
+        found_prefix, base62_str = parts
+    else:
+        found_prefix = ""
+        base62_str = parts[0]
+
+    if prefix is not None and prefix != found_prefix:
+        raise ValueError(f"Field's expected '{prefix}' prefix does not match given prefix '{found_prefix}'")
+
+    # validate the encoded value; the UUID itself is only materialized when accessed
+    try:
+        base62._decode_int(base62_str)
+    except ValueError:
+        raise ValueError("Value contains invalid characters")
 
-    return UUIDBase62(value=prefixed_base62_id, prefix=prefix, base62_str=base62_str, uuid_=uuid_)
+    return _new_value(_value_type(prefix), prefixed_base62_id)